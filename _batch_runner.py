@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Batch test script runner for UNCtools.
+
+Runs several standalone test scripts in one Python process so interpreter
+startup and package imports are paid once rather than per script. Used by
+run_tests.py; run the scripts separately (run_tests.py --isolated) when a
+crash in one script must not affect the others.
+
+Reads a JSON list of {"script": ..., "log": ...} objects from stdin, runs each
+script as __main__ with its output redirected to its log file, and prints one
+"RESULT <script> <exit code>" line per script to stdout.
+"""
+
+import os
+import sys
+import json
+import runpy
+import logging
+import traceback
+
+def _reset_logging():
+    """Remove root logging handlers so each script's basicConfig takes effect."""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+def run_script(script_path, log_path):
+    """
+    Run a test script as __main__, writing its output to a log file.
+
+    Args:
+        script_path: The path to the script to run.
+        log_path: The path of the log file to write the script's output to.
+
+    Returns:
+        The script's exit code.
+    """
+    saved_argv, saved_path0 = sys.argv, sys.path[0]
+    saved_stdout, saved_stderr = sys.stdout, sys.stderr
+
+    with open(log_path, "w", encoding="utf-8", errors="replace") as log_file:
+        sys.stdout = sys.stderr = log_file
+        sys.argv = [script_path]
+        sys.path[0] = os.path.dirname(os.path.abspath(script_path))
+        _reset_logging()
+
+        try:
+            runpy.run_path(script_path, run_name="__main__")
+            exit_code = 0
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = 0
+            elif isinstance(e.code, int):
+                exit_code = e.code
+            else:
+                print(e.code)
+                exit_code = 1
+        except KeyboardInterrupt:
+            raise
+        except BaseException:
+            # Includes test-framework outcomes that bypass Exception
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            log_file.flush()
+            _reset_logging()
+            sys.stdout, sys.stderr = saved_stdout, saved_stderr
+            sys.argv = saved_argv
+            sys.path[0] = saved_path0
+
+    return exit_code
+
+def main():
+    """Main function."""
+    jobs = json.load(sys.stdin)
+
+    for job in jobs:
+        exit_code = run_script(job["script"], job["log"])
+        print(f"RESULT {job['script']} {exit_code}", flush=True)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
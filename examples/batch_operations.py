@@ -10,9 +10,12 @@ import os
 import sys
 import time
 import logging
+import functools
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Iterator
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
@@ -21,17 +24,103 @@ logging.basicConfig(level=logging.INFO,
 # Import UNCtools
 import unctools
 from unctools import (
-    convert_to_local, convert_to_unc, is_unc_path,
-    batch_convert, batch_copy, process_files,
+    convert_to_local_str, convert_to_unc_str, is_unc_path,
+    batch_convert_iter, batch_copy, iprocess_files,
     safe_open
 )
 
+# Worker threads for network-bound operations; SMB servers typically grant a
+# client 8-16 outstanding requests, so more threads than this only queue up
+MAX_WORKERS = 16
+
+# Number of files handed to each batch_copy call when copying in parallel
+COPY_CHUNK_SIZE = 64
+
+# Files the processing example lets run ahead of the results it has consumed
+MAX_PENDING = MAX_WORKERS * 4
+
+# Number of processed files whose details are shown as a sample
+SAMPLE_SIZE = 5
+
+# File suffixes whose first line is shown by the processing example
+TEXT_SUFFIXES = ('.txt', '.md', '.py', '.json', '.csv', '.ini', '.log')
+
+# Flags for raw reads: binary on Windows, close-on-exec where supported
+READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0)
+
+# Bytes read from the start of a text file to find its first line
+HEAD_SIZE = 4096
+
+def _read_head(fd: int, size: int) -> bytes:
+    """Read up to size bytes from the start of an open file descriptor."""
+    # pread reads at an explicit offset without moving the file position;
+    # Windows has no pread, but a freshly opened descriptor is at offset 0
+    if hasattr(os, 'pread'):
+        return os.pread(fd, size, 0)
+    return os.read(fd, size)
+
 def print_section(title):
     """Print a section header."""
     print("\n" + "=" * 80)
     print(f"  {title}")
     print("=" * 80)
 
+def _iter_matches(root: str, pattern: str, recursive: bool) -> Iterator[str]:
+    """
+    Yield the paths of files under root that match pattern.
+    
+    The files come from the same directory scan iprocess_files uses, which
+    matches name-only patterns while walking the tree with os.scandir and
+    falls back to glob for patterns containing a separator.
+    """
+    for file_path, _ in iprocess_files(root, os.fspath, pattern=pattern, recursive=recursive,
+                                       pass_entry=True):
+        yield file_path
+
+def _copy_chunks(files: List[str]) -> List[List[str]]:
+    """
+    Split files into chunks for parallel batch_copy calls.
+    
+    batch_copy copies every file to dest/<file name>, so files sharing a name
+    are kept in one chunk; they are then copied one after another, in order,
+    rather than to the same destination from different threads.
+    
+    Args:
+        files: The files to copy.
+        
+    Returns:
+        Chunks of about COPY_CHUNK_SIZE files.
+    """
+    by_name = {}
+    for file_path in files:
+        by_name.setdefault(os.path.normcase(os.path.basename(file_path)), []).append(file_path)
+    
+    chunks = [[]]
+    for same_name in by_name.values():
+        if len(chunks[-1]) >= COPY_CHUNK_SIZE:
+            chunks.append([])
+        chunks[-1].extend(same_name)
+    return chunks
+
+@functools.lru_cache(maxsize=4096)
+def _classify(dirname: str) -> Tuple[str, str]:
+    """
+    Convert a directory in both directions.
+    
+    Files in the same directory share the UNC/local prefix that decides how they
+    convert, so the lookups are done once per directory rather than per file.
+    
+    Args:
+        dirname: The directory to convert.
+        
+    Returns:
+        A tuple of (local_path, unc_path) for the directory.
+    """
+    return (
+        convert_to_local_str(dirname).rstrip('\\'),
+        convert_to_unc_str(dirname).rstrip('\\')
+    )
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -91,10 +180,7 @@ def demonstrate_path_conversion(source: str, pattern: str, recursive: bool, to_u
         return
     
     # Get all matching files
-    if recursive:
-        files = list(source_path.glob(f"**/{pattern}"))
-    else:
-        files = list(source_path.glob(pattern))
+    files = list(_iter_matches(source, pattern, recursive))
     
     if not files:
         print(f"No files found matching {pattern} in {source}")
@@ -102,29 +188,34 @@ def demonstrate_path_conversion(source: str, pattern: str, recursive: bool, to_u
     
     print(f"Found {len(files)} files matching {pattern} in {source}")
     
-    # Convert paths
+    # Convert paths, keeping only the counts and a few samples
     start_time = time.time()
-    converted = batch_convert([str(f) for f in files], to_unc=to_unc)
+    total_count = 0
+    unchanged_count = 0
+    samples = []
+    for original, converted_path in batch_convert_iter(files, to_unc=to_unc):
+        total_count += 1
+        unchanged_count += original == converted_path
+        if len(samples) < SAMPLE_SIZE:
+            samples.append((original, converted_path))
     end_time = time.time()
     
-    print(f"\nConverted {len(converted)} paths in {end_time - start_time:.2f} seconds")
+    print(f"\nConverted {total_count} paths in {end_time - start_time:.2f} seconds")
     print(f"Direction: {'Local -> UNC' if to_unc else 'UNC -> Local'}")
     
     # Display a sample of conversions
-    max_display = min(5, len(converted))
-    print(f"\nSample conversions (showing {max_display} of {len(converted)}):")
+    print(f"\nSample conversions (showing {len(samples)} of {total_count}):")
     
-    for i, (original, converted_path) in enumerate(list(converted.items())[:max_display]):
+    for i, (original, converted_path) in enumerate(samples):
         print(f"  {i+1}. {original}\n     -> {converted_path}")
     
     # Display conversion statistics
-    unchanged_count = sum(1 for orig, conv in converted.items() if orig == conv)
-    changed_count = len(converted) - unchanged_count
+    changed_count = total_count - unchanged_count
     
     print(f"\nConversion statistics:")
-    print(f"  Total paths: {len(converted)}")
-    print(f"  Changed paths: {changed_count} ({changed_count/len(converted)*100:.1f}%)")
-    print(f"  Unchanged paths: {unchanged_count} ({unchanged_count/len(converted)*100:.1f}%)")
+    print(f"  Total paths: {total_count}")
+    print(f"  Changed paths: {changed_count} ({changed_count/total_count*100:.1f}%)")
+    print(f"  Unchanged paths: {unchanged_count} ({unchanged_count/total_count*100:.1f}%)")
 
 def demonstrate_batch_copy(source: str, dest: str, pattern: str, recursive: bool):
     """
@@ -150,16 +241,11 @@ def demonstrate_batch_copy(source: str, dest: str, pattern: str, recursive: bool
         print(f"Error: {source} does not exist.")
         return
     
-    # Create destination directory if it doesn't exist
-    if not dest_path.exists():
-        print(f"Creating destination directory: {dest}")
-        dest_path.mkdir(parents=True, exist_ok=True)
+    # Create destination directory; exist_ok makes a separate existence check redundant
+    dest_path.mkdir(parents=True, exist_ok=True)
     
     # Get all matching files
-    if recursive:
-        files = list(source_path.glob(f"**/{pattern}"))
-    else:
-        files = list(source_path.glob(pattern))
+    files = list(_iter_matches(source, pattern, recursive))
     
     if not files:
         print(f"No files found matching {pattern} in {source}")
@@ -168,14 +254,20 @@ def demonstrate_batch_copy(source: str, dest: str, pattern: str, recursive: bool
     print(f"Found {len(files)} files matching {pattern} in {source}")
     print(f"Copying to {dest}...")
     
-    # Perform batch copy
+    # Perform batch copy, running one batch_copy per chunk of files in a thread
+    # pool so several network round-trips are in flight at once
     start_time = time.time()
-    results = batch_copy([str(f) for f in files], str(dest_path))
+    chunks = _copy_chunks(files)
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks))) as executor:
+        for chunk_results in executor.map(lambda chunk: batch_copy(chunk, dest), chunks):
+            results.update(chunk_results)
     end_time = time.time()
     
-    # Count successes and failures
-    successes = sum(1 for success, _ in results.values() if success)
-    failures = len(results) - successes
+    # Count successes and collect failures in one pass
+    failed_sources = [src for src, (success, _) in results.items() if not success]
+    failures = len(failed_sources)
+    successes = len(results) - failures
     
     print(f"\nCopied {successes} files in {end_time - start_time:.2f} seconds")
     print(f"  Success: {successes} files")
@@ -184,9 +276,8 @@ def demonstrate_batch_copy(source: str, dest: str, pattern: str, recursive: bool
     # Display failures if any
     if failures > 0:
         print("\nFailed copies:")
-        for src, (success, dst) in results.items():
-            if not success:
-                print(f"  {src} -> FAILED")
+        for src in failed_sources:
+            print(f"  {src} -> FAILED")
 
 def demonstrate_file_processing(source: str, pattern: str, recursive: bool):
     """
@@ -205,64 +296,110 @@ def demonstrate_file_processing(source: str, pattern: str, recursive: bool):
         print(f"Error: {source} does not exist.")
         return
     
+    # Every file found lives under source, so they all share its UNC-ness
+    source_is_unc = is_unc_path(source)
+    
     # Define a file processing function
-    def process_file(file_path: Path) -> Dict[str, Any]:
+    def process_file(entry: os.DirEntry) -> Dict[str, Any]:
         """
         Process a single file and return some information about it.
         
         Args:
-            file_path: The path to the file.
+            entry: The directory entry for the file, as produced by the scan.
             
         Returns:
             A dictionary with file information.
         """
-        stats = file_path.stat()
+        # DirEntry caches the stat result from the directory scan
+        stats = entry.stat()
+        file_path = os.fspath(entry)
         
         # Try to read the first line if it's a text file
         first_line = None
-        if file_path.suffix.lower() in ('.txt', '.md', '.py', '.json', '.csv', '.ini', '.log'):
+        if os.path.splitext(entry.name)[1].lower() in TEXT_SUFFIXES:
             try:
-                with safe_open(file_path, 'r', errors='ignore') as f:
-                    first_line = f.readline().strip()
-            except:
+                fd = os.open(file_path, READ_FLAGS)
+                try:
+                    head = _read_head(fd, HEAD_SIZE)
+                finally:
+                    os.close(fd)
+                newline = head.find(b'\n')
+                if newline >= 0:
+                    head = head[:newline]
+                first_line = head.decode('utf-8', 'ignore').strip()
+            except PermissionError:
+                # Let safe_open retry through the converted path
+                try:
+                    with safe_open(file_path, 'r', errors='ignore') as f:
+                        first_line = f.readline().strip()
+                except OSError:
+                    pass
+            except OSError:
                 pass
         
+        # Conversions are resolved per directory and the file name re-appended
+        local_dir, unc_dir = _classify(os.path.dirname(file_path))
+        
         return {
             'size': stats.st_size,
             'modified': stats.st_mtime,
-            'is_unc': is_unc_path(file_path),
+            'is_unc': source_is_unc,
             'first_line': first_line,
-            'local_path': str(convert_to_local(file_path)),
-            'unc_path': str(convert_to_unc(file_path))
+            'local_path': f"{local_dir}\\{entry.name}",
+            'unc_path': f"{unc_dir}\\{entry.name}"
         }
     
     # Process all files in the directory
     print(f"Processing files in {source} matching {pattern}...")
     
+    # Only the aggregates and a few samples are kept, so memory stays flat
+    # however many files the walk visits
+    file_count = 0
+    total_size = 0
+    unc_count = 0
+    samples = deque(maxlen=SAMPLE_SIZE)
+    
+    def consume(path: str, future) -> None:
+        nonlocal file_count, total_size, unc_count
+        try:
+            info = future.result()
+        except Exception as e:
+            logging.error(f"Error processing file {path}: {e}")
+            return
+        file_count += 1
+        total_size += info['size']
+        unc_count += info['is_unc']
+        samples.append((path, info))
+    
     start_time = time.time()
-    results = process_files(source, process_file, pattern=pattern, recursive=recursive)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # The scan hands each file to the pool and keeps walking; results are
+        # consumed as soon as the window of in-flight files fills up
+        pending = deque()
+        for path, future in iprocess_files(source, lambda entry: executor.submit(process_file, entry),
+                                           pattern=pattern, recursive=recursive, pass_entry=True):
+            pending.append((path, future))
+            if len(pending) >= MAX_PENDING:
+                consume(*pending.popleft())
+        while pending:
+            consume(*pending.popleft())
     end_time = time.time()
     
-    if not results:
+    if not file_count:
         print(f"No files found matching {pattern} in {source}")
         return
     
-    print(f"\nProcessed {len(results)} files in {end_time - start_time:.2f} seconds")
-    
-    # Calculate statistics
-    total_size = sum(info['size'] for info in results.values())
-    unc_count = sum(1 for info in results.values() if info['is_unc'])
+    print(f"\nProcessed {file_count} files in {end_time - start_time:.2f} seconds")
     
     print(f"\nFile statistics:")
     print(f"  Total size: {total_size:,} bytes ({total_size / 1024 / 1024:.2f} MB)")
-    print(f"  UNC paths: {unc_count} ({unc_count/len(results)*100:.1f}%)")
-    print(f"  Non-UNC paths: {len(results) - unc_count} ({(len(results) - unc_count)/len(results)*100:.1f}%)")
+    print(f"  UNC paths: {unc_count} ({unc_count/file_count*100:.1f}%)")
+    print(f"  Non-UNC paths: {file_count - unc_count} ({(file_count - unc_count)/file_count*100:.1f}%)")
     
-    # Show details for a few files
-    max_display = min(5, len(results))
-    print(f"\nSample file details (showing {max_display} of {len(results)}):")
+    # Show details for the last few files processed
+    print(f"\nSample file details (showing {len(samples)} of {file_count}):")
     
-    for i, (path, info) in enumerate(list(results.items())[:max_display]):
+    for i, (path, info) in enumerate(samples):
         print(f"  {i+1}. {path}")
         print(f"     Size: {info['size']:,} bytes")
         print(f"     Modified: {time.ctime(info['modified'])}")
@@ -276,9 +413,9 @@ def demonstrate_file_processing(source: str, pattern: str, recursive: bool):
             print(f"     First line: {first_line}")
         
         # Show path conversions
-        if info['local_path'] != str(path):
+        if info['local_path'] != path:
             print(f"     Local path: {info['local_path']}")
-        if info['unc_path'] != str(path):
+        if info['unc_path'] != path:
             print(f"     UNC path: {info['unc_path']}")
         print()
 
@@ -7,10 +7,12 @@ issues for UNC paths, which can help resolve permission and access problems.
 """
 
 import os
+import re
 import sys
+import mmap
 import logging
+import functools
 import argparse
-from pathlib import Path
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
@@ -28,6 +30,16 @@ if os.name != 'nt':
 # Import Windows-specific modules
 from unctools.windows import fix_security_zone, add_to_intranet_zone
 
+# Patterns for pulling server (and share) names out of UNC paths
+_UNC_SERVER_RE = re.compile(r"\\\\([^\\]+)\\")
+_UNC_FULL_RE_BYTES = re.compile(rb"\\\\([^\\]+)\\([^\\]+)")
+
+# Extensions of text files that may contain UNC paths
+_TEXT_EXTS = frozenset({"txt", "ini", "conf", "cfg", "bat", "cmd", "ps1"})
+
+# Flags for opening files to scan; O_BINARY only exists on Windows
+_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0)
+
 def print_section(title):
     """Print a section header."""
     print("\n" + "=" * 80)
@@ -41,8 +53,8 @@ def parse_arguments():
     )
     parser.add_argument(
         "path", 
-        nargs="?", 
-        help="UNC path or server name to check/fix"
+        nargs="*", 
+        help="UNC paths or server names to check/fix"
     )
     parser.add_argument(
         "--scan", 
@@ -54,6 +66,16 @@ def parse_arguments():
         action="store_true", 
         help="Automatically fix all security zone issues found during scan"
     )
+    parser.add_argument(
+        "--yes", "-y", 
+        action="store_true", 
+        help="Fix detected issues without prompting"
+    )
+    parser.add_argument(
+        "--dry-run", 
+        action="store_true", 
+        help="Report the servers that would be fixed without changing the registry"
+    )
     parser.add_argument(
         "--verbose", "-v", 
         action="store_true", 
@@ -61,25 +83,66 @@ def parse_arguments():
     )
     return parser.parse_args()
 
+@functools.lru_cache(maxsize=8192)
+def _normalize(path):
+    """Normalize a path string to backslash separators, caching the result."""
+    return path.replace('/', '\\')
+
 def extract_server_from_unc(path):
     """Extract the server name from a UNC path."""
+    path = _normalize(str(path))
     if not is_unc_path(path):
         return None
     
     # Use regex to extract server name
-    import re
-    match = re.match(r"\\\\([^\\]+)\\", str(path))
+    match = _UNC_SERVER_RE.match(path)
     if match:
         return match.group(1)
     
     return None
 
-def fix_single_path(path):
-    """Check and fix security zone issues for a single path."""
+def _confirm(prompt, assume_yes=False):
+    """Ask a yes/no question, answering yes without prompting if assume_yes is set."""
+    if assume_yes:
+        return True
+    return input(f"{prompt} (y/n): ").lower() == 'y'
+
+def apply_zone_fixes(pending, dry_run=False):
+    """
+    Apply the queued security zone fixes, one registry update per server.
+    
+    Args:
+        pending: Mapping of server name to the function that fixes it.
+        dry_run: If True, only report what would be changed.
+    """
+    if not pending:
+        return
+    
+    print_section("Applying security zone fixes")
+    for server in sorted(pending):
+        if dry_run:
+            print(f"  Would add {server} to the Local Intranet zone")
+        elif pending[server](server):
+            print(f"  ✓ Successfully added {server} to the Local Intranet zone")
+        else:
+            print(f"  ✗ Failed to add {server} to the Local Intranet zone")
+
+def fix_single_path(path, pending, assume_yes=False):
+    """
+    Check a single path for security zone issues and queue any fix.
+    
+    Fixes are not applied here but collected in pending, keyed by server name,
+    so a server referenced by several paths is only written to the registry once.
+    
+    Args:
+        path: UNC path or server name to check.
+        pending: Mapping of server name to fix function, updated in place.
+        assume_yes: If True, queue fixes without prompting.
+    """
     print_section(f"Checking path: {path}")
     
     # Check if it's a UNC path
-    if is_unc_path(path):
+    if is_unc_path(_normalize(path)):
         print(f"Path is a UNC path")
         server = extract_server_from_unc(path)
         
@@ -95,12 +158,10 @@ def fix_single_path(path):
                 
                 # Offer to fix if security zone issue is found
                 if any("security zone" in issue for issue in issues):
-                    choice = input("Would you like to fix the security zone issue? (y/n): ")
-                    if choice.lower() == 'y':
-                        if fix_security_zone(server):
-                            print(f"Successfully added {server} to the Local Intranet zone")
-                        else:
-                            print(f"Failed to add {server} to the Local Intranet zone")
+                    if server in pending:
+                        print(f"A fix for {server} is already queued")
+                    elif _confirm("Would you like to fix the security zone issue?", assume_yes):
+                        pending[server] = fix_security_zone
             else:
                 print("No issues detected.")
         else:
@@ -110,20 +171,20 @@ def fix_single_path(path):
         print(f"Not a UNC path, checking if it's a server name")
         
         # Try to add it to the Intranet zone directly
-        choice = input(f"Would you like to add '{path}' to the Local Intranet zone? (y/n): ")
-        if choice.lower() == 'y':
-            if add_to_intranet_zone(path):
-                print(f"Successfully added {path} to the Local Intranet zone")
-            else:
-                print(f"Failed to add {path} to the Local Intranet zone")
+        if path in pending:
+            print(f"A fix for {path} is already queued")
+        elif _confirm(f"Would you like to add '{path}' to the Local Intranet zone?", assume_yes):
+            pending[path] = add_to_intranet_zone
 
-def scan_directory(directory, fix_all=False):
+def scan_directory(directory, fix_all=False, dry_run=False):
     """Scan a directory for UNC paths with potential security issues."""
     print_section(f"Scanning directory: {directory}")
     
-    # Use pathlib to handle the directory
-    dir_path = Path(directory)
-    if not dir_path.exists() or not dir_path.is_dir():
+    # Opening the directory checks that it exists and is a directory in one call
+    try:
+        with os.scandir(directory):
+            pass
+    except OSError:
         print(f"Error: {directory} is not a valid directory")
         return
     
@@ -131,32 +192,38 @@ def scan_directory(directory, fix_all=False):
     unc_paths = []
     servers = set()
     
+    # Every directory walked lives under the scanned one, so they share its
+    # UNC-ness and server; classify it once instead of per directory
+    root_is_unc = is_unc_path(_normalize(directory))
+    if root_is_unc:
+        server = extract_server_from_unc(directory)
+        if server:
+            servers.add(server)
+    
     # Walk the directory
-    for root, dirs, files in os.walk(directory):
-        # Check if the root is a UNC path
-        if is_unc_path(root):
+    for root, _dirs, files in os.walk(directory):
+        if root_is_unc:
             unc_paths.append(root)
-            server = extract_server_from_unc(root)
-            if server:
-                servers.add(server)
         
         # Check filenames for UNC paths (e.g., in text files)
         for file in files:
-            if file.endswith((".txt", ".ini", ".conf", ".cfg", ".bat", ".cmd", ".ps1")):
+            _, dot, ext = file.rpartition('.')
+            if dot and ext.lower() in _TEXT_EXTS:
                 # These files might contain UNC paths
-                file_path = Path(root) / file
                 try:
-                    with open(file_path, 'r', errors='ignore') as f:
-                        content = f.read()
-                        
-                        # Look for UNC paths in the content
-                        import re
-                        for match in re.finditer(r'\\\\([^\\]+)\\([^\\]+)', content):
-                            unc_path = match.group(0)
-                            unc_paths.append(unc_path)
-                            server = match.group(1)
-                            servers.add(server)
-                except:
+                    fd = os.open(os.path.join(root, file), _READ_FLAGS)
+                    try:
+                        # mmap cannot map an empty file
+                        if os.fstat(fd).st_size == 0:
+                            continue
+                        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                            # Search the raw bytes; only matches get decoded
+                            for match in _UNC_FULL_RE_BYTES.finditer(mm):
+                                unc_paths.append(match.group(0).decode('ascii', 'replace'))
+                                servers.add(match.group(1).decode('ascii', 'replace'))
+                    finally:
+                        os.close(fd)
+                except (OSError, ValueError):
                     # Skip files that can't be read
                     pass
     
@@ -169,11 +236,7 @@ def scan_directory(directory, fix_all=False):
         
         if fix_all:
             print("\nAutomatically fixing security zones for all servers...")
-            for server in servers:
-                if fix_security_zone(server):
-                    print(f"  ✓ Successfully added {server} to the Local Intranet zone")
-                else:
-                    print(f"  ✗ Failed to add {server} to the Local Intranet zone")
+            apply_zone_fixes(dict.fromkeys(servers, fix_security_zone), dry_run)
         else:
             print("\nTo fix security zones for all servers, run with --fix-all")
 
@@ -190,9 +253,13 @@ def main():
     
     # Check which operation to perform
     if args.scan:
-        scan_directory(args.scan, args.fix_all)
+        scan_directory(args.scan, args.fix_all or args.yes, args.dry_run)
     elif args.path:
-        fix_single_path(args.path)
+        # Collect fixes across all paths, then apply each unique server once
+        pending = {}
+        for path in args.path:
+            fix_single_path(path, pending, args.yes)
+        apply_zone_fixes(pending, args.dry_run)
     else:
         print("Please provide a path to check, or use --scan to scan a directory.")
         print("For more information, run: python windows_zone_fix.py --help")
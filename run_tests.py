@@ -9,10 +9,17 @@ It provides a comprehensive overview of test results and helps identify any issu
 import os
 import sys
 import time
+import atexit
 import logging
+import logging.handlers
 import importlib
+import importlib.util
 import subprocess
 import re
+import json
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
@@ -21,6 +28,12 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("test_runner")
 
+# Make the package and tests importable when running from a checkout
+_SELF_DIR = Path(__file__).resolve().parent
+_TESTS_DIR = _SELF_DIR / "tests"
+if str(_SELF_DIR) not in sys.path:
+    sys.path.insert(0, str(_SELF_DIR))
+
 # Create logs directory if it doesn't exist
 LOGS_DIR = Path("logs")
 LOGS_DIR.mkdir(exist_ok=True)
@@ -29,11 +42,32 @@ LOGS_DIR.mkdir(exist_ok=True)
 LOG_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
 LOG_FILE = LOGS_DIR / f"test_run_{LOG_TIMESTAMP}.log"
 
-# Configure file logging
-file_handler = logging.FileHandler(LOG_FILE)
+# Configure file logging; records are buffered in memory and written in
+# batches, with errors flushed straight away so they are never lost
+file_handler = logging.FileHandler(LOG_FILE, delay=True)
 file_handler.setLevel(logging.DEBUG)
 file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-logger.addHandler(file_handler)
+mem_handler = logging.handlers.MemoryHandler(
+    capacity=1024, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+)
+logger.addHandler(mem_handler)
+atexit.register(mem_handler.flush)
+
+# Buffer size for the per-script output logs
+SCRIPT_LOG_BUFFER_SIZE = 1 << 16
+
+# Helper that runs several test scripts in one interpreter
+BATCH_RUNNER = str(_SELF_DIR / "_batch_runner.py")
+
+# Number of trailing log lines kept from a failed script's output
+LOG_TAIL_LINES = 200
+
+# Patterns used to patch test files and analyze their logs
+_IMPORT_RE = re.compile(r'import .*?\n\n', re.DOTALL)
+_CHECK_FUNCTION_RE = re.compile(r'def check\(condition, message\):.*?return False', re.DOTALL)
+_FIND_ACCESSIBLE_RE = re.compile(r'def test_find_accessible_path.*?\n}', re.DOTALL)
+_RUN_TESTS_RE = re.compile(r'def run_tests\(\):.*?suite\.add_test\(([^)]+)\)', re.DOTALL)
+_FAIL_RE = re.compile(r'FAIL \((.*?)\)')
 
 # Suppress specific warnings
 def suppress_warnings():
@@ -77,91 +111,45 @@ def print_section(title):
     print(section)
     logger.info(section)
 
-def fix_test_imports():
-    """Fix test imports to make tests work properly."""
-    print_section("Fixing test imports")
-    
-    # Add the parent directory to the system path for direct script execution
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    if current_dir not in sys.path:
-        sys.path.insert(0, current_dir)
+class _FileEditor:
+    """
+    Context manager that reads a file once and writes it back once if changed.
     
-    # Check if tests/__init__.py exists
-    init_file = os.path.join(current_dir, "tests", "__init__.py")
-    if not os.path.exists(init_file):
-        logger.info("Creating tests/__init__.py")
-        with open(init_file, 'w') as f:
-            f.write('# This file marks the directory as a Python package\n')
-    
-    # Update import statements in test files if needed
-    test_files = [
-        os.path.join(current_dir, "tests", "test_converter_v2.py"),
-        os.path.join(current_dir, "tests", "test_detector.py"),
-        os.path.join(current_dir, "tests", "test_operations.py"),
-        os.path.join(current_dir, "tests", "test_windows_imports.py"),
-        os.path.join(current_dir, "tests", "test_windows.py")
-    ]
+    Fixers edit ``content`` in memory; the file is only rewritten on exit when
+    the content differs from what was read, and not at all if an error occurs.
+    The rewrite goes to a temporary file that then replaces the original, so an
+    interrupted run never leaves a truncated test file behind.
+    """
     
-    for file_path in test_files:
-        if os.path.exists(file_path):
-            logger.info(f"Checking imports in {file_path}")
-            
-            # Read the file
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Check if we need to add the sys.path insert
-            if "import sys" in content and "sys.path.insert" not in content:
-                logger.info(f"Adding sys.path modification to {file_path}")
-                
-                # Find the import section
-                import_section_match = re.search(r'import .*?\n\n', content, re.DOTALL)
-                if import_section_match:
-                    import_section = import_section_match.group(0)
-                    
-                    # Add sys.path insert after the imports
-                    sys_path_insert = "\n# Add parent directory to path for imports\nsys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))\n\n"
-                    new_content = content.replace(import_section, import_section + sys_path_insert)
-                    
-                    # Write the file back
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(new_content)
-            
-            # Replace relative imports with absolute imports
-            if "from .test_framework import" in content:
-                logger.info(f"Replacing relative imports in {file_path}")
-                
-                # Replace the import
-                new_content = content.replace(
-                    "from .test_framework import",
-                    "from tests.test_framework import"
-                )
-                
-                # Write the file back
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+    def __init__(self, file_path):
+        self.path = Path(file_path)
+        self.content = None
+        self._original = None
+    
+    @property
+    def dirty(self):
+        """Whether the content has been changed since it was read."""
+        return self.content != self._original
+    
+    def __enter__(self):
+        self.content = self._original = self.path.read_bytes().decode('utf-8', 'ignore')
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and self.dirty:
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            try:
+                tmp_path.write_text(self.content, encoding='utf-8')
+                os.replace(tmp_path, self.path)
+            except OSError:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                raise
+        return False
 
-def fix_encoding_issues():
-    """Fix encoding issues in test files."""
-    print_section("Fixing encoding issues")
-    
-    # Fix basic_functionality_test.py
-    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                            "tests", "basic_functionality_test.py")
-    
-    if os.path.exists(file_path):
-        logger.info(f"Checking encoding issues in {file_path}")
-        
-        # Read the file
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # Check if it contains problematic characters
-        if "✓" in content or "✗" in content:
-            logger.info(f"Fixing Unicode characters in {file_path}")
-            
-            # Define a new check function
-            new_check_function = '''
+# Replacement for the check helper in basic_functionality_test.py, which
+# prints characters that not every console encoding can display
+_ASCII_CHECK_FUNCTION = '''
 def check(condition, message):
     """Check a condition and print the result."""
     if condition:
@@ -171,45 +159,9 @@ def check(condition, message):
         print(f"[FAIL] {message}")
         return False
 '''
-            
-            # Replace the check function definition
-            pattern = r'def check\(condition, message\):.*?return False'
-            new_content = re.sub(pattern, new_check_function.strip(), content, flags=re.DOTALL)
-            
-            # Update any ✓ character in the rest of the file
-            new_content = new_content.replace("✓", "[PASS]")
-            new_content = new_content.replace("✗", "[FAIL]")
-            
-            # Write the file back
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
 
-def fix_missing_functions():
-    """Fix missing functions in test files."""
-    print_section("Fixing missing functions")
-    
-    # Fix test_operations.py
-    operations_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                                 "tests", "test_operations.py")
-    
-    if os.path.exists(operations_file):
-        logger.info(f"Checking for missing functions in {operations_file}")
-        
-        # Read the file
-        with open(operations_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # Check if the test_replace_in_file function is missing
-        if "def test_replace_in_file" not in content:
-            logger.info(f"Adding test_replace_in_file function to {operations_file}")
-            
-            # Find the position to insert the function
-            match = re.search(r'def test_find_accessible_path.*?\n}', content, re.DOTALL)
-            if match:
-                insert_position = match.end()
-                
-                # Add the missing functions
-                missing_functions = '''
+# Tests added to test_operations.py if they are missing
+_MISSING_OPERATIONS_TESTS = '''
 
 def test_replace_in_file(env):
     """Test replace_in_file function."""
@@ -271,102 +223,276 @@ def test_batch_replace_in_files(env):
     assert_true(all(not success for success in results.values()), 
                "All replacements should fail for non-existent text")
 '''
-                
-                # Insert the functions
-                new_content = content[:insert_position] + missing_functions + content[insert_position:]
-                
-                # Write the file back
-                with open(operations_file, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+
+def _fix_imports(content, file_path):
+    """Add the sys.path setup and absolute test_framework imports to a test file."""
+    # Check if we need to add the sys.path insert
+    if "import sys" in content and "sys.path.insert" not in content:
+        logger.info(f"Adding sys.path modification to {file_path}")
         
-        # Check if the functions are not added to the test suite
-        if "test_replace_in_file" not in content or "test_batch_replace_in_files" not in content:
-            logger.info(f"Adding missing functions to test suite in {operations_file}")
+        # Find the import section
+        import_section_match = _IMPORT_RE.search(content)
+        if import_section_match:
+            import_section = import_section_match.group(0)
             
-            # Find the run_tests function
-            match = re.search(r'def run_tests\(\):.*?suite\.add_test\(([^)]+)\)', content, re.DOTALL)
-            if match:
-                # Find the last add_test call
-                last_add_test = match.group(0)
-                
-                # Add the missing test functions
-                if "test_replace_in_file" not in last_add_test:
-                    new_add_test = last_add_test + '\n    suite.add_test(test_replace_in_file)'
-                    new_content = content.replace(last_add_test, new_add_test)
-                    content = new_content
-                
-                if "test_batch_replace_in_files" not in content:
-                    match = re.search(r'def run_tests\(\):.*?suite\.add_test\(([^)]+)\)', content, re.DOTALL)
-                    if match:
-                        last_add_test = match.group(0)
-                        new_add_test = last_add_test + '\n    suite.add_test(test_batch_replace_in_files)'
-                        new_content = content.replace(last_add_test, new_add_test)
-                        
-                        # Write the file back
-                        with open(operations_file, 'w', encoding='utf-8') as f:
-                            f.write(new_content)
+            # Add sys.path insert after the imports
+            sys_path_insert = "\n# Add parent directory to path for imports\nsys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))\n\n"
+            content = content.replace(import_section, import_section + sys_path_insert)
+    
+    # Replace relative imports with absolute imports
+    if "from .test_framework import" in content:
+        logger.info(f"Replacing relative imports in {file_path}")
+        content = content.replace(
+            "from .test_framework import",
+            "from tests.test_framework import"
+        )
+    
+    return content
+
+def _fix_encoding(content, file_path):
+    """Replace non-ASCII check marks in a test file with plain text markers."""
+    # Check if it contains problematic characters
+    if "✓" in content or "✗" in content:
+        logger.info(f"Fixing Unicode characters in {file_path}")
+        
+        # Replace the check function definition
+        content = _CHECK_FUNCTION_RE.sub(_ASCII_CHECK_FUNCTION.strip(), content)
+        
+        # Update any ✓ character in the rest of the file
+        content = content.replace("✓", "[PASS]")
+        content = content.replace("✗", "[FAIL]")
+    
+    return content
+
+def _fix_missing_functions(content, file_path):
+    """Add the replace_in_file tests to test_operations.py and register them."""
+    # Check if the test_replace_in_file function is missing
+    if "def test_replace_in_file" not in content:
+        # Find the position to insert the function
+        match = _FIND_ACCESSIBLE_RE.search(content)
+        if match:
+            logger.info(f"Adding test_replace_in_file function to {file_path}")
+            insert_position = match.end()
+            content = content[:insert_position] + _MISSING_OPERATIONS_TESTS + content[insert_position:]
+    
+    # Register the functions with the test suite if they are not already,
+    # inserting all missing registrations after the first add_test call
+    missing = [name for name in ("test_replace_in_file", "test_batch_replace_in_files")
+               if f"suite.add_test({name})" not in content]
+    if missing:
+        match = _RUN_TESTS_RE.search(content)
+        if match:
+            logger.info(f"Adding {', '.join(missing)} to test suite in {file_path}")
+            insertion = ''.join(f'\n    suite.add_test({name})' for name in missing)
+            content = content[:match.end()] + insertion + content[match.end():]
+    
+    return content
+
+# Record of test files already fixed, keyed by path, so unchanged files can be
+# skipped on later runs; bump the version whenever the fixers change
+FIX_CACHE_FILE = LOGS_DIR / ".fix_cache.json"
+_FIX_CACHE_VERSION = 1
+
+# Fixers to apply to each test file, by file name
+_TEST_FILE_FIXERS = {
+    "basic_functionality_test.py": (_fix_encoding,),
+    "test_converter_v2.py": (_fix_imports,),
+    "test_detector.py": (_fix_imports,),
+    "test_operations.py": (_fix_imports, _fix_missing_functions),
+    "test_windows_imports.py": (_fix_imports,),
+    "test_windows.py": (_fix_imports,),
+}
+_FIXABLE_TEST_FILES = frozenset(_TEST_FILE_FIXERS)
+
+def _load_fix_cache():
+    """Load the fixed-file cache, returning an empty one if it is missing or stale."""
+    try:
+        with open(FIX_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != _FIX_CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+def _save_fix_cache(files):
+    """Save the fixed-file cache."""
+    try:
+        with open(FIX_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"version": _FIX_CACHE_VERSION, "files": files}, f)
+    except OSError as e:
+        logger.warning(f"Could not save fix cache {FIX_CACHE_FILE}: {e}")
+
+def _discover_test_files(tests_dir, names=_FIXABLE_TEST_FILES):
+    """
+    Find the given test files in the tests directory with a single scan.
+    
+    Args:
+        tests_dir: The tests directory.
+        names: The file names to look for.
+        
+    Returns:
+        A dictionary mapping the names found to their os.DirEntry objects.
+    """
+    try:
+        with os.scandir(tests_dir) as entries:
+            return {entry.name: entry for entry in entries
+                    if entry.name in names and entry.is_file()}
+    except OSError as e:
+        logger.warning(f"Could not list test files in {tests_dir}: {e}")
+        return {}
+
+def fix_tests():
+    """
+    Fix known issues in the test files so the tests run properly.
+    
+    Each test file is read once, every applicable fix is applied to the
+    in-memory content, and the file is written back once if anything changed.
+    Files whose size and modification time match the last run are skipped.
+    """
+    print_section("Fixing test files")
+    
+    # Check if tests/__init__.py exists
+    init_file = _TESTS_DIR / "__init__.py"
+    if not init_file.exists():
+        logger.info("Creating tests/__init__.py")
+        init_file.write_text('# This file marks the directory as a Python package\n')
+    
+    cache = _load_fix_cache()
+    cache_changed = False
+    test_files = _discover_test_files(_TESTS_DIR)
+    
+    for file_name, fixers in _TEST_FILE_FIXERS.items():
+        entry = test_files.get(file_name)
+        if entry is None:
+            continue
+        
+        file_path = entry.path
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        
+        # Skip files that have not changed since they were last fixed
+        if cache.get(file_path) == [st.st_mtime_ns, st.st_size]:
+            continue
+        
+        logger.info(f"Checking {file_path}")
+        with _FileEditor(file_path) as editor:
+            for fixer in fixers:
+                editor.content = fixer(editor.content, file_path)
+        
+        if editor.dirty:
+            st = os.stat(file_path)
+        cache[file_path] = [st.st_mtime_ns, st.st_size]
+        cache_changed = True
+    
+    if cache_changed:
+        _save_fix_cache(cache)
 
 def analyze_test_log(log_file, script_name):
     """
     Analyze a test log file to determine if the tests really passed.
     
+    The log is streamed line by line, keeping only the counters and the last
+    LOG_TAIL_LINES lines, so memory use does not grow with the log size.
+    
     Args:
         log_file: Path to the log file.
         script_name: Name of the test script.
         
     Returns:
-        True if all tests passed, False if any tests failed.
+        A tuple of (passed, tail) where passed is True if all tests passed and
+        tail is a list of the last lines of the log.
     """
+    tail = deque(maxlen=LOG_TAIL_LINES)
+    
     try:
-        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-            
-        # Check for explicit failure indicators
-        if "SOME TESTS FAILED!" in content:
-            logger.warning(f"Found explicit failure message in {script_name}")
-            return False
+        # Tally every indicator in a single pass over the log
+        explicit_failure = False
+        failed_count = 0
+        teardown_errors = 0
+        passed_count = 0
+        saw_success_message = False
+        failures = []
+        # Failure messages are only ever used for a warning, so skip collecting
+        # them when warnings would be discarded anyway
+        collect_failures = logger.isEnabledFor(logging.WARNING)
         
-        # Check for test failures
-        failed_count = content.count("FAIL ")
-        
-        # Check for teardown errors
-        teardown_errors = content.count("Teardown error")
+        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                tail.append(line)
+                
+                # Check for explicit failure indicators
+                if "SOME TESTS FAILED!" in line:
+                    explicit_failure = True
+                
+                # Check for test failures, keeping the specific failure messages
+                if "FAIL " in line:
+                    failed_count += line.count("FAIL ")
+                    if collect_failures:
+                        failures.extend(_FAIL_RE.findall(line))
+                
+                # Check for teardown errors
+                if "Teardown error" in line:
+                    teardown_errors += line.count("Teardown error")
+                
+                # Count passed tests - look for patterns in both output formats
+                if "PASS" in line:
+                    passed_count += line.count("PASS ") + line.count("[PASS]")
+                if "ALL TESTS PASSED" in line:
+                    passed_count += line.count("ALL TESTS PASSED")
+                    saw_success_message = True
+                elif "completed successfully" in line:
+                    saw_success_message = True
         
-        # Count passed tests - look for patterns in both output formats
-        pass_patterns = ["PASS ", "[PASS]", "ALL TESTS PASSED"]
-        passed_count = sum(content.count(pattern) for pattern in pass_patterns)
+        if explicit_failure:
+            logger.warning(f"Found explicit failure message in {script_name}")
+            return False, list(tail)
         
         # If we found failures or teardown errors, log them
         if failed_count > 0 or teardown_errors > 0:
             logger.warning(f"Found {failed_count} failures and {teardown_errors} teardown errors in {script_name}")
             
-            # Extract the specific failure messages
-            import re
-            failures = re.findall(r'FAIL \((.*?)\)', content)
             if failures:
-                logger.warning(f"Failure details in {script_name}:")
-                for failure in failures:
-                    logger.warning(f"  - {failure}")
+                logger.warning("Failure details in %s:\n%s", script_name,
+                               "\n".join(f"  - {failure}" for failure in failures))
             
-            return False
+            return False, list(tail)
         
         # Look for successful test summary phrases
-        if "ALL TESTS PASSED" in content or "completed successfully" in content:
-            return True
+        if saw_success_message:
+            return True, list(tail)
             
         # If we found no failures but also no passes, that's suspicious
         if passed_count == 0:
             logger.warning(f"No passes found in {script_name}, this may indicate a problem")
-            return False
+            return False, list(tail)
         
         # Otherwise, tests passed
-        return True
+        return True, list(tail)
         
     except Exception as e:
         logger.exception(f"Error analyzing log file {log_file}: {e}")
-        return False
+        return False, list(tail)
     
 
+# Test modules imported so far, by name
+_loaded_modules = {}
+
+def _import_test_module(module_name):
+    """
+    Import a test module once, reusing it on later calls.
+    
+    The shared test framework is imported first so every test module finds
+    it already loaded in sys.modules.
+    """
+    module = _loaded_modules.get(module_name)
+    if module is None:
+        importlib.import_module("tests.test_framework")
+        module = _loaded_modules[module_name] = importlib.import_module(module_name)
+    return module
+
 def run_module_test(module_name):
     """
     Run a test by importing the module.
@@ -380,11 +506,8 @@ def run_module_test(module_name):
     print_section(f"Running test module: {module_name}")
     
     try:
-        # Add current directory to sys.path to enable module imports
-        sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
-        
         # Import the module
-        module = importlib.import_module(module_name)
+        module = _import_test_module(module_name)
         
         # Check if the module has a run_tests function
         if hasattr(module, "run_tests"):
@@ -409,23 +532,66 @@ def run_module_test(module_name):
         logger.exception(f"Error running module test '{module_name}': {e}")
         return False
 
-def run_script_test(script_path):
+def _script_log_file(script_path, logs_dir=LOGS_DIR, timestamp=LOG_TIMESTAMP):
+    """Get the path of the output log for a test script."""
+    return Path(logs_dir) / f"{Path(script_path).stem}_{timestamp}.log"
+
+def _check_script_result(script_path, returncode, script_log_file):
+    """
+    Decide whether a test script passed from its exit code and output log.
+    
+    Args:
+        script_path: The path to the script that was run.
+        returncode: The script's exit code.
+        script_log_file: The log file holding the script's output.
+        
+    Returns:
+        True if the test passed, False otherwise.
+    """
+    # Check if the script ran without crashing
+    returncode_success = returncode == 0
+    
+    # Analyze the log file for test failures
+    log_success, log_tail = analyze_test_log(script_log_file, script_path)
+    
+    # Consider the test successful only if both checks pass
+    success = returncode_success and log_success
+    
+    if success:
+        logger.info(f"Script test '{script_path}' passed")
+    else:
+        if not returncode_success:
+            logger.error(f"Script test '{script_path}' failed with return code {returncode}")
+        else:
+            logger.error(f"Script test '{script_path}' failed based on log analysis")
+        
+        # Add the end of the script's output to our log
+        logger.error(f"Script output (last {len(log_tail)} lines):\n{''.join(log_tail)}")
+        
+    return success
+
+def run_script_test(script_path, logs_dir=LOGS_DIR, timestamp=LOG_TIMESTAMP):
     """
     Run a test by executing the script as a subprocess.
     
+    The script's output goes only to its own log file, so several scripts can
+    run at once without interleaving their output on the console.
+    
     Args:
         script_path: The path to the script to execute.
+        logs_dir: Directory to write the script's output log to.
+        timestamp: Timestamp used in the script's log file name.
         
     Returns:
         True if the test passed, False otherwise.
     """
-    print_section(f"Running test script: {script_path}")
+    logger.info(f"Running test script: {script_path}")
     
     try:
         # Run the script as a subprocess
-        script_log_file = LOGS_DIR / f"{Path(script_path).stem}_{LOG_TIMESTAMP}.log"
+        script_log_file = _script_log_file(script_path, logs_dir, timestamp)
         
-        with open(script_log_file, "w") as log_file:
+        with open(script_log_file, "w", buffering=SCRIPT_LOG_BUFFER_SIZE) as log_file:
             # Start the subprocess
             result = subprocess.run(
                 [sys.executable, script_path],
@@ -434,72 +600,145 @@ def run_script_test(script_path):
                 text=True
             )
         
-        # Check if the script ran without crashing
-        returncode_success = result.returncode == 0
-        
-        # Analyze the log file for test failures
-        log_success = analyze_test_log(script_log_file, script_path)
-        
-        # Consider the test successful only if both checks pass
-        success = returncode_success and log_success
-        
-        if success:
-            logger.info(f"Script test '{script_path}' passed")
-        else:
-            if not returncode_success:
-                logger.error(f"Script test '{script_path}' failed with return code {result.returncode}")
-            else:
-                logger.error(f"Script test '{script_path}' failed based on log analysis")
-            
-            # Read the log file and add it to our log
-            with open(script_log_file, "r", encoding='utf-8', errors='ignore') as log_file:
-                logger.error(f"Script output:\n{log_file.read()}")
-            
-        return success
+        return _check_script_result(script_path, result.returncode, script_log_file)
     except Exception as e:
         logger.exception(f"Error running script test '{script_path}': {e}")
         return False
 
-def install_package():
+def run_script_tests_batched(script_paths, logs_dir=LOGS_DIR, timestamp=LOG_TIMESTAMP):
     """
-    Install the UNCtools package in development mode.
+    Run several test scripts in a single Python subprocess.
     
+    The scripts share one interpreter (see _batch_runner.py), so startup and
+    package imports are paid once. Each script still gets its own output log.
+    
+    Args:
+        script_paths: The paths of the scripts to execute.
+        logs_dir: Directory to write the scripts' output logs to.
+        timestamp: Timestamp used in the scripts' log file names.
+        
     Returns:
-        True if installation succeeded, False otherwise.
+        A dictionary mapping each script path to True if it passed.
     """
-    print_section("Installing UNCtools package in development mode")
+    logger.info(f"Running {len(script_paths)} test scripts in one process")
+    
+    jobs = [{"script": script_path,
+             "log": str(_script_log_file(script_path, logs_dir, timestamp))}
+            for script_path in script_paths]
+    results = dict.fromkeys(script_paths, False)
     
     try:
-        # Run pip install in development mode
         result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-e", "."],
+            [sys.executable, BATCH_RUNNER],
+            input=json.dumps(jobs),
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True
         )
+    except Exception as e:
+        logger.exception(f"Error running batched script tests: {e}")
+        return results
+    
+    # Each finished script reports "RESULT <script> <exit code>"
+    returncodes = {}
+    for line in result.stdout.splitlines():
+        if line.startswith("RESULT "):
+            script_path, _, code = line[len("RESULT "):].rpartition(" ")
+            returncodes[script_path] = int(code)
+    
+    for job in jobs:
+        script_path = job["script"]
+        if script_path not in returncodes:
+            logger.error(f"Script test '{script_path}' did not report a result "
+                         f"(batch runner exited with {result.returncode}):\n{result.stdout}")
+            continue
+        results[script_path] = _check_script_result(script_path, returncodes[script_path], job["log"])
+    
+    return results
+
+def _installed_version(distribution):
+    """
+    Get the installed version of a distribution without invoking pip.
+    
+    Args:
+        distribution: The distribution name.
         
-        # Check if installation succeeded
-        success = result.returncode == 0
+    Returns:
+        The version string, or None if it is not installed or cannot be checked.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        # importlib.metadata needs Python 3.8+; let pip decide
+        return None
+    
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return None
+
+def _run_pip(*args):
+    """
+    Run pip, keeping only the tail of its output.
+    
+    pip's progress output can be large and is only of interest when it fails,
+    so it is streamed and all but the last LOG_TAIL_LINES lines are dropped.
+    
+    Args:
+        *args: Arguments to pass to pip.
         
-        if success:
-            logger.info("Package installation succeeded")
+    Returns:
+        A tuple of (return code, last lines of output as a string).
+    """
+    tail = deque(maxlen=LOG_TAIL_LINES)
+    with subprocess.Popen(
+        [sys.executable, "-m", "pip", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace"
+    ) as proc:
+        for line in proc.stdout:
+            tail.append(line)
+    return proc.returncode, "".join(tail)
+
+def install_package():
+    """
+    Install the UNCtools package in development mode.
+    
+    Returns:
+        True if installation succeeded, False otherwise.
+    """
+    print_section("Installing UNCtools package in development mode")
+    
+    try:
+        # Skip the base install if the package is already installed
+        version = _installed_version("unctools")
+        if version is not None:
+            logger.info(f"UNCtools {version} already installed")
+            success = True
+        else:
+            # Run pip install in development mode
+            returncode, output = _run_pip("install", "-e", ".")
+            
+            # Check if installation succeeded
+            success = returncode == 0
             
-            # Try to install windows extras if on Windows
-            if os.name == "nt":
+            if success:
+                logger.info("Package installation succeeded")
+            else:
+                logger.error(f"Package installation failed:\n{output}")
+        
+        if success:
+            # Try to install windows extras if on Windows and not already present
+            if os.name == "nt" and importlib.util.find_spec("win32net") is None:
                 logger.info("Installing Windows extras")
-                result = subprocess.run(
-                    [sys.executable, "-m", "pip", "install", "-e", ".[windows]"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True
-                )
+                returncode, output = _run_pip("install", "-e", ".[windows]")
                 
-                if result.returncode == 0:
+                if returncode == 0:
                     logger.info("Windows extras installation succeeded")
                 else:
-                    logger.error(f"Windows extras installation failed:\n{result.stdout}")
-        else:
-            logger.error(f"Package installation failed:\n{result.stdout}")
+                    logger.error(f"Windows extras installation failed:\n{output}")
             
         return success
     except Exception as e:
@@ -546,25 +785,28 @@ def check_imports():
         logger.exception(f"Error importing UNCtools: {e}")
         return False
 
-def run_all_tests():
+def run_all_tests(isolated=False):
     """
     Run all tests.
     
+    Args:
+        isolated: If True, always run each test script in its own process.
+        
     Returns:
         The number of failed tests.
     """
     print_section("STARTING UNCTOOLS TEST RUN")
-    logger.info(f"Python version: {sys.version}")
-    logger.info(f"Platform: {sys.platform}")
-    logger.info(f"Working directory: {os.getcwd()}")
+    logger.info(
+        f"Python version: {sys.version}\n"
+        f"Platform: {sys.platform}\n"
+        f"Working directory: {os.getcwd()}"
+    )
     
     # Suppress warnings
     suppress_warnings()
     
     # Fix test issues
-    fix_test_imports()
-    fix_encoding_issues()
-    fix_missing_functions()
+    fix_tests()
     
     # Track test results
     results = {
@@ -579,41 +821,56 @@ def run_all_tests():
     
     if not results["install"]:
         logger.error("Package installation failed, skipping remaining tests")
-        return sum(1 for r in results.values() if r is False or (isinstance(r, list) and False in r))
+        # Neither the installation nor the import check passed
+        return 2
     
     # Step 2: Test imports
     results["imports"] = check_imports()
     
     if not results["imports"]:
         logger.error("Import test failed, skipping remaining tests")
-        return sum(1 for r in results.values() if r is False or (isinstance(r, list) and False in r))
+        return 1
     
     # Step 3: Run module tests
     #for module_name in TEST_MODULES:
     #    success = run_module_test(module_name)
     #    results["module_tests"].append((module_name, success))
     
-    # Step 4: Run script tests
-    for script_path in TEST_SCRIPTS:
-        success = run_script_test(script_path)
-        results["script_tests"].append((script_path, success))
+    # Step 4: Run script tests. The scripts are independent and each writes
+    # its own log, so they run concurrently; the threads only wait on the
+    # child processes, which do the actual work. Without parallelism to gain,
+    # one shared interpreter runs them all unless isolation was requested
+    print_section(f"Running {len(TEST_SCRIPTS)} test scripts")
+    max_workers = min(len(TEST_SCRIPTS), os.cpu_count() or 1)
+    if max_workers == 1 and not isolated:
+        script_results = run_script_tests_batched(TEST_SCRIPTS)
+    else:
+        script_results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(run_script_test, script_path): script_path
+                       for script_path in TEST_SCRIPTS}
+            for future in as_completed(futures):
+                script_results[futures[future]] = future.result()
+    results["script_tests"] = [(script_path, script_results[script_path])
+                               for script_path in TEST_SCRIPTS]
     
     # Step 5: Generate test summary
     print_section("TEST RUN SUMMARY")
     
-    # Installation and import results
-    logger.info(f"Package installation: {'PASSED' if results['install'] else 'FAILED'}")
-    logger.info(f"Import tests: {'PASSED' if results['imports'] else 'FAILED'}")
-    
-    # Module test results
-    logger.info("\nModule test results:")
-    for module_name, success in results["module_tests"]:
-        logger.info(f"  {module_name}: {'PASSED' if success else 'FAILED'}")
-    
-    # Script test results
-    logger.info("\nScript test results:")
-    for script_path, success in results["script_tests"]:
-        logger.info(f"  {script_path}: {'PASSED' if success else 'FAILED'}")
+    # Build the whole results report and log it as a single record
+    lines = [
+        f"Package installation: {'PASSED' if results['install'] else 'FAILED'}",
+        f"Import tests: {'PASSED' if results['imports'] else 'FAILED'}",
+        "",
+        "Module test results:",
+    ]
+    lines.extend(f"  {module_name}: {'PASSED' if success else 'FAILED'}"
+                 for module_name, success in results["module_tests"])
+    lines.append("")
+    lines.append("Script test results:")
+    lines.extend(f"  {script_path}: {'PASSED' if success else 'FAILED'}"
+                 for script_path, success in results["script_tests"])
+    logger.info("\n".join(lines))
     
     # Calculate failed tests
     failed_tests = 0
@@ -640,10 +897,18 @@ def run_all_tests():
     return failed_tests
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the UNCtools tests")
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each test script in its own process, even on a single CPU"
+    )
+    args = parser.parse_args()
+    
     start_time = time.time()
     
     try:
-        failed_tests = run_all_tests()
+        failed_tests = run_all_tests(isolated=args.isolated)
         
         # Print execution time
         execution_time = time.time() - start_time
@@ -651,12 +916,15 @@ if __name__ == "__main__":
         logger.info(f"Test execution completed in {execution_time:.2f} seconds")
         
         # Exit with appropriate code
+        mem_handler.flush()
         sys.exit(1 if failed_tests > 0 else 0)
     except KeyboardInterrupt:
         print("\nTest execution interrupted by user")
         logger.warning("Test execution interrupted by user")
+        mem_handler.flush()
         sys.exit(130)
     except Exception as e:
         print(f"\nError running tests: {e}")
         logger.exception(f"Error running tests: {e}")
+        mem_handler.flush()
         sys.exit(1)
@@ -1,18 +1,13 @@
 #!/usr/bin/env python3
 
-from setuptools import setup, find_packages
 import os
-import sys
+import re
 from setuptools import setup, find_packages
 
 # Read the version from unctools/__init__.py
-with open('unctools/__init__.py', 'r') as f:
-    for line in f:
-        if line.startswith('__version__'):
-            version = line.split('=')[1].strip().strip("'\"")
-            break
-    else:
-        version = '0.1.1'
+with open('unctools/__init__.py', 'r', encoding='utf-8') as f:
+    version_match = re.search(r"^__version__\s*=\s*['\"]([^'\"]+)['\"]", f.read(), re.M)
+version = version_match.group(1) if version_match else '0.1.1'
 
 # Read long description from README.md
 if os.path.exists('README.md'):
@@ -23,14 +18,14 @@ else:
 
 setup(
     name='unctools',
-    version='0.1.0',
+    version=version,
     description='A comprehensive toolkit for handling UNC paths, network drives, and substituted drives',
     long_description=long_description,
     long_description_content_type='text/markdown',
     author='Dustin Darcy',
     author_email='dustindarcy@gmail.com',  # Replace with your email
     url='https://github.com/djdacy/unctools',  # Replace with your repo URL
-    packages=find_packages(),
+    packages=find_packages(exclude=('tests', 'tests.*', 'examples', 'examples.*', 'logs')),
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
@@ -4,7 +4,8 @@ Basic functionality test for UNCtools.
 
 This test script performs basic validation of UNCtools functionality.
 Run this script to verify that imports, basic functions, and core features
-work correctly in your environment.
+work correctly in your environment. Each check is a separate test, so it can
+also be run with pytest (pytest tests/basic_functionality_test.py).
 """
 
 import os
@@ -12,183 +13,155 @@ os.system("chcp 65001 > nul")  # Set console to UTF-8
 
 import sys
 import platform
+import tempfile
+import subprocess
 import logging
 from pathlib import Path
 
+import pytest
 
-import unctools
-print("UNCTools loaded from:", unctools.__file__)
-
-import sys
-print("Python version:", sys.version)
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
-# import tests
-# print("tests loaded from:", tests.__file__)
+from tests.test_framework import TestSuite, run_test_suites, skip_if_not_windows
 
+import unctools
+from unctools import (
+    convert_to_local, convert_to_unc, normalize_path,
+    is_unc_path, safe_open, batch_convert
+)
 
 # Set up logging
-logging.basicConfig(level=logging.INFO, 
+logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-def check(condition, message):
-    """Check a condition and print the result."""
-    if condition:
-        print(f"[PASS] {message}")
-        return True
-    else:
-        print(f"[FAIL] {message}")
-        return False
+# Paths used by the detection and conversion checks
+TEST_PATH = str(Path.home())
+TEST_UNC_PATH = r"\\server\share\folder"
+
+def report_environment():
+    """Print the platform, Python and UNCtools versions under test."""
+    print(f"Platform: {platform.system()} {platform.release()}")
+    print(f"Python: {platform.python_version()} ({sys.version})")
+    print(f"UNCtools: {unctools.__version__} loaded from {unctools.__file__}")
+
+@pytest.fixture(scope="session", autouse=True)
+def environment_report():
+    """Report the environment once per test session."""
+    report_environment()
+
+def test_version():
+    """Test that the package reports its version."""
+    assert unctools.__version__ is not None
+
+def test_import_does_not_load_windows():
+    """Test that importing the package does not load the Windows modules."""
+    # Check in a fresh interpreter, as other code in this process may have
+    # loaded them
+    package_root = os.path.dirname(os.path.dirname(unctools.__file__))
+    probe = subprocess.run(
+        [sys.executable, "-c", "import sys, unctools; print('unctools.windows' in sys.modules)"],
+        capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=package_root)
+    )
+    assert probe.stdout.strip() == "False", probe.stderr
+
+def test_lazy_names_listed():
+    """Test that the names imported on first access are listed by the package."""
+    for name in ('fix_security_zone', 'add_to_intranet_zone', 'utils', 'windows'):
+        assert name in dir(unctools), f"{name} should be listed by dir(unctools)"
+    for name in ('fix_security_zone', 'add_to_intranet_zone'):
+        assert name in unctools.__all__, f"{name} should be in unctools.__all__"
+
+def test_utils_imports():
+    """Test that the utils functions can be imported."""
+    from unctools.utils import (
+        configure_logging, get_logger,
+        is_windows, is_linux, is_macos,
+        validate_path, validate_unc_path
+    )
+
+@skip_if_not_windows
+def test_windows_imports():
+    """Test that the Windows-specific functions can be imported."""
+    from unctools.windows import (
+        fix_security_zone, add_to_intranet_zone,
+        create_network_mapping, remove_network_mapping,
+        get_file_security, check_access_rights
+    )
+
+def test_is_unc_path():
+    """Test UNC path detection."""
+    assert not is_unc_path(TEST_PATH), f"is_unc_path({TEST_PATH}) should be False"
+    assert is_unc_path(TEST_UNC_PATH), f"is_unc_path({TEST_UNC_PATH}) should be True"
+
+def test_normalize_path():
+    """Test that path normalization does not error."""
+    print(f"normalize_path({TEST_PATH}) => {normalize_path(TEST_PATH)}")
+
+def test_convert_paths():
+    """Test that path conversion does not error."""
+    print(f"convert_to_local({TEST_UNC_PATH}) => {convert_to_local(TEST_UNC_PATH)}")
+    print(f"convert_to_unc({TEST_PATH}) => {convert_to_unc(TEST_PATH)}")
+
+def test_batch_convert():
+    """Test batch conversion."""
+    result = batch_convert([TEST_PATH, TEST_UNC_PATH], to_unc=True)
+    assert len(result) == 2, f"batch_convert() returned {len(result)} results"
+    
+    # Test batch conversion of a larger batch
+    batch = [f"{TEST_UNC_PATH}\\file_{i}.txt" for i in range(1000)]
+    result = batch_convert(batch)
+    assert len(result) == len(batch), f"batch_convert() converted {len(result)} of {len(batch)} paths"
+
+def test_platform_info():
+    """Test platform detection."""
+    from unctools.utils import get_platform_info
+    platform_info = get_platform_info()
+    print("Platform information: " + ", ".join(f"{k}: {v}" for k, v in platform_info.items()))
+
+def test_file_operations(tmp_path):
+    """Test file operations with a temporary file."""
+    temp_file = tmp_path / "uncfile.txt"
+    temp_file.write_text("UNCtools test file")
+    
+    with safe_open(temp_file, 'r') as f:
+        content = f.read()
+    assert content == "UNCtools test file", f"safe_open() read content: '{content}'"
+
+def _in_temp_dir(test_fn):
+    """Wrap a test taking tmp_path to run in a temporary directory of its own."""
+    def run():
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_fn(Path(temp_dir))
+    return run
 
 def run_tests():
     """Run basic functionality tests."""
     print("\n=== UNCtools Basic Functionality Tests ===\n")
-    
-    # Step 1: Import the package
-    print("Testing imports...")
-    try:
-        import unctools
-        check(True, "Import unctools")
-    except ImportError as e:
-        check(False, f"Import unctools: {e}")
-        print("\nFailed to import UNCtools package. Ensure it's installed or available in your Python path.")
-        return False
-    
-    # Step 2: Check version information
-    print("\nChecking version information...")
-    version = unctools.__version__
-    check(version is not None, f"UNCtools version: {version}")
-    
-    # Step 3: Test core imports
-    print("\nTesting core module imports...")
-    try:
-        from unctools import (
-            convert_to_local, convert_to_unc, normalize_path,
-            is_unc_path, is_network_drive, is_subst_drive,
-            safe_open, batch_convert
-        )
-        check(True, "Import core functions")
-    except ImportError as e:
-        check(False, f"Import core functions: {e}")
-        print("\nFailed to import core UNCtools functions. Package may be incomplete.")
-        return False
-    
-    # Step 4: Test utils imports
-    print("\nTesting utils module imports...")
-    try:
-        from unctools.utils import (
-            configure_logging, get_logger,
-            is_windows, is_linux, is_macos,
-            validate_path, validate_unc_path
-        )
-        check(True, "Import utils functions")
-    except ImportError as e:
-        check(False, f"Import utils functions: {e}")
-        print("\nFailed to import UNCtools utility functions. Some features may be unavailable.")
-    
-    # Step 5: Test Windows-specific imports (if on Windows)
-    if os.name == 'nt':
-        print("\nTesting Windows-specific module imports...")
-        try:
-            from unctools.windows import (
-                fix_security_zone, add_to_intranet_zone,
-                create_network_mapping, remove_network_mapping,
-                get_file_security, check_access_rights
-            )
-            check(True, "Import Windows-specific functions")
-        except ImportError as e:
-            check(False, f"Import Windows-specific functions: {e}")
-            print("\nFailed to import Windows-specific functions. Some features may be unavailable.")
-    else:
-        print("\nSkipping Windows-specific tests on non-Windows platform.")
-    
-    # Step 6: Test basic functionality
-    print("\nTesting basic functionality...")
-    
-    # Test path detection
-    test_path = str(Path.home())
-    check(not is_unc_path(test_path), f"is_unc_path({test_path}) should be False")
-    
-    test_unc_path = r"\\server\share\folder"
-    check(is_unc_path(test_unc_path), f"is_unc_path({test_unc_path}) should be True")
-    
-    # Test path normalization
-    try:
-        normalized = normalize_path(test_path)
-        check(True, f"normalize_path({test_path}) => {normalized}")
-    except Exception as e:
-        check(False, f"normalize_path({test_path}): {e}")
-    
-    # Test path conversion (just ensure it doesn't error)
-    try:
-        local_path = convert_to_local(test_unc_path)
-        check(True, f"convert_to_local({test_unc_path}) => {local_path}")
-    except Exception as e:
-        check(False, f"convert_to_local({test_unc_path}): {e}")
-    
-    try:
-        unc_path = convert_to_unc(test_path)
-        check(True, f"convert_to_unc({test_path}) => {unc_path}")
-    except Exception as e:
-        check(False, f"convert_to_unc({test_path}): {e}")
-    
-    # Test batch conversion
-    try:
-        result = batch_convert([test_path, test_unc_path], to_unc=True)
-        check(len(result) == 2, f"batch_convert() returned {len(result)} results")
-    except Exception as e:
-        check(False, f"batch_convert(): {e}")
-    
-    # Test platform detection
-    from unctools.utils import get_platform_info
-    try:
-        platform_info = get_platform_info()
-        platform_str = ", ".join(f"{k}: {v}" for k, v in platform_info.items())
-        check(True, f"Platform information: {platform_str}")
-    except Exception as e:
-        check(False, f"get_platform_info(): {e}")
-    
-    # Step 7: Test file operations with a temporary file
-    print("\nTesting file operations with a temporary file...")
-    import tempfile
-    
-    try:
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            temp_filename = f.name
-            f.write("UNCtools test file")
-        
-        # Test safe_open
-        with safe_open(temp_filename, 'r') as f:
-            content = f.read()
-            check(content == "UNCtools test file", f"safe_open() and read content: '{content}'")
-        
-        # Clean up
-        os.unlink(temp_filename)
-        check(True, "Temporary file operations completed")
-    except Exception as e:
-        check(False, f"File operations: {e}")
-    
-    # All tests completed
-    print("\n=== Test Summary ===")
-    print(f"Platform: {platform.system()} {platform.release()}")
-    print(f"Python: {platform.python_version()}")
-    print(f"UNCtools: {version}")
-    print("All tests completed. Check the results above for any failures.")
-    
-    return True
+    report_environment()
+    
+    suite = TestSuite("UNCtools Basic Functionality Tests")
+    suite.add_test(test_version)
+    suite.add_test(test_import_does_not_load_windows)
+    suite.add_test(test_lazy_names_listed)
+    suite.add_test(test_utils_imports)
+    suite.add_test(test_windows_imports)
+    suite.add_test(test_is_unc_path)
+    suite.add_test(test_normalize_path)
+    suite.add_test(test_convert_paths)
+    suite.add_test(test_batch_convert)
+    suite.add_test(test_platform_info)
+    suite.add_test(_in_temp_dir(test_file_operations), "test_file_operations")
+    
+    return run_test_suites([suite])
 
 def main():
     """Main function."""
-    try:
-        success = run_tests()
-        if success:
-            print("\nBasic functionality tests completed successfully.")
-        else:
-            print("\nSome basic functionality tests failed.")
-            sys.exit(1)
-    except Exception as e:
-        print(f"\nError running tests: {e}")
+    if run_tests() == 0:
+        print("\nBasic functionality tests completed successfully.")
+    else:
+        print("\nSome basic functionality tests failed.")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
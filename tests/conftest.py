@@ -7,29 +7,43 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
 
+@pytest.fixture(scope="module")
+def shared_env():
+    """
+    Pytest fixture providing a test environment shared by a module's tests.
+
+    Yields a TestEnvironment instance with setup already called, and cleans
+    it up once the module's tests have run.
+    """
+    from tests.test_operations import TestEnvironment
+
+    environment = TestEnvironment()
+    environment.setup()
+
+    yield environment
+
+    environment.teardown()
+
+
 @pytest.fixture
-def env():
+def env(shared_env):
     """
     Pytest fixture providing a test environment with temporary files.
 
-    Yields a TestEnvironment instance with setup already called.
-    Automatically cleans up after test completion.
+    Yields the module's shared TestEnvironment instance and resets its
+    output and working directories after the test.
 
     The environment provides:
     - temp_dir: Temporary directory path
     - test_files: List of test file paths
-    - test_dirs: List of test directory paths
+    - output_dir: Directory for files a test copies or writes
+    - work_dir: Directory for files a test creates or modifies
 
     Example:
         def test_something(env):
             test_file = env.test_files[0]
             # Use test_file in your test
     """
-    from tests.test_operations import TestEnvironment
-
-    environment = TestEnvironment()
-    environment.setup()
+    yield shared_env
 
-    yield environment
-
-    environment.teardown()
+    shared_env.reset()
@@ -6,12 +6,13 @@ Tests for the unctools.converter module.
 import os
 import re
 import pytest
-from pathlib import Path
+from pathlib import Path, PureWindowsPath
+from types import MappingProxyType
 from unittest import mock
 
 from unctools.converter import (
     UNCConverter, convert_to_local, convert_to_unc, normalize_path,
-    parse_unc_path, join_unc_path
+    normalize_path_cached, parse_unc_path, join_unc_path, invalidate_mappings
 )
 
 # Test UNC paths
@@ -21,33 +22,41 @@ TEST_SERVER = "server"
 TEST_SHARE = "share"
 TEST_REL_PATH = "folder\\file.txt"
 
-# Sample network mappings for testing
-MOCK_MAPPINGS = {
+# Path forms of the test paths, built once for the assertions
+TEST_UNC_PATH_OBJ = Path(TEST_UNC_PATH)
+TEST_LOCAL_PATH_OBJ = Path(TEST_LOCAL_PATH)
+
+# Sample network mappings for testing, read-only so they can be shared
+MOCK_MAPPINGS = MappingProxyType({
     "\\\\server\\share": "Z:\\",
     "\\\\fileserver\\public": "Y:\\",
     "\\\\nas\\backup": "X:\\"
-}
+})
 
-MOCK_REVERSE_MAPPINGS = {
+MOCK_REVERSE_MAPPINGS = MappingProxyType({
     "Z:": "\\\\server\\share",
     "Y:": "\\\\fileserver\\public",
     "X:": "\\\\nas\\backup"
-}
+})
+
+def create_mock_converter():
+    """Create a UNCConverter with mock mappings."""
+    # Create converter with refresh_on_init=False to avoid actual system calls
+    converter = UNCConverter(refresh_on_init=False)
+    
+    # Set up mock mappings; the tests only read them, so no copy is needed
+    converter._mapping = MOCK_MAPPINGS
+    converter._reverse_mapping = MOCK_REVERSE_MAPPINGS
+    
+    return converter
 
 class TestUNCConverter:
     """Tests for the UNCConverter class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def converter(self):
-        """Create a UNCConverter with mock mappings."""
-        # Create converter with refresh_on_init=False to avoid actual system calls
-        converter = UNCConverter(refresh_on_init=False)
-        
-        # Set up mock mappings
-        converter._mapping = MOCK_MAPPINGS.copy()
-        converter._reverse_mapping = MOCK_REVERSE_MAPPINGS.copy()
-        
-        return converter
+        """Create a UNCConverter with mock mappings, shared by the module's tests."""
+        return create_mock_converter()
     
     def test_constructor(self):
         """Test constructor behavior."""
@@ -55,6 +64,7 @@ class TestUNCConverter:
         with mock.patch.object(UNCConverter, 'refresh_mappings') as mock_refresh:
             converter = UNCConverter(refresh_on_init=False)
             mock_refresh.assert_not_called()
+            assert converter.get_mappings() == {}
         
         # Test with refresh_on_init=True (default)
         with mock.patch.object(UNCConverter, 'refresh_mappings') as mock_refresh:
@@ -83,7 +93,7 @@ class TestUNCConverter:
         """Test convert_to_local method."""
         # Test conversion of a UNC path
         result = converter.convert_to_local(TEST_UNC_PATH)
-        assert result == Path(TEST_LOCAL_PATH)
+        assert result == TEST_LOCAL_PATH_OBJ
         
         # Test with a path that doesn't match any mapping
         unmapped_path = "\\\\unknown\\share\\file.txt"
@@ -98,14 +108,58 @@ class TestUNCConverter:
         # Test with different path formats
         unc_with_slashes = "//server/share/folder/file.txt"
         result = converter.convert_to_local(unc_with_slashes)
-        assert result == Path(TEST_LOCAL_PATH)
+        assert result == TEST_LOCAL_PATH_OBJ
+        
+        # Test that matching ignores case
+        result = converter.convert_to_local("\\\\SERVER\\Share\\folder\\file.txt")
+        assert result == TEST_LOCAL_PATH_OBJ
+        
+        # Test that a share whose name merely starts with a mapped share is not converted
+        similar_path = "\\\\server\\share2\\file.txt"
+        result = converter.convert_to_local(similar_path)
+        assert result == Path(similar_path)
+    
+    def test_convert_to_str(self, converter):
+        """Test convert_to_local_str and convert_to_unc_str methods."""
+        # Test that the string forms return the same paths as strings
+        result = converter.convert_to_local_str("//server/share/folder/file.txt")
+        assert result == TEST_LOCAL_PATH
+        
+        result = converter.convert_to_unc_str("z:/folder/file.txt")
+        assert result == TEST_UNC_PATH
+        
+        # Test with paths that don't match any mapping
+        assert converter.convert_to_local_str("\\\\unknown\\share") == "\\\\unknown\\share"
+        assert converter.convert_to_unc_str("C:\\folder") == "C:\\folder"
+    
+    def test_convert_to_str_normalizes(self, converter):
+        """Test that the string forms normalize paths as the Path forms do on Windows."""
+        paths = [
+            "C:\\data\\",
+            "C:\\data\\.\\x",
+            "\\\\srv\\share\\a\\\\b\\",
+            "\\\\srv\\share",
+            "\\\\server\\share\\folder\\.\\file.txt\\",
+            "z:\\folder\\\\file.txt\\",
+        ]
+        with mock.patch('unctools.converter.IS_WINDOWS', True):
+            for path in paths:
+                local = converter.convert_to_local_str(path)
+                unc = converter.convert_to_unc_str(path)
+                assert local == str(PureWindowsPath(local)), local
+                assert unc == str(PureWindowsPath(unc)), unc
+            
+            assert converter.convert_to_local_str("C:\\data\\") == "C:\\data"
+            assert converter.convert_to_local_str("C:\\data\\.\\x") == "C:\\data\\x"
+            assert converter.convert_to_local_str("//server/share/folder/./file.txt/") == TEST_LOCAL_PATH
+            assert converter.convert_to_unc_str("z:\\folder\\\\file.txt\\") == TEST_UNC_PATH
     
     @pytest.mark.skipif(os.name != 'nt', reason="Windows-specific test - UNC paths and drive letters are Windows concepts")
     def test_convert_to_unc(self, converter):
         """Test convert_to_unc method."""
         # Test conversion of a local path
         result = converter.convert_to_unc(TEST_LOCAL_PATH)
-        assert result == Path(TEST_UNC_PATH)
+        assert result == TEST_UNC_PATH_OBJ
         
         # Test with a path that doesn't match any mapping
         unmapped_path = "C:\\folder\\file.txt"
@@ -114,47 +168,54 @@ class TestUNCConverter:
         
         # Test with a UNC path (should return unchanged)
         result = converter.convert_to_unc(TEST_UNC_PATH)
-        assert result == Path(TEST_UNC_PATH)
+        assert result == TEST_UNC_PATH_OBJ
         
         # Test with drive letter variations
         result = converter.convert_to_unc("z:/folder/file.txt")
-        assert result == Path(TEST_UNC_PATH)
+        assert result == TEST_UNC_PATH_OBJ
         
         # Test with drive letter only
         result = converter.convert_to_unc("Z:")
         assert result == Path("\\\\server\\share")
     
-    @pytest.mark.skipif(os.name != 'nt', reason="Windows-specific test")
-    @pytest.mark.xfail(reason="Test design issue: Mock win32net returns empty dict. Needs proper mock setup for win32net.NetUseEnum")
     def test_refresh_mappings_windows(self):
         """Test refresh_mappings method on Windows."""
-        # This test should only run on Windows
-        # Create converter with real system calls
-        with mock.patch('subprocess.run') as mock_run:
-            # Mock the output of 'net use'
-            mock_process = mock.MagicMock()
-            mock_process.returncode = 0
-            mock_process.stdout = (
-                "New connections will be remembered.\n"
-                "\n"
-                "Status       Local     Remote                    Network\n"
-                "\n"
-                "-------------------------------------------------------------------------------\n"
-                "OK           Z:        \\\\server\\share            Microsoft Windows Network\n"
-                "OK           Y:        \\\\fileserver\\public       Microsoft Windows Network\n"
-            )
-            mock_run.return_value = mock_process
-            
-            # Create converter and refresh mappings
+        # Mock win32wnet enumerating two connected drives, then running out
+        mock_wnet = mock.MagicMock()
+        mock_wnet.WNetEnumResource.side_effect = [
+            [
+                mock.Mock(lpLocalName="Z:", lpRemoteName="\\\\server\\share"),
+                mock.Mock(lpLocalName="y:", lpRemoteName="\\\\FileServer\\Public\\"),
+                mock.Mock(lpLocalName=None, lpRemoteName="\\\\server\\ipc$"),
+            ],
+            [],
+        ]
+        
+        with mock.patch.dict('sys.modules', {'win32wnet': mock_wnet}), \
+             mock.patch('unctools.converter.HAVE_WIN32WNET', True):
+            # Create converter and refresh mappings as if on Windows
             converter = UNCConverter(refresh_on_init=False)
+            converter._is_windows = True
             converter.refresh_mappings()
             
             # Check the mappings
             mappings = converter.get_mappings()
-            assert "\\\\server\\share" in mappings
-            assert "\\\\fileserver\\public" in mappings
-            assert mappings["\\\\server\\share"] == "Z:\\"
-            assert mappings["\\\\fileserver\\public"] == "Y:\\"
+            assert mappings == {
+                "\\\\server\\share": "Z:\\",
+                "\\\\fileserver\\public": "Y:\\"
+            }
+            assert converter.get_reverse_mappings()["Y:"] == "\\\\fileserver\\public"
+            mock_wnet.WNetCloseEnum.assert_called_once()
+            
+            # A second refresh within the TTL reuses the mappings
+            converter.refresh_mappings()
+            assert mock_wnet.WNetOpenEnum.call_count == 1
+            
+            # Forcing a refresh queries the system again
+            mock_wnet.WNetEnumResource.side_effect = [[], []]
+            converter.refresh_mappings(force=True)
+            assert mock_wnet.WNetOpenEnum.call_count == 2
+            assert converter.get_mappings() == {}
 
 
 class TestModuleFunctions:
@@ -164,39 +225,72 @@ class TestModuleFunctions:
         """Test convert_to_local function."""
         # Mock the global converter
         with mock.patch('unctools.converter._global_converter') as mock_converter:
-            mock_converter.convert_to_local.return_value = Path(TEST_LOCAL_PATH)
+            mock_converter.convert_to_local.return_value = TEST_LOCAL_PATH_OBJ
             
             result = convert_to_local(TEST_UNC_PATH)
-            assert result == Path(TEST_LOCAL_PATH)
+            assert result == TEST_LOCAL_PATH_OBJ
             mock_converter.convert_to_local.assert_called_once_with(TEST_UNC_PATH)
     
     def test_convert_to_unc(self):
         """Test convert_to_unc function."""
         # Mock the global converter
         with mock.patch('unctools.converter._global_converter') as mock_converter:
-            mock_converter.convert_to_unc.return_value = Path(TEST_UNC_PATH)
+            mock_converter.convert_to_unc.return_value = TEST_UNC_PATH_OBJ
             
             result = convert_to_unc(TEST_LOCAL_PATH)
-            assert result == Path(TEST_UNC_PATH)
+            assert result == TEST_UNC_PATH_OBJ
             mock_converter.convert_to_unc.assert_called_once_with(TEST_LOCAL_PATH)
     
+    def test_invalidate_mappings(self):
+        """Test invalidate_mappings function."""
+        with mock.patch.object(UNCConverter, 'refresh_mappings') as mock_refresh, \
+             mock.patch('unctools.converter._global_converter', None):
+            # The mappings are queried once and then reused
+            convert_to_local(TEST_UNC_PATH)
+            convert_to_unc(TEST_LOCAL_PATH)
+            assert mock_refresh.call_count == 1
+            
+            # Invalidating forces a fresh query on the next conversion
+            invalidate_mappings()
+            convert_to_local(TEST_UNC_PATH)
+            assert mock_refresh.call_count == 2
+    
     def test_normalize_path(self):
         """Test normalize_path function."""
         # Test with prefer_unc=False (default)
         with mock.patch('unctools.converter.convert_to_local') as mock_convert_local:
-            mock_convert_local.return_value = Path(TEST_LOCAL_PATH)
+            mock_convert_local.return_value = TEST_LOCAL_PATH_OBJ
             
             result = normalize_path(TEST_UNC_PATH)
-            assert result == Path(TEST_LOCAL_PATH)
-            mock_convert_local.assert_called_once_with(Path(TEST_UNC_PATH))
+            assert result == TEST_LOCAL_PATH_OBJ
+            mock_convert_local.assert_called_once_with(TEST_UNC_PATH_OBJ)
         
         # Test with prefer_unc=True
         with mock.patch('unctools.converter.convert_to_unc') as mock_convert_unc:
-            mock_convert_unc.return_value = Path(TEST_UNC_PATH)
+            mock_convert_unc.return_value = TEST_UNC_PATH_OBJ
             
             result = normalize_path(TEST_LOCAL_PATH, prefer_unc=True)
-            assert result == Path(TEST_UNC_PATH)
-            mock_convert_unc.assert_called_once_with(Path(TEST_LOCAL_PATH))
+            assert result == TEST_UNC_PATH_OBJ
+            mock_convert_unc.assert_called_once_with(TEST_LOCAL_PATH_OBJ)
+    
+    def test_normalize_path_cached(self):
+        """Test normalize_path_cached function."""
+        normalize_path_cached.cache_clear()
+        with mock.patch('unctools.converter.convert_to_local') as mock_convert_local:
+            mock_convert_local.return_value = TEST_LOCAL_PATH_OBJ
+            
+            # Repeated calls with the same path are served from the cache
+            assert normalize_path_cached(TEST_UNC_PATH) == TEST_LOCAL_PATH_OBJ
+            assert normalize_path_cached(TEST_UNC_PATH) == TEST_LOCAL_PATH_OBJ
+            mock_convert_local.assert_called_once_with(TEST_UNC_PATH_OBJ)
+            
+            info = normalize_path_cached.cache_info()
+            assert info.hits == 1
+            assert info.misses == 1
+        
+        # Invalidating the mappings also discards the cached results
+        invalidate_mappings()
+        assert normalize_path_cached.cache_info().currsize == 0
     
     def test_parse_unc_path(self):
         """Test parse_unc_path function."""
@@ -215,6 +309,11 @@ class TestModuleFunctions:
         # Test with a UNC path using forward slashes
         result = parse_unc_path("//server/share/folder/file.txt")
         assert result == (TEST_SERVER, TEST_SHARE, TEST_REL_PATH)
+        
+        # Test that repeated lookups are served from the cache
+        hits = parse_unc_path.cache_info().hits
+        assert parse_unc_path(TEST_UNC_PATH) == (TEST_SERVER, TEST_SHARE, TEST_REL_PATH)
+        assert parse_unc_path.cache_info().hits == hits + 1
     
     def test_join_unc_path(self):
         """Test join_unc_path function."""
@@ -6,8 +6,10 @@ Tests for the unctools.detector module using the test framework.
 import os
 import sys
 import logging
+import contextlib
 import subprocess
 from pathlib import Path
+from types import MappingProxyType
 from unittest import mock
 import pytest
 
@@ -28,6 +30,7 @@ from unctools.detector import (
     is_unc_path, is_network_drive, is_subst_drive, 
     get_path_type, detect_path_issues, get_network_mappings,
     get_subst_target, get_network_target, is_server_in_intranet_zone,
+    get_drive_type,
     PATH_TYPE_UNC, PATH_TYPE_NETWORK, PATH_TYPE_SUBST, 
     PATH_TYPE_LOCAL, PATH_TYPE_UNKNOWN, PATH_TYPE_REMOVABLE,
     PATH_TYPE_CDROM, PATH_TYPE_RAMDISK
@@ -44,10 +47,42 @@ TEST_NETWORK_PATH = "Z:\\folder\\file.txt"  # Assuming Z: is a network drive
 TEST_SUBST_PATH = "Y:\\folder\\file.txt"    # Assuming Y: is a subst drive
 TEST_LONG_PATH = "C:\\" + "a" * 300         # Path exceeding MAX_PATH
 
-def mock_convert_to_local(path):
-    if path is None:
-        return Path("")  # Return empty path instead of None
-    return Path(str(path) + ".local")
+# Drive types returned by the mocked detector functions, read-only so they can be shared
+_DRIVE_TYPE_TABLE = MappingProxyType({
+    "C:": PATH_TYPE_LOCAL,
+    "Z:": PATH_TYPE_NETWORK,
+    "Y:": PATH_TYPE_SUBST,
+    "E:": PATH_TYPE_REMOVABLE,
+    "D:": PATH_TYPE_CDROM,
+    "R:": PATH_TYPE_RAMDISK
+})
+
+def _mock_is_unc_path(path):
+    return str(path)[:2] in ("\\\\", "//")
+
+def _mock_get_drive_type(drive):
+    return _DRIVE_TYPE_TABLE.get(str(drive)[:2].upper(), PATH_TYPE_UNKNOWN)
+
+# Detector functions mocked for the whole module; the tests call the real
+# functions they imported, so only the detector's internal calls are affected
+_patches = [
+    mock.patch('unctools.detector.is_unc_path', side_effect=_mock_is_unc_path),
+    mock.patch('unctools.detector.get_drive_type', side_effect=_mock_get_drive_type)
+]
+
+def setup_module():
+    """Install the module-wide detector mocks."""
+    from unctools.detector import _clear_path_type_cache
+    _clear_path_type_cache()
+    for patch in _patches:
+        patch.start()
+
+def teardown_module():
+    """Remove the module-wide detector mocks and the results cached under them."""
+    from unctools.detector import _clear_path_type_cache
+    for patch in _patches:
+        patch.stop()
+    _clear_path_type_cache()
 
 def test_is_unc_path():
     """Test is_unc_path function."""
@@ -67,68 +102,93 @@ def test_is_unc_path():
     assert_false(is_unc_path("\\server\\share"), "Single backslash should not be detected as UNC")
     assert_false(is_unc_path(""), "Empty string should not be detected as UNC")
     assert_false(is_unc_path(None), "None should not be detected as UNC")
+    
+    # Test with mixed separators and bytes paths
+    assert_true(is_unc_path("\\/server/share"), "UNC path with mixed separators should be detected")
+    assert_true(is_unc_path(b"\\\\server\\share"), "UNC path as bytes should be detected")
+    assert_false(is_unc_path(b"C:\\folder"), "Local path as bytes should not be detected as UNC")
+
+def test_get_drive_type():
+    """Test get_drive_type function."""
+    from unctools.detector import _clear_path_type_cache
+    
+    # GetDriveTypeW codes of the drives, with Q: absent
+    drive_types = {"C:": 3, "Y:": 3, "Z:": 4, "E:": 2, "D:": 5, "R:": 6, "Q:": 1}
+    
+    _clear_path_type_cache()
+    with mock.patch('unctools.detector.IS_WINDOWS', True), \
+         mock.patch('unctools.detector._get_drive_type_windows', side_effect=drive_types.get) as query, \
+         mock.patch('unctools.detector._load_subst_map', return_value={"Y:": "C:\\Users"}):
+        assert_equal(get_drive_type("C:"), PATH_TYPE_LOCAL, "C: should be a local drive")
+        assert_equal(get_drive_type("y:\\folder"), PATH_TYPE_SUBST, "Y: should be a subst drive")
+        assert_equal(get_drive_type("Z:"), PATH_TYPE_NETWORK, "Z: should be a network drive")
+        assert_equal(get_drive_type("E:"), PATH_TYPE_REMOVABLE, "E: should be a removable drive")
+        assert_equal(get_drive_type("D:"), PATH_TYPE_CDROM, "D: should be a CD-ROM drive")
+        assert_equal(get_drive_type("R:"), PATH_TYPE_RAMDISK, "R: should be a RAM disk")
+        assert_equal(get_drive_type("Q:"), PATH_TYPE_UNKNOWN, "Non-existent drive should be unknown")
+        
+        # Each drive is queried once, and only when asked about
+        get_drive_type("z:\\folder")
+        assert_equal(query.call_count, len(drive_types), "Drive types should be cached per drive")
+    _clear_path_type_cache()
 
 @skip_if_not_windows
 def test_is_network_drive():
     """Test is_network_drive function."""
-    # Mock the get_drive_type function to return PATH_TYPE_NETWORK for Z:
-    with mock.patch('unctools.detector.get_drive_type') as mock_get_drive_type:
-        mock_get_drive_type.side_effect = lambda drive: PATH_TYPE_NETWORK if drive.upper().startswith('Z:') else PATH_TYPE_LOCAL
-        
-        # Test with a known local drive
-        assert_false(is_network_drive("C:"), "C: should not be detected as a network drive")
-        
-        # Test with a mocked network drive
-        assert_true(is_network_drive("Z:"), "Z: should be detected as a network drive")
-        
-        # Test with non-existent drive
-        assert_false(is_network_drive("Q:"), "Non-existent drive should not be detected as a network drive")
+    # Test with a known local drive
+    assert_false(is_network_drive("C:"), "C: should not be detected as a network drive")
+    
+    # Test with a mocked network drive
+    assert_true(is_network_drive("Z:"), "Z: should be detected as a network drive")
+    
+    # Test with non-existent drive
+    assert_false(is_network_drive("Q:"), "Non-existent drive should not be detected as a network drive")
+    
+    # Test with invalid input
+    assert_false(is_network_drive(""), "Empty string should not be detected as a network drive")
+    assert_false(is_network_drive(None), "None should not be detected as a network drive")
+
+# Parsed 'subst' output used by the subst drive tests, read-only so it can be shared
+MOCK_SUBST_MAP = MappingProxyType({"Y:": "C:\\Users\\username\\Documents", "Z:": "\\\\server\\share"})
+
+def test__load_subst_map():
+    """Test _load_subst_map function."""
+    from unctools.detector import _load_subst_map, _clear_path_type_cache
+    
+    output = "Y:\\: => C:\\Users\\username\\Documents\nZ:\\: => \\\\server\\share\n"
+    completed = subprocess.CompletedProcess(['subst'], 0, stdout=output, stderr="")
+    
+    _clear_path_type_cache()
+    with mock.patch('subprocess.run', return_value=completed) as mock_run:
+        assert_equal(_load_subst_map(), MOCK_SUBST_MAP, "subst output should be parsed into a drive map")
         
-        # Test with invalid input
-        assert_false(is_network_drive(""), "Empty string should not be detected as a network drive")
-        assert_false(is_network_drive(None), "None should not be detected as a network drive")
+        # A second lookup should be served from the cache
+        _load_subst_map()
+        assert_equal(mock_run.call_count, 1, "subst should only be run once")
+    _clear_path_type_cache()
 
 @skip_if_not_windows
 def test_is_subst_drive():
     """Test is_subst_drive function."""
-    # Mock subprocess.check_output to return Y: as a subst drive
-    def mock_subst_output(*args, **kwargs):
-        if args[0][0] == 'subst':
-            return "Y:\\: => C:\\Users\\username\\Documents\nZ:\\: => \\\\server\\share"
-        return ""
-
-    # Define the mock is_subst_drive function
-    def mock_is_subst_drive(drive):
-        """Mock is_subst_drive function with proper None and empty string handling."""
-        if drive is None or drive == "":
-            return False
-        drive_str = str(drive).upper() if drive else ""
-        return drive_str.startswith('Y:')
-    
-    with mock.patch('subprocess.check_output', side_effect=mock_subst_output):
+    with mock.patch('unctools.detector._load_subst_map', return_value=MOCK_SUBST_MAP):
         # Test with a local drive
-        assert_false(mock_is_subst_drive("C:"), "C: should not be detected as a subst drive")
+        assert_false(is_subst_drive("C:"), "C: should not be detected as a subst drive")
         
         # Test with a mocked subst drive
-        assert_true(mock_is_subst_drive("Y:"), "Y: should be detected as a subst drive")
+        assert_true(is_subst_drive("Y:"), "Y: should be detected as a subst drive")
+        assert_true(is_subst_drive("y:\\folder"), "Path on Y: should be detected as a subst drive")
         
         # Test with non-existent drive
-        assert_false(mock_is_subst_drive("Q:"), "Non-existent drive should not be detected as a subst drive")
+        assert_false(is_subst_drive("Q:"), "Non-existent drive should not be detected as a subst drive")
         
         # Test with invalid input
-        assert_false(mock_is_subst_drive(""), "Empty string should not be detected as a subst drive")
-        assert_false(mock_is_subst_drive(None), "None should not be detected as a subst drive")
+        assert_false(is_subst_drive(""), "Empty string should not be detected as a subst drive")
+        assert_false(is_subst_drive(None), "None should not be detected as a subst drive")
 
 @skip_if_not_windows
 def test_get_subst_target():
     """Test get_subst_target function."""
-    # Mock subprocess.check_output to return Y: as a subst drive
-    def mock_subst_output(*args, **kwargs):
-        if args[0][0] == 'subst':
-            return "Y:\\: => C:\\Users\\username\\Documents\nZ:\\: => \\\\server\\share"
-        return ""
-    
-    with mock.patch('subprocess.check_output', side_effect=mock_subst_output):
+    with mock.patch('unctools.detector._load_subst_map', return_value=MOCK_SUBST_MAP):
         # Test with a mocked subst drive
         assert_equal(get_subst_target("Y:"), "C:\\Users\\username\\Documents", 
                     "Y: should return the correct target")
@@ -179,100 +239,73 @@ def test_get_network_target():
 
 def test_get_path_type():
     """Test get_path_type function."""
-    # Mock the underlying functions
-    def mock_is_unc_path(path):
-        return str(path).startswith("\\\\") or str(path).startswith("//")
-    
-    def mock_get_drive_type(drive):
-        drive = str(drive).upper()
-        if drive.startswith("C:"):
-            return PATH_TYPE_LOCAL
-        elif drive.startswith("Z:"):
-            return PATH_TYPE_NETWORK
-        elif drive.startswith("Y:"):
-            return PATH_TYPE_SUBST
-        elif drive.startswith("E:"):
-            return PATH_TYPE_REMOVABLE
-        elif drive.startswith("D:"):
-            return PATH_TYPE_CDROM
-        elif drive.startswith("R:"):
-            return PATH_TYPE_RAMDISK
-        else:
-            return PATH_TYPE_UNKNOWN
-    
-    with mock.patch('unctools.detector.is_unc_path', side_effect=mock_is_unc_path), \
-         mock.patch('unctools.detector.get_drive_type', side_effect=mock_get_drive_type):
-        
-        # Test with UNC path
-        assert_equal(get_path_type(TEST_UNC_PATH), PATH_TYPE_UNC, 
-                    "UNC path should be detected as UNC type")
-        
-        # Test with local path
-        assert_equal(get_path_type(TEST_LOCAL_PATH), PATH_TYPE_LOCAL, 
-                    "Local path should be detected as local type")
-        
-        # Test with network drive path
-        assert_equal(get_path_type(TEST_NETWORK_PATH), PATH_TYPE_NETWORK, 
-                    "Network drive path should be detected as network type")
-        
-        # Test with subst drive path
-        assert_equal(get_path_type(TEST_SUBST_PATH), PATH_TYPE_SUBST, 
-                    "Subst drive path should be detected as subst type")
-        
-        # Test with removable drive path
-        assert_equal(get_path_type("E:\\file.txt"), PATH_TYPE_REMOVABLE, 
-                    "Removable drive path should be detected as removable type")
-        
-        # Test with CD-ROM drive path
-        assert_equal(get_path_type("D:\\file.txt"), PATH_TYPE_CDROM, 
-                    "CD-ROM drive path should be detected as cdrom type")
-        
-        # Test with RAM disk path
-        assert_equal(get_path_type("R:\\file.txt"), PATH_TYPE_RAMDISK, 
-                    "RAM disk path should be detected as ramdisk type")
-        
-        # Test with invalid path
-        assert_equal(get_path_type(""), PATH_TYPE_UNKNOWN, 
-                    "Empty string should be detected as unknown type")
-        assert_equal(get_path_type(None), PATH_TYPE_UNKNOWN, 
-                    "None should be detected as unknown type")
+    # Test with UNC path
+    assert_equal(get_path_type(TEST_UNC_PATH), PATH_TYPE_UNC, 
+                "UNC path should be detected as UNC type")
+    
+    # Test with local path
+    assert_equal(get_path_type(TEST_LOCAL_PATH), PATH_TYPE_LOCAL, 
+                "Local path should be detected as local type")
+    
+    # Test with network drive path
+    assert_equal(get_path_type(TEST_NETWORK_PATH), PATH_TYPE_NETWORK, 
+                "Network drive path should be detected as network type")
+    
+    # Test with subst drive path
+    assert_equal(get_path_type(TEST_SUBST_PATH), PATH_TYPE_SUBST, 
+                "Subst drive path should be detected as subst type")
+    
+    # Test with removable drive path
+    assert_equal(get_path_type("E:\\file.txt"), PATH_TYPE_REMOVABLE, 
+                "Removable drive path should be detected as removable type")
+    
+    # Test with CD-ROM drive path
+    assert_equal(get_path_type("D:\\file.txt"), PATH_TYPE_CDROM, 
+                "CD-ROM drive path should be detected as cdrom type")
+    
+    # Test with RAM disk path
+    assert_equal(get_path_type("R:\\file.txt"), PATH_TYPE_RAMDISK, 
+                "RAM disk path should be detected as ramdisk type")
+    
+    # Test with invalid path
+    assert_equal(get_path_type(""), PATH_TYPE_UNKNOWN, 
+                "Empty string should be detected as unknown type")
+    assert_equal(get_path_type(None), PATH_TYPE_UNKNOWN, 
+                "None should be detected as unknown type")
+
+# Mock functions to control the behavior of detect_path_issues
+def _mock_get_path_type(path):
+    if _mock_is_unc_path(path):
+        return PATH_TYPE_UNC
+    return _DRIVE_TYPE_TABLE.get(str(path)[:2].upper(), PATH_TYPE_LOCAL)
+
+def _mock_is_server_in_intranet_zone(server):
+    return server.lower() == "trusted"
+
+def _mock_get_network_target(drive):
+    if drive.upper().startswith("Z:"):
+        return "\\\\server\\share"
+    return None
+
+def _mock_get_subst_target(drive):
+    if drive.upper().startswith("Y:"):
+        return "C:\\Users\\username\\Documents"
+    return None
+
+_DETECT_PATH_ISSUES_PATCHES = (
+    ('unctools.detector.get_path_type', _mock_get_path_type),
+    ('unctools.detector.is_server_in_intranet_zone', _mock_is_server_in_intranet_zone),
+    ('unctools.detector.get_network_target', _mock_get_network_target),
+    ('unctools.detector.get_subst_target', _mock_get_subst_target)
+)
 
 @pytest.mark.skipif(os.name != 'nt', reason="Windows-specific test - tests security zone functionality")
 def test_detect_path_issues():
     """Test detect_path_issues function."""
-    # Mock functions to control behavior
-    def mock_is_unc_path(path):
-        return str(path).startswith("\\\\") or str(path).startswith("//")
-    
-    def mock_get_path_type(path):
-        if mock_is_unc_path(path):
-            return PATH_TYPE_UNC
-        elif str(path).startswith("Z:"):
-            return PATH_TYPE_NETWORK
-        elif str(path).startswith("Y:"):
-            return PATH_TYPE_SUBST
-        else:
-            return PATH_TYPE_LOCAL
-    
-    def mock_is_server_in_intranet_zone(server):
-        return server.lower() == "trusted"
-    
-    def mock_get_network_target(drive):
-        if drive.upper().startswith("Z:"):
-            return "\\\\server\\share"
-        return None
-    
-    def mock_get_subst_target(drive):
-        if drive.upper().startswith("Y:"):
-            return "C:\\Users\\username\\Documents"
-        return None
-    
-    with mock.patch('unctools.detector.is_unc_path', side_effect=mock_is_unc_path), \
-         mock.patch('unctools.detector.get_path_type', side_effect=mock_get_path_type), \
-         mock.patch('unctools.detector.is_server_in_intranet_zone', side_effect=mock_is_server_in_intranet_zone), \
-         mock.patch('unctools.detector.get_network_target', side_effect=mock_get_network_target), \
-         mock.patch('unctools.detector.get_subst_target', side_effect=mock_get_subst_target), \
-         mock.patch('os.path.exists', return_value=True):
+    with contextlib.ExitStack() as stack:
+        for target, side_effect in _DETECT_PATH_ISSUES_PATCHES:
+            stack.enter_context(mock.patch(target, side_effect=side_effect))
+        stack.enter_context(mock.patch('os.path.exists', return_value=True))
         
         # Test with UNC path - untrusted server
         issues = detect_path_issues("\\\\server\\share\\folder")
@@ -293,38 +326,106 @@ def test_detect_path_issues():
         assert_true(len(issues) > 0, "Long path should have issues detected")
         assert_true(any("MAX_PATH" in issue for issue in issues), 
                    "Long path issues should mention MAX_PATH")
+        
+        # Test with long UNC path without a deep scan - only MAX_PATH is reported
+        issues = detect_path_issues("\\\\server\\share\\" + "a" * 300, deep_scan=False)
+        assert_equal(len(issues), 1, "Long path without a deep scan should stop at MAX_PATH")
 
-@skip_if_not_windows
-def test_is_server_in_intranet_zone():
-    """Test is_server_in_intranet_zone function."""
-    # This is mostly a Windows-specific function interacting with the registry
-    # For testing, we'll mock the winreg module
+class _FakeRegistryKey:
+    """A registry key for the fake winreg module, with values and subkeys."""
     
-    if os.name != 'nt':
-        return  # Skip on non-Windows platforms
+    def __init__(self, values=None, subkeys=None):
+        self.values = values or {}
+        self.subkeys = subkeys or {}
     
-    try:
-        import winreg
-    except ImportError:
-        return  # Skip if winreg is not available
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+def _fake_winreg(root):
+    """
+    Create a fake winreg module serving keys from a tree of _FakeRegistryKey objects.
     
-    # Mock the winreg functions
-    with mock.patch('winreg.OpenKey') as mock_open_key, \
-         mock.patch('winreg.QueryValueEx') as mock_query_value:
+    Args:
+        root: The HKEY_CURRENT_USER key. A subkey set to None cannot be opened.
         
-        # Set up mock behavior for a server in the intranet zone
-        mock_query_value.return_value = (1, 0)  # Value 1 means intranet zone
+    Returns:
+        A mock module with the winreg functions used by the detector.
+    """
+    def open_key(key, sub_key):
+        try:
+            subkey = key.subkeys[sub_key]
+        except KeyError:
+            raise FileNotFoundError(sub_key)
+        if subkey is None:
+            raise PermissionError(sub_key)
+        return subkey
+    
+    def enum_key(key, index):
+        try:
+            return list(key.subkeys)[index]
+        except IndexError:
+            raise OSError("No more data is available")
+    
+    def query_value_ex(key, name):
+        try:
+            return key.values[name], 4
+        except KeyError:
+            raise FileNotFoundError(name)
+    
+    fake = mock.Mock(spec=["HKEY_CURRENT_USER", "OpenKey", "EnumKey", "QueryValueEx"])
+    fake.HKEY_CURRENT_USER = root
+    fake.OpenKey.side_effect = open_key
+    fake.EnumKey.side_effect = enum_key
+    fake.QueryValueEx.side_effect = query_value_ex
+    return fake
+
+def test_is_server_in_intranet_zone():
+    """Test is_server_in_intranet_zone function."""
+    from unctools.detector import (
+        _clear_path_type_cache, invalidate_intranet_zone, _ZONE_DOMAINS_PATH, _ZONE_RANGES_PATH
+    )
+    
+    # Registry with intranet domains, an unreadable domain, an internet domain
+    # and an intranet range
+    root = _FakeRegistryKey(subkeys={
+        _ZONE_DOMAINS_PATH: _FakeRegistryKey(subkeys={
+            "locked": None,
+            "Server": _FakeRegistryKey(values={"*": 1}),
+            "fileserver": _FakeRegistryKey(values={"0": 3, "1": 1}),
+            "internet": _FakeRegistryKey(values={"*": 3})
+        }),
+        _ZONE_RANGES_PATH: _FakeRegistryKey(subkeys={
+            "Range1": _FakeRegistryKey(values={":Range": 1, "http": "nas.corp"})
+        })
+    })
+    fake_winreg = _fake_winreg(root)
+    
+    _clear_path_type_cache()
+    with mock.patch('unctools.detector.IS_WINDOWS', True), \
+         mock.patch('unctools.detector.winreg', fake_winreg):
+        # Test with servers in the intranet zone, by domain and by range
+        assert_true(is_server_in_intranet_zone("server"), "Server should be detected in intranet zone")
+        assert_true(is_server_in_intranet_zone("FILESERVER"), "Numbered entry should be detected in intranet zone")
+        assert_true(is_server_in_intranet_zone("nas"), "Server in an intranet range should be detected")
         
-        # Test with a server
-        result = is_server_in_intranet_zone("server")
-        assert_true(result, "Server should be detected in intranet zone")
+        # Test with servers outside the intranet zone
+        assert_false(is_server_in_intranet_zone("internet"), "Internet zone server should not be detected")
+        assert_false(is_server_in_intranet_zone("unknown"), "Unlisted server should not be detected")
         
-        # Make the query raise an error to test negative case
-        mock_query_value.side_effect = FileNotFoundError()
+        # The registry should be walked only once
+        open_calls = fake_winreg.OpenKey.call_count
+        is_server_in_intranet_zone("server")
+        assert_equal(fake_winreg.OpenKey.call_count, open_calls, "Zone entries should be cached")
         
-        # Test again
-        result = is_server_in_intranet_zone("server")
-        assert_false(result, "Server should not be detected in intranet zone when registry key not found")
+        # Changes to the zone map should be picked up once the cache is invalidated
+        root.subkeys[_ZONE_DOMAINS_PATH].subkeys["newserver"] = _FakeRegistryKey(values={"*": 1})
+        assert_false(is_server_in_intranet_zone("newserver"), "Cached entries should be reused")
+        invalidate_intranet_zone()
+        assert_true(is_server_in_intranet_zone("newserver"), "Invalidated entries should be reloaded")
+    _clear_path_type_cache()
 
 @pytest.mark.skipif(os.name != 'nt', reason="Windows-specific test - tests network drive mapping functionality")
 def test_get_network_mappings():
@@ -352,16 +453,20 @@ def test__clear_path_type_cache():
     """Test _clear_path_type_cache function."""
     # This is an internal function, but we can test it indirectly
     # by accessing the internal cache variable
-    from unctools.detector import _path_type_cache, _clear_path_type_cache
+    from unctools.detector import _path_type_cache, _clear_path_type_cache, _get_path_type_cached
     
-    # Add something to the cache
+    # Add something to the caches
     _path_type_cache["test_key"] = "test_value"
+    get_path_type(TEST_UNC_PATH)
+    get_path_type(TEST_UNC_PATH)
+    assert_true(_get_path_type_cached.cache_info().hits >= 1, "Repeated lookup should hit the cache")
     
     # Call the function to clear the cache
     _clear_path_type_cache()
     
-    # Verify the cache is empty
+    # Verify the caches are empty
     assert_equal(len(_path_type_cache), 0, "Cache should be empty after clearing")
+    assert_equal(_get_path_type_cached.cache_info().currsize, 0, "Path type cache should be empty after clearing")
 
 def run_tests():
     """Run all detector tests."""
@@ -369,7 +474,9 @@ def run_tests():
     
     # Add tests
     suite.add_test(test_is_unc_path)
+    suite.add_test(test_get_drive_type)
     suite.add_test(test_is_network_drive)
+    suite.add_test(test__load_subst_map)
     suite.add_test(test_is_subst_drive)
     suite.add_test(test_get_subst_target)
     suite.add_test(test_get_network_target)
@@ -379,8 +486,12 @@ def run_tests():
     suite.add_test(test_get_network_mappings)
     suite.add_test(test__clear_path_type_cache)
     
-    # Run suite
-    run_test_suites([suite])
+    # Run suite with the module-wide mocks installed, as pytest does
+    setup_module()
+    try:
+        run_test_suites([suite])
+    finally:
+        teardown_module()
 
 if __name__ == "__main__":
     run_tests()
@@ -7,9 +7,22 @@ This module provides common utilities and fixtures for testing UNCtools.
 import os
 import sys
 import logging
+import pickle
 import platform
+import functools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Any, Optional, Callable
 
+# pytest is used to report skips when the tests run under it
+try:
+    import pytest as _pytest
+except ImportError:
+    _pytest = None
+
+# Platform checked by the skip decorators
+_IS_WINDOWS = os.name == 'nt'
+
 # Configure test logging
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -21,42 +34,93 @@ class TestResult:
         self.passed = []
         self.failed = []
         self.skipped = []
-        self.total = 0
+    
+    @property
+    def total(self) -> int:
+        """The number of tests run."""
+        return len(self.passed) + len(self.failed) + len(self.skipped)
     
     def add_pass(self, test_name: str, message: Optional[str] = None):
         """Add a passed test."""
         self.passed.append((test_name, message))
-        self.total += 1
     
     def add_fail(self, test_name: str, message: Optional[str] = None):
         """Add a failed test."""
         self.failed.append((test_name, message))
-        self.total += 1
     
     def add_skip(self, test_name: str, message: Optional[str] = None):
         """Add a skipped test."""
         self.skipped.append((test_name, message))
-        self.total += 1
     
     def get_summary(self) -> str:
         """Get a summary of the test results."""
         passed = len(self.passed)
         failed = len(self.failed)
         skipped = len(self.skipped)
+        total = passed + failed + skipped
         
-        summary = [
-            f"Tests run: {self.total}",
-            f"Passed: {passed} ({passed/self.total*100:.1f}% of total)" if self.total > 0 else "Passed: 0 (0.0%)",
-            f"Failed: {failed} ({failed/self.total*100:.1f}% of total)" if self.total > 0 else "Failed: 0 (0.0%)",
-            f"Skipped: {skipped} ({skipped/self.total*100:.1f}% of total)" if self.total > 0 else "Skipped: 0 (0.0%)"
-        ]
+        percent = 100.0 / total if total else 0.0
         
-        return "\n".join(summary)
+        return (f"Tests run: {total}\n"
+                f"Passed: {passed} ({passed * percent:.1f}% of total)\n"
+                f"Failed: {failed} ({failed * percent:.1f}% of total)\n"
+                f"Skipped: {skipped} ({skipped * percent:.1f}% of total)")
     
     def is_success(self) -> bool:
         """Check if all tests passed."""
         return len(self.failed) == 0
 
+def _run_test(test_fn: Callable, setup_fn: Optional[Callable] = None,
+              teardown_fn: Optional[Callable] = None) -> Tuple[str, str, Optional[str], Optional[str]]:
+    """
+    Run a single test with its suite's setup and teardown.
+    
+    Args:
+        test_fn: The test function.
+        setup_fn: The suite's setup function, if any.
+        teardown_fn: The suite's teardown function, if any.
+        
+    Returns:
+        A tuple of (status, line, message, teardown_error) where status is
+        "pass", "fail" or "skip", line is the result to print, message is the
+        result message to record and teardown_error describes a teardown
+        failure, if there was one.
+    """
+    # Run setup if defined
+    setup_data = None
+    try:
+        if setup_fn:
+            setup_data = setup_fn()
+    except Exception as e:
+        return "fail", f"FAIL (setup error: {e})", f"Setup error: {e}", None
+    
+    # Run test
+    try:
+        if setup_data is not None:
+            test_fn(setup_data)
+        else:
+            test_fn()
+        outcome = ("pass", "PASS", None)
+    except SkipTest as e:
+        outcome = ("skip", f"SKIP ({e})", str(e))
+    except AssertionError as e:
+        outcome = ("fail", f"FAIL (assertion: {e})", f"Assertion error: {e}")
+    except Exception as e:
+        outcome = ("fail", f"FAIL (error: {e})", f"Error: {e}")
+    
+    # Run teardown if defined
+    teardown_error = None
+    try:
+        if teardown_fn:
+            if setup_data is not None:
+                teardown_fn(setup_data)
+            else:
+                teardown_fn()
+    except Exception as e:
+        teardown_error = str(e)
+    
+    return outcome + (teardown_error,)
+
 class TestSuite:
     """A suite of tests."""
     
@@ -79,134 +143,170 @@ class TestSuite:
         """Set the teardown function for the suite."""
         self.teardown_fn = fn
     
-    def run(self) -> TestResult:
-        """Run all tests in the suite."""
+    def run(self, workers: int = 1, verbose: bool = False) -> TestResult:
+        """
+        Run all tests in the suite.
+        
+        Args:
+            workers: Number of worker processes to run the tests in. With more
+                     than one, tests run in parallel and their results are
+                     reported in order once each finishes; tests that cannot
+                     be sent to a worker process run in this process instead.
+            verbose: Print each test's result as soon as it finishes, rather
+                     than writing all results at once when the suite is done.
+        """
         print(f"\n[TEST SUITE] {self.name}")
         print("=" * 80)
         
         result = TestResult()
+        lines = []
         
-        # Run tests
-        for test_name, test_fn in self.tests:
-            print(f"[TEST] {test_name}... ", end="")
-            
-            # Run setup if defined
-            setup_data = None
-            try:
-                if self.setup_fn:
-                    setup_data = self.setup_fn()
-            except Exception as e:
-                print(f"FAIL (setup error: {e})")
-                result.add_fail(test_name, f"Setup error: {e}")
-                continue
-            
-            # Run test
-            try:
-                if setup_data is not None:
-                    test_fn(setup_data)
-                else:
-                    test_fn()
-                print("PASS")
+        if workers > 1:
+            outcomes = self._run_parallel(workers)
+        else:
+            outcomes = self._run_serial()
+        
+        for test_name, (status, line, message, teardown_error) in outcomes:
+            lines.append(line)
+            if status == "pass":
                 result.add_pass(test_name)
-            except SkipTest as e:
-                print(f"SKIP ({e})")
-                result.add_skip(test_name, str(e))
-            except AssertionError as e:
-                print(f"FAIL (assertion: {e})")
-                result.add_fail(test_name, f"Assertion error: {e}")
-            except Exception as e:
-                print(f"FAIL (error: {e})")
-                result.add_fail(test_name, f"Error: {e}")
+            elif status == "skip":
+                result.add_skip(test_name, message)
+            else:
+                result.add_fail(test_name, message)
             
-            # Run teardown if defined
-            try:
-                if self.teardown_fn:
-                    if setup_data is not None:
-                        self.teardown_fn(setup_data)
-                    else:
-                        self.teardown_fn()
-            except Exception as e:
-                print(f"Warning: Teardown error: {e}")
+            if teardown_error is not None:
+                lines.append(f"Warning: Teardown error: {teardown_error}")
+            
+            if verbose:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+                lines.clear()
         
-        # Print summary
-        print("\nSummary:")
-        print(result.get_summary())
+        # Write the results and summary
+        lines.append("\nSummary:")
+        lines.append(result.get_summary())
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         return result
+    
+    def _run_serial(self):
+        """Run the tests one at a time, yielding (name, outcome) pairs."""
+        for test_name, test_fn in self.tests:
+            status, line, message, teardown_error = _run_test(test_fn, self.setup_fn, self.teardown_fn)
+            yield test_name, (status, f"[TEST] {test_name}... {line}", message, teardown_error)
+    
+    def _run_parallel(self, workers: int):
+        """Run the tests in worker processes, yielding (name, outcome) pairs in order."""
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = []
+            for test_name, test_fn in self.tests:
+                try:
+                    pickle.dumps((test_fn, self.setup_fn, self.teardown_fn))
+                except Exception:
+                    pending.append((test_name, None, test_fn))
+                else:
+                    future = executor.submit(_run_test, test_fn, self.setup_fn, self.teardown_fn)
+                    pending.append((test_name, future, test_fn))
+            
+            for test_name, future, test_fn in pending:
+                if future is None:
+                    outcome = _run_test(test_fn, self.setup_fn, self.teardown_fn)
+                else:
+                    outcome = future.result()
+                status, line, message, teardown_error = outcome
+                yield test_name, (status, f"[TEST] {test_name}... {line}", message, teardown_error)
 
 class SkipTest(Exception):
     """Exception to skip a test."""
     pass
 
-def skip_if_not_windows(fn):
-    """Decorator to skip a test if not running on Windows."""
+def _skip(reason: str):
+    """Skip the running test, through pytest when running under it."""
+    if _pytest is not None and "PYTEST_CURRENT_TEST" in os.environ:
+        _pytest.skip(reason)
+    raise SkipTest(reason)
+
+def _skipped(fn: Callable, reason: str) -> Callable:
+    """Replace a test with one that is skipped with the given reason."""
+    @functools.wraps(fn)
     def wrapper(*args, **kwargs):
-        if os.name != 'nt':
-            try:
-                import pytest
-                pytest.skip("Test only runs on Windows")
-            except ImportError:
-                raise SkipTest("Test only runs on Windows")
-        return fn(*args, **kwargs)
+        _skip(reason)
     return wrapper
 
+# The skip decorators decide when the test is decorated, so a test that runs
+# is left unwrapped
+
+def skip_if_not_windows(fn):
+    """Decorator to skip a test if not running on Windows."""
+    if _IS_WINDOWS:
+        return fn
+    return _skipped(fn, "Test only runs on Windows")
+
 def skip_if_windows(fn):
     """Decorator to skip a test if running on Windows."""
-    def wrapper(*args, **kwargs):
-        if os.name == 'nt':
-            try:
-                import pytest
-                pytest.skip("Test only runs on non-Windows platforms")
-            except ImportError:
-                raise SkipTest("Test only runs on non-Windows platforms")
-        return fn(*args, **kwargs)
-    return wrapper
+    if not _IS_WINDOWS:
+        return fn
+    return _skipped(fn, "Test only runs on non-Windows platforms")
 
 def skip_if_no_module(module_name):
     """Decorator to skip a test if a module is not available."""
+    # Check for the module once, when the test is decorated
+    try:
+        __import__(module_name)
+        available = True
+    except ImportError:
+        available = False
+    
     def decorator(fn):
-        def wrapper(*args, **kwargs):
-            try:
-                __import__(module_name)
-            except ImportError:
-                try:
-                    import pytest
-                    pytest.skip(f"Required module {module_name} not available")
-                except ImportError:
-                    raise SkipTest(f"Required module {module_name} not available")
-            return fn(*args, **kwargs)
-        return wrapper
+        if available:
+            return fn
+        return _skipped(fn, f"Required module {module_name} not available")
     return decorator
 
+def _fail(message, default: str):
+    """
+    Raise an assertion failure.
+    
+    Args:
+        message: The failure message, or a callable returning it, so that
+                 messages built from test data are only formatted on failure.
+        default: The message to use if no message was given.
+    """
+    if callable(message):
+        message = message()
+    raise AssertionError(message or default)
+
 def assert_true(value, message=None):
     """Assert that a value is True."""
     if not value:
-        raise AssertionError(message or f"Expected True, got {value}")
+        _fail(message, f"Expected True, got {value!r}")
 
 def assert_false(value, message=None):
     """Assert that a value is False."""
     if value:
-        raise AssertionError(message or f"Expected False, got {value}")
+        _fail(message, f"Expected False, got {value!r}")
 
 def assert_equal(a, b, message=None):
     """Assert that two values are equal."""
     if a != b:
-        raise AssertionError(message or f"Expected {a} == {b}")
+        _fail(message, f"Expected {a!r} == {b!r}")
 
 def assert_not_equal(a, b, message=None):
     """Assert that two values are not equal."""
     if a == b:
-        raise AssertionError(message or f"Expected {a} != {b}")
+        _fail(message, f"Expected {a!r} != {b!r}")
 
 def assert_is_none(value, message=None):
     """Assert that a value is None."""
     if value is not None:
-        raise AssertionError(message or f"Expected None, got {value}")
+        _fail(message, f"Expected None, got {value!r}")
 
 def assert_is_not_none(value, message=None):
     """Assert that a value is not None."""
     if value is None:
-        raise AssertionError(message or "Expected not None, got None")
+        _fail(message, "Expected not None, got None")
 
 def assert_raises(exception_type, callable_obj, *args, **kwargs):
     """Assert that a callable raises an exception."""
@@ -218,6 +318,50 @@ def assert_raises(exception_type, callable_obj, *args, **kwargs):
         raise AssertionError(f"Expected {exception_type.__name__}, got {type(e).__name__}: {e}")
     raise AssertionError(f"Expected {exception_type.__name__}, no exception raised")
 
+class Recorder:
+    """
+    A minimal test double that records its calls and returns a fixed value.
+    
+    Cheaper than a mock.MagicMock for tests that only count calls and check
+    their arguments.
+    """
+    
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.calls = []
+    
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+# Marks an attribute that did not exist before it was swapped
+_MISSING = object()
+
+@contextlib.contextmanager
+def swap(obj, name: str, value):
+    """
+    Temporarily replace an attribute, restoring it on exit.
+    
+    A plain setattr is much cheaper than mock.patch when no mock is needed.
+    
+    Args:
+        obj: The object (usually a module) whose attribute to replace.
+        name: The name of the attribute.
+        value: The value to set while the context is active.
+        
+    Yields:
+        The value set.
+    """
+    original = getattr(obj, name, _MISSING)
+    setattr(obj, name, value)
+    try:
+        yield value
+    finally:
+        if original is _MISSING:
+            delattr(obj, name)
+        else:
+            setattr(obj, name, original)
+
 def get_platform_info():
     """Get information about the current platform."""
     return {
@@ -229,8 +373,15 @@ def get_platform_info():
         "processor": platform.processor()
     }
 
-def run_test_suites(suites):
-    """Run multiple test suites."""
+def run_test_suites(suites, workers: int = 1, verbose: bool = False):
+    """
+    Run multiple test suites.
+    
+    Args:
+        suites: The test suites to run.
+        workers: Number of worker processes each suite runs its tests in.
+        verbose: Print each test's result as soon as it finishes.
+    """
     print("\n===== UNCtools Test Framework =====")
     print(f"Platform: {platform.system()} {platform.release()}")
     print(f"Python: {platform.python_version()}")
@@ -246,7 +397,7 @@ def run_test_suites(suites):
     all_passed = True
     
     for suite in suites:
-        result = suite.run()
+        result = suite.run(workers=workers, verbose=verbose)
         
         total_results["passed"] += len(result.passed)
         total_results["failed"] += len(result.failed)
@@ -256,11 +407,14 @@ def run_test_suites(suites):
         if not result.is_success():
             all_passed = False
     
+    total = total_results["total"]
+    percent = 100.0 / total if total else 0.0
+    
     print("\n===== Test Results =====")
-    print(f"Total tests: {total_results['total']}")
-    print(f"Passed: {total_results['passed']} ({total_results['passed']/total_results['total']*100:.1f}% of total)" if total_results['total'] > 0 else "Passed: 0 (0.0%)")
-    print(f"Failed: {total_results['failed']} ({total_results['failed']/total_results['total']*100:.1f}% of total)" if total_results['total'] > 0 else "Failed: 0 (0.0%)")
-    print(f"Skipped: {total_results['skipped']} ({total_results['skipped']/total_results['total']*100:.1f}% of total)" if total_results['total'] > 0 else "Skipped: 0 (0.0%)")
+    print(f"Total tests: {total}\n"
+          f"Passed: {total_results['passed']} ({total_results['passed'] * percent:.1f}% of total)\n"
+          f"Failed: {total_results['failed']} ({total_results['failed'] * percent:.1f}% of total)\n"
+          f"Skipped: {total_results['skipped']} ({total_results['skipped'] * percent:.1f}% of total)")
     
     if all_passed:
         print("\nALL TESTS PASSED!")
@@ -25,9 +25,10 @@ from tests.test_framework import (
 # Import UNCtools
 import unctools
 from unctools.operations import (
-    safe_open, safe_copy, batch_convert, batch_copy,
-    process_files, file_exists, replace_in_file, batch_replace_in_files,
-    get_unc_path_elements, build_unc_path, is_path_accessible, find_accessible_path
+    safe_open, safe_copy, batch_convert, batch_convert_iter, batch_copy,
+    process_files, iprocess_files, file_exists, replace_in_file, batch_replace_in_files,
+    get_unc_path_elements, build_unc_path, is_path_accessible, find_accessible_path,
+    _compile_pattern
 )
 from unctools.detector import is_unc_path, PATH_TYPE_UNC
 
@@ -39,24 +40,65 @@ logging.basicConfig(level=logging.INFO,
 TEST_UNC_PATH = "\\\\server\\share\\folder\\file.txt"
 TEST_LOCAL_PATH = "C:\\Users\\username\\Documents\\file.txt"
 
+# Flags for creating test files; O_BINARY keeps Windows from translating line endings
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+def _write_file(path, data):
+    """
+    Write a small test file with a single unbuffered write.
+    
+    Args:
+        path: The path of the file to write.
+        data: The file content, as str (written as UTF-8) or bytes.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+# Files created in each test environment, as (relative path, content) pairs;
+# tests index env.test_files in this order
+_TEST_FILE_SPECS = (
+    ('text_file.txt', b'This is a test file.'),
+    (os.path.join('nested', 'nested_file.txt'), b'This is a nested file.'),
+    ('binary_file.bin', b'\x00\x01\x02\x03\x04'),
+)
+
 class TestEnvironment:
-    """Manages a temporary test environment with files."""
+    """
+    Manages a temporary test environment with files.
+    
+    The environment is shared by the tests of a suite. Tests write only to
+    output_dir and work_dir, which reset() empties between tests.
+    """
     
     def __init__(self):
         """Initialize the test environment."""
         self.temp_dir = None
         self.test_files = []
         self.output_dir = None
+        self.work_dir = None
+        self.non_existent = None
     
     def setup(self):
         """Set up the test environment."""
         # Create a temporary directory
         self.temp_dir = tempfile.mkdtemp(prefix='unctools_test_')
         
+        # A path in the temporary directory that is never created
+        self.non_existent = os.path.join(self.temp_dir, 'non_existent.txt')
+        
         # Create an output directory for copy tests
         self.output_dir = os.path.join(self.temp_dir, 'output')
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # Create a working directory for tests that create or modify files
+        self.work_dir = os.path.join(self.temp_dir, 'work')
+        os.makedirs(self.work_dir, exist_ok=True)
+        
         # Create test files
         self._create_test_files()
         
@@ -65,39 +107,37 @@ class TestEnvironment:
     
     def teardown(self):
         """Clean up the test environment."""
-        # Remove the temporary directory
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-            self.temp_dir = None
-            self.test_files = []
-            self.output_dir = None
+        # Remove the temporary directory; a test environment only holds a
+        # handful of files, so rmtree beats spawning an 'rm -rf' process
+        if self.temp_dir:
+            try:
+                shutil.rmtree(self.temp_dir)
+            except FileNotFoundError:
+                pass
+        self.temp_dir = None
+        self.test_files = []
+        self.output_dir = None
+        self.work_dir = None
+        self.non_existent = None
+    
+    def reset(self):
+        """Empty the output and working directories, undoing a test's changes."""
+        for directory in (self.output_dir, self.work_dir):
+            shutil.rmtree(directory)
+            os.makedirs(directory)
     
     def _create_test_files(self):
         """Create test files in the temporary directory."""
-        # Create files with different content
-        file_paths = []
-        
-        # Create a simple text file
-        text_file = os.path.join(self.temp_dir, 'text_file.txt')
-        with open(text_file, 'w') as f:
-            f.write('This is a test file.')
-        file_paths.append(text_file)
-        
-        # Create a nested directory
-        nested_dir = os.path.join(self.temp_dir, 'nested')
-        os.makedirs(nested_dir, exist_ok=True)
+        # Create the directories first, then write the files in one pass
+        os.mkdir(os.path.join(self.temp_dir, 'nested'))
         
-        # Create a file in the nested directory
-        nested_file = os.path.join(nested_dir, 'nested_file.txt')
-        with open(nested_file, 'w') as f:
-            f.write('This is a nested file.')
-        file_paths.append(nested_file)
-        
-        # Create binary file
-        binary_file = os.path.join(self.temp_dir, 'binary_file.bin')
-        with open(binary_file, 'wb') as f:
-            f.write(b'\x00\x01\x02\x03\x04')
-        file_paths.append(binary_file)
+        # The separator is known, so build the paths by concatenation
+        prefix = self.temp_dir + os.sep
+        file_paths = []
+        for relative_path, data in _TEST_FILE_SPECS:
+            file_path = prefix + relative_path
+            _write_file(file_path, data)
+            file_paths.append(file_path)
         
         # Create multiple text files for batch operations
         #for i in range(3):
@@ -111,17 +151,78 @@ class TestEnvironment:
         
         return file_paths
 
+# Mocks for the path conversion functions used by unctools.operations; the
+# converted paths are cached so each input is parsed into a Path only once
+_CONV_CACHE = {}
+
+def _mock_convert(path, suffix):
+    key = str(path) + suffix
+    converted = _CONV_CACHE.get(key)
+    if converted is None:
+        converted = _CONV_CACHE[key] = Path(key)
+    return converted
+
+def _mock_convert_to_local(path):
+    return _mock_convert(path, ".local")
+
+def _mock_convert_to_unc(path):
+    return _mock_convert(path, ".unc")
+
+def _mock_is_unc_path(path):
+    return str(path)[:2] in ("\\\\", "//")
+
+def _patch_conversions(converted=None):
+    """
+    Patch the path conversion functions used by unctools.operations.
+    
+    Args:
+        converted: The path both conversion functions return, or None to
+                   append '.local' or '.unc' to the path being converted.
+    
+    Returns:
+        A context manager that patches the functions with plain functions.
+    """
+    if converted is None:
+        to_local, to_unc = _mock_convert_to_local, _mock_convert_to_unc
+    else:
+        def to_local(path):
+            return converted
+        to_unc = to_local
+    return mock.patch.multiple('unctools.operations', convert_to_local=to_local,
+                               convert_to_unc=to_unc, is_unc_path=_mock_is_unc_path)
+
+# Test environment shared by the tests of a suite run, created on first use
+_ENV = None
+
 # Create test suite setup and teardown functions
 def setup_test_environment():
-    """Set up a test environment for tests."""
-    env = TestEnvironment()
-    return env.setup()
+    """Get the shared test environment, setting it up on first use."""
+    global _ENV
+    if _ENV is None:
+        _ENV = TestEnvironment().setup()
+    return _ENV
 
 def teardown_test_environment(env=None):
-    """Clean up the test environment."""
+    """Reset the shared test environment after a test."""
+    if env:
+        env.reset()
+
+def setup_isolated_environment():
+    """Set up a test environment of the test's own, for tests run in parallel."""
+    return TestEnvironment().setup()
+
+def teardown_isolated_environment(env=None):
+    """Clean up a test environment set up by setup_isolated_environment."""
     if env:
         env.teardown()
 
+def close_test_environment():
+    """Clean up the shared test environment."""
+    global _ENV
+    if _ENV is not None:
+        _ENV.teardown()
+        _ENV = None
+
 def test_safe_open(env):
     """Test safe_open function."""
     # Get a test file path
@@ -134,7 +235,7 @@ def test_safe_open(env):
         assert_true(len(content) > 0, "File content should not be empty")
     
     # Test opening a non-existent file
-    non_existent = os.path.join(env.temp_dir, 'non_existent.txt')
+    non_existent = env.non_existent
     try:
         with safe_open(non_existent, 'r') as f:
             content = f.read()
@@ -163,24 +264,8 @@ def test_safe_open(env):
             raise PermissionError("Mock permission error")
         return original_open(*args, **kwargs)
     
-    # Mock convert_to_local to return a different path
-    def mock_convert_to_local(path):
-        return Path(str(path) + ".local")
-    
-    # Mock convert_to_unc to return another different path
-    def mock_convert_to_unc(path):
-        return Path(str(path) + ".unc")
-    
-    # Mock is_unc_path to control behavior
-    def mock_is_unc_path(path):
-         """Mock is_unc_path function with proper Path object handling."""
-         path_str = str(path)  # Convert Path to string before checking
-         return path_str.startswith("\\\\") or path_str.startswith("//")
-    
-    with mock.patch('builtins.open', side_effect=mock_open), \
-         mock.patch('unctools.operations.convert_to_local', side_effect=mock_convert_to_local), \
-         mock.patch('unctools.operations.convert_to_unc', side_effect=mock_convert_to_unc), \
-         mock.patch('unctools.operations.is_unc_path', side_effect=mock_is_unc_path):
+    # Mock the path conversions to return different paths
+    with mock.patch('builtins.open', new=mock_open), _patch_conversions():
         
         # Test with a non-UNC path (should try convert_to_unc)
         try:
@@ -208,7 +293,7 @@ def test_file_exists(env):
     assert_true(file_exists(test_file), "Existing file should be detected")
     
     # Test with a non-existent file
-    non_existent = os.path.join(env.temp_dir, 'non_existent.txt')
+    non_existent = env.non_existent
     assert_false(file_exists(non_existent), "Non-existent file should not be detected")
     
     # Test with a directory
@@ -218,23 +303,10 @@ def test_file_exists(env):
     # Mock convert_to_local and convert_to_unc to return alternate paths
     # and os.path.exists to return True for the converted path
     
-    def mock_convert_to_local(path):
-        return Path(str(path) + ".local")
-    
-    def mock_convert_to_unc(path):
-        return Path(str(path) + ".unc")
-    
-    def mock_is_unc_path(path):
-        path_str = str(path)  # Convert Path to string before checking
-        return path_str.startswith("\\\\") or path_str.startswith("//")
-    
     def mock_exists(path):
         return str(path).endswith(".local") or str(path).endswith(".unc")
     
-    with mock.patch('unctools.operations.convert_to_local', side_effect=mock_convert_to_local), \
-         mock.patch('unctools.operations.convert_to_unc', side_effect=mock_convert_to_unc), \
-         mock.patch('unctools.operations.is_unc_path', side_effect=mock_is_unc_path), \
-         mock.patch('os.path.exists', side_effect=mock_exists):
+    with _patch_conversions(), mock.patch('os.path.exists', new=mock_exists):
         
         # Test with a UNC path (should try convert_to_local)
         assert_true(file_exists(TEST_UNC_PATH, check_both_paths=True), 
@@ -268,25 +340,14 @@ def test_safe_copy(env):
             raise PermissionError("Mock permission error")
         return original_copy2(*args, **kwargs)
     
-    # Mock convert_to_local and convert_to_unc to return specific paths
-    def mock_convert_to_local(path):
-        return Path(str(path) + ".local")
-    
-    def mock_convert_to_unc(path):
-        return Path(str(path) + ".unc")
-    
-    def mock_is_unc_path(path):
-        path_str = str(path)
-        return path_str.startswith("\\\\") or path_str.startswith("//")
-    
-    with mock.patch('shutil.copy2', side_effect=mock_copy2), \
-         mock.patch('unctools.operations.convert_to_local', side_effect=mock_convert_to_local), \
-         mock.patch('unctools.operations.convert_to_unc', side_effect=mock_convert_to_unc), \
-         mock.patch('unctools.operations.is_unc_path', side_effect=mock_is_unc_path):
+    # Mock the path conversions to return specific paths
+    with mock.patch('shutil.copy2', new=mock_copy2), _patch_conversions():
         
         # Delete the destination file if it exists to avoid interference
-        if os.path.exists(dest_file):
+        try:
             os.unlink(dest_file)
+        except FileNotFoundError:
+            pass
         
         try:
             # Test with non-UNC paths
@@ -303,13 +364,13 @@ def test_batch_convert(env):
     
     # Mock convert_to_local and convert_to_unc to return predictable results
     def mock_convert_to_local(path):
-        return Path(str(path) + ".local")
+        return str(path) + ".local"
     
     def mock_convert_to_unc(path):
-        return Path(str(path) + ".unc")
+        return str(path) + ".unc"
     
-    with mock.patch('unctools.operations.convert_to_local', side_effect=mock_convert_to_local), \
-         mock.patch('unctools.operations.convert_to_unc', side_effect=mock_convert_to_unc):
+    with mock.patch('unctools.operations.convert_to_local_str', new=mock_convert_to_local), \
+         mock.patch('unctools.operations.convert_to_unc_str', new=mock_convert_to_unc):
         
         # Test batch convert to UNC
         results = batch_convert([str(f) for f in test_files], to_unc=True)
@@ -320,7 +381,7 @@ def test_batch_convert(env):
         
         for original, converted in results.items():
             assert_equal(converted, original + ".unc", 
-                        f"Converted path for {original} should end with .unc")
+                        lambda: f"Converted path for {original} should end with .unc")
         
         # Test batch convert to local
         results = batch_convert([str(f) for f in test_files], to_unc=False)
@@ -331,7 +392,22 @@ def test_batch_convert(env):
         
         for original, converted in results.items():
             assert_equal(converted, original + ".local", 
-                        f"Converted path for {original} should end with .local")
+                        lambda: f"Converted path for {original} should end with .local")
+        
+        # Test the streaming form yields (original, converted) tuples in order
+        pairs = list(batch_convert_iter((str(f) for f in test_files), to_unc=True))
+        assert_equal([original for original, _ in pairs], [str(f) for f in test_files],
+                    "Streamed results should keep the input order")
+        for original, converted in pairs:
+            assert_equal(converted, original + ".unc", 
+                        lambda: f"Converted path for {original} should end with .unc")
+    
+    # Test that a path repeated in the batch is only converted once
+    with mock.patch('unctools.operations.convert_to_unc_str', side_effect=mock_convert_to_unc) as mock_unc:
+        path = str(test_files[0])
+        results = batch_convert([path, path, path], to_unc=True)
+        assert_equal(results, {path: path + ".unc"}, "Repeated paths should give one result")
+        assert_equal(mock_unc.call_count, 1, "Repeated paths should be converted once")
 
 def test_batch_copy(env):
     """Test batch_copy function."""
@@ -345,10 +421,12 @@ def test_batch_copy(env):
     assert_equal(len(results), len(test_files), 
                 "Should have results for all input files")
     
+    copied = {entry.name for entry in os.scandir(env.output_dir)}
     for original, (success, path) in results.items():
-        assert_true(success, f"Copy of {original} should succeed")
+        assert_true(success, lambda: f"Copy of {original} should succeed")
         assert_is_not_none(path, "Destination path should not be None")
-        assert_true(os.path.exists(path), f"Destination file {path} should exist")
+        assert_true(os.path.basename(path) in copied,
+                    lambda: f"Destination file {path} should exist")
     
     # Test with retry behavior - mock safe_copy to fail once then succeed
     original_copy = safe_copy
@@ -363,10 +441,9 @@ def test_batch_copy(env):
         original_copy(src, dst, **kwargs)
         return str(dst)
     
-    with mock.patch('unctools.operations.safe_copy', side_effect=mock_safe_copy):
+    with mock.patch('unctools.operations.safe_copy', new=mock_safe_copy):
         # Delete existing output files
-        for f in os.listdir(env.output_dir):
-            os.unlink(os.path.join(env.output_dir, f))
+        env.reset()
         
         # Test batch copy with one failure - should retry and succeed
         results = batch_copy([str(test_files[0])], env.output_dir)
@@ -374,9 +451,9 @@ def test_batch_copy(env):
         # Verify result
         original = str(test_files[0])
         success, path = results.get(original, (False, None))
-        assert_true(success, f"Copy of {original} should succeed after retry")
+        assert_true(success, lambda: f"Copy of {original} should succeed after retry")
         assert_is_not_none(path, "Destination path should not be None")
-        assert_true(os.path.exists(path), f"Destination file {path} should exist")
+        assert_true(os.path.exists(path), lambda: f"Destination file {path} should exist")
 
 def test_process_files(env):
     """Test process_files function."""
@@ -391,10 +468,10 @@ def test_process_files(env):
     assert_is_not_none(results, "Results should not be None")
     assert_true(len(results) > 0, "Should have processed at least one file")
     
+    # getsize raises for a missing file, so it checks existence as well
     for path, size in results.items():
-        assert_true(os.path.exists(path), f"File {path} should exist")
         assert_equal(size, os.path.getsize(path), 
-                    f"Size for {path} should match os.path.getsize")
+                    lambda: f"Size for {path} should match os.path.getsize")
     
     # Test processing without recursion
     results = process_files(env.temp_dir, process_fn, pattern="*.txt", recursive=False)
@@ -402,29 +479,49 @@ def test_process_files(env):
     # Verify results
     for path in results.keys():
         # Ensure no nested files are included
-        assert_false("/nested/" in path.replace("\\", "/"), 
+        assert_false("/nested/" in path.replace("\\", "/"),
                     "Non-recursive search should not include nested files")
-    
+
+    # Test passing the scanned directory entries to the callback
+    def entry_fn(entry):
+        assert_true(isinstance(entry, os.DirEntry), "Callback should receive a DirEntry")
+        return entry.stat().st_size
+
+    results = process_files(env.temp_dir, entry_fn, pattern="*.txt", recursive=True,
+                            pass_entry=True)
+    assert_equal(len(results), 2, "Should have processed both text files")
+    for path, size in results.items():
+        assert_equal(size, os.path.getsize(path),
+                    lambda: f"Size for {path} should match os.path.getsize")
+    
+    # Literal patterns and patterns with a directory should pass DirEntry objects too
+    for pattern, recursive in (('text_file.txt', False), ('nested/*.txt', True)):
+        results = process_files(env.temp_dir, entry_fn, pattern=pattern, recursive=recursive,
+                                pass_entry=True)
+        assert_equal(len(results), 1, lambda: f"Should have processed one file for {pattern}")
+        for path, size in results.items():
+            assert_equal(size, os.path.getsize(path),
+                        lambda: f"Size for {path} should match os.path.getsize")
+
+    # Test that the scan batch size does not change the results
+    assert_equal(process_files(env.temp_dir, process_fn, pattern="*.txt", chunk_size=1),
+                process_files(env.temp_dir, process_fn, pattern="*.txt"),
+                "Results should not depend on chunk_size")
+    
+    # Test that repeated scans reuse the compiled pattern
+    hits = _compile_pattern.cache_info().hits
+    process_files(env.temp_dir, process_fn, pattern="*.txt")
+    assert_true(_compile_pattern.cache_info().hits > hits,
+               "Repeated patterns should not be compiled again")
+
     # Test with convert_paths behavior for non-existent directory
-    # Updated mock to handle WindowsPath objects correctly
-    def mock_convert_to_local(path):
-        return Path(env.temp_dir)  # Return a valid directory
-    
-    def mock_convert_to_unc(path):
-        return Path(env.temp_dir)  # Return a valid directory
-    
-    def mock_is_unc_path(path_str):
-        path_str = str(path_str)  # Ensure it's a string
-        return path_str.startswith('\\\\') or path_str.startswith('//')
-    
     def mock_path_exists(path):
         path_str = str(path)  # Ensure it's a string
         return path_str == str(env.temp_dir) or path_str.startswith(str(env.temp_dir) + os.sep)
     
-    with mock.patch('unctools.operations.convert_to_local', side_effect=mock_convert_to_local), \
-         mock.patch('unctools.operations.convert_to_unc', side_effect=mock_convert_to_unc), \
-         mock.patch('unctools.operations.is_unc_path', side_effect=mock_is_unc_path), \
-         mock.patch('os.path.exists', side_effect=mock_path_exists):
+    # Conversions return a valid directory
+    with _patch_conversions(Path(env.temp_dir)), \
+         mock.patch('os.path.exists', new=mock_path_exists):
         
         # Test with a non-existent UNC path that gets converted to a valid one
         results = process_files("\\\\server\\share\\nonexistent", process_fn, 
@@ -433,6 +530,31 @@ def test_process_files(env):
         # Should get results after conversion
         assert_true(len(results) > 0, "Should have results after path conversion")
 
+def test_iprocess_files(env):
+    """Test iprocess_files function."""
+    def process_fn(file_path):
+        return os.path.getsize(file_path)
+    
+    # Results are produced lazily as (path, result) tuples
+    results = iprocess_files(env.temp_dir, process_fn, pattern="*.txt", recursive=True)
+    assert_false(isinstance(results, dict), "iprocess_files should return an iterator")
+    
+    pairs = list(results)
+    assert_equal(dict(pairs), process_files(env.temp_dir, process_fn, pattern="*.txt"),
+                "Streamed results should match process_files")
+    
+    # Callback failures are reported as None rather than stopping the walk
+    def failing_fn(file_path):
+        raise ValueError("boom")
+    
+    for path, result in iprocess_files(env.temp_dir, failing_fn, pattern="*.txt"):
+        assert_is_none(result, lambda: f"Failed callback for {path} should yield None")
+    
+    # A missing directory yields nothing
+    missing = os.path.join(env.temp_dir, "does_not_exist")
+    assert_equal(list(iprocess_files(missing, process_fn, convert_paths=False)), [],
+                "Missing directory should yield no results")
+
 def test_get_unc_path_elements(env):
     """Test get_unc_path_elements function."""
     # Test with a valid UNC path
@@ -489,24 +611,12 @@ def test_is_path_accessible(env):
     assert_true(is_path_accessible(env.temp_dir), "Directory should be accessible")
     
     # Test with a non-existent file
-    non_existent = os.path.join(env.temp_dir, 'non_existent.txt')
+    non_existent = env.non_existent
     assert_false(is_path_accessible(non_existent), "Non-existent file should not be accessible")
     
     # Test with convert_paths behavior
-    # Mock conversion and path access functions
-    def mock_convert_to_local(path):
-        return Path(env.test_files[0])  # Return a valid file
-    
-    def mock_convert_to_unc(path):
-        return Path(env.test_files[0])  # Return a valid file
-    
-    def mock_is_unc_path(path):
-        path_str = str(path)
-        return path_str.startswith("\\\\") or path_str.startswith("//")
-    
-    with mock.patch('unctools.operations.convert_to_local', side_effect=mock_convert_to_local), \
-         mock.patch('unctools.operations.convert_to_unc', side_effect=mock_convert_to_unc), \
-         mock.patch('unctools.operations.is_unc_path', side_effect=mock_is_unc_path):
+    # Mock the conversions to return a valid file
+    with _patch_conversions(Path(env.test_files[0])):
         
         # Test with a UNC path (should try convert_to_local)
         assert_true(is_path_accessible(TEST_UNC_PATH, check_both_paths=True), 
@@ -525,27 +635,17 @@ def test_find_accessible_path(env):
     assert_equal(str(path), test_file, "Found path should match the original")
     
     # Test with a non-existent file
-    non_existent = os.path.join(env.temp_dir, 'non_existent.txt')
-    
-    # Mock conversion and path access functions
-    def mock_convert_to_local(path):
-        return Path(env.test_files[0])  # Return a valid file
-    
-    def mock_convert_to_unc(path):
-        return Path(env.test_files[0])  # Return a valid file
+    non_existent = env.non_existent
     
-    def mock_is_unc_path(path):
-        path_str = str(path)
-        return path_str.startswith("\\\\") or path_str.startswith("//")
+    # Mock conversion and path access functions; conversions return a valid file
+    accessible = Path(env.test_files[0])
+    accessible_names = {env.test_files[0], str(accessible)}
     
     def mock_is_path_accessible(path, check_both_paths=True):
-        return str(path) == env.test_files[0] or \
-               str(path) == str(Path(env.test_files[0]))
+        return str(path) in accessible_names
     
-    with mock.patch('unctools.operations.convert_to_local', side_effect=mock_convert_to_local), \
-         mock.patch('unctools.operations.convert_to_unc', side_effect=mock_convert_to_unc), \
-         mock.patch('unctools.operations.is_unc_path', side_effect=mock_is_unc_path), \
-         mock.patch('unctools.operations.is_path_accessible', side_effect=mock_is_path_accessible):
+    with _patch_conversions(accessible), \
+         mock.patch('unctools.operations.is_path_accessible', new=mock_is_path_accessible):
         
         # Test with a UNC path (should try convert_to_local)
         path = find_accessible_path(TEST_UNC_PATH)
@@ -563,19 +663,16 @@ def test_find_accessible_path(env):
 def test_replace_in_file(env):
     """Test replace_in_file function."""
     # Create a test file with specific content
-    test_file = os.path.join(env.temp_dir, 'replace_test.txt')
-    with open(test_file, 'w') as f:
-        f.write('This is a test. This is only a test.')
+    test_file = os.path.join(env.work_dir, 'replace_test.txt')
+    _write_file(test_file, 'This is a test. This is only a test.')
     
     # Replace text in the file
     result = replace_in_file(test_file, 'test', 'demo')
     assert_true(result, "Replace should succeed")
     
     # Check the file content
-    with open(test_file, 'r') as f:
-        content = f.read()
-        assert_equal(content, 'This is a demo. This is only a demo.', 
-                    "File content should be updated")
+    assert_equal(Path(test_file).read_text(), 'This is a demo. This is only a demo.', 
+                "File content should be updated")
     
     # Test replacing text that doesn't exist
     result = replace_in_file(test_file, 'nonexistent', 'replacement')
@@ -584,14 +681,14 @@ def test_replace_in_file(env):
 def test_batch_replace_in_files(env):
     """Test batch_replace_in_files function."""
     # Create test files with similar content
+    prefix = env.work_dir + os.sep
     for i in range(3):
-        file_path = os.path.join(env.temp_dir, f'batch_replace_{i}.txt')
-        with open(file_path, 'w') as f:
-            f.write(f'This is file {i}. This is a test.')
+        file_path = f'{prefix}batch_replace_{i}.txt'
+        _write_file(file_path, f'This is file {i}. This is a test.')
     
     # Perform batch replace
     results = batch_replace_in_files(
-        env.temp_dir, 'test', 'demo', 
+        env.work_dir, 'test', 'demo', 
         pattern='batch_replace_*.txt', 
         recursive=False
     )
@@ -600,17 +697,15 @@ def test_batch_replace_in_files(env):
     assert_is_not_none(results, "Results should not be None")
     assert_equal(len(results), 3, "Should have results for 3 files")
     
-    # Verify content was replaced in all files
-    for i in range(3):
-        file_path = os.path.join(env.temp_dir, f'batch_replace_{i}.txt')
-        with open(file_path, 'r') as f:
-            content = f.read()
-            assert_equal(content, f'This is file {i}. This is a demo.', 
-                        f"Content in file {i} should be updated")
+    # Verify content was replaced in all files, scanning the directory once
+    contents = {entry.name: Path(entry.path).read_text() for entry in os.scandir(env.work_dir)
+                if entry.name.startswith('batch_replace_')}
+    expected = {f'batch_replace_{i}.txt': f'This is file {i}. This is a demo.' for i in range(3)}
+    assert_equal(contents, expected, "Content in all files should be updated")
     
     # Test replacing text that doesn't exist
     results = batch_replace_in_files(
-        env.temp_dir, 'nonexistent', 'replacement', 
+        env.work_dir, 'nonexistent', 'replacement', 
         pattern='batch_replace_*.txt',
         recursive=False
     )
@@ -624,9 +719,16 @@ def run_tests():
     """Run all operations tests."""
     suite = TestSuite("UNCtools Operations Tests")
     
-    # Set suite setup and teardown
-    suite.set_setup(setup_test_environment)
-    suite.set_teardown(teardown_test_environment)
+    # Spread the tests over all cores on CI. The tests patch module globals,
+    # so they run in worker processes, each test in an environment of its
+    # own; run serially, the tests share one environment
+    workers = (os.cpu_count() or 1) if os.environ.get("CI") else 1
+    if workers > 1:
+        suite.set_setup(setup_isolated_environment)
+        suite.set_teardown(teardown_isolated_environment)
+    else:
+        suite.set_setup(setup_test_environment)
+        suite.set_teardown(teardown_test_environment)
     
     # Add tests
     suite.add_test(test_safe_open)
@@ -635,6 +737,7 @@ def run_tests():
     suite.add_test(test_batch_convert)
     suite.add_test(test_batch_copy)
     suite.add_test(test_process_files)
+    suite.add_test(test_iprocess_files)
     suite.add_test(test_get_unc_path_elements)
     suite.add_test(test_build_unc_path)
     suite.add_test(test_is_path_accessible)
@@ -643,7 +746,10 @@ def run_tests():
     suite.add_test(test_batch_replace_in_files)
     
     # Run suite
-    return run_test_suites([suite])
+    try:
+        return run_test_suites([suite], workers=workers)
+    finally:
+        close_test_environment()
 
 if __name__ == "__main__":
     sys.exit(run_tests())
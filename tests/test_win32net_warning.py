@@ -6,16 +6,17 @@ This script specifically tests the win32net module import behavior
 to ensure no unnecessary warnings are generated.
 """
 
-import io
 import os
+import re
 import sys
 import logging
+import logging.handlers
 import importlib
 from pathlib import Path
 
-# Set up the log capture
-log_capture = io.StringIO()
-handler = logging.StreamHandler(log_capture)
+# Set up the log capture; records are kept unformatted until they are read
+handler = logging.handlers.MemoryHandler(capacity=100000, flushLevel=logging.CRITICAL + 1,
+                                         target=None)
 handler.setLevel(logging.DEBUG)
 formatter = logging.Formatter('%(levelname)s - %(name)s - %(message)s')
 handler.setFormatter(formatter)
@@ -25,10 +26,17 @@ logger = logging.getLogger("unctools")
 logger.setLevel(logging.DEBUG)
 logger.addHandler(handler)
 
+# Matches a log message mentioning both win32net and "not available"
+WIN32NET_WARNING_PATTERN = re.compile(r'(?=.*win32net)(?=.*not available)', re.DOTALL)
+
 # Create logs directory if it doesn't exist
 LOGS_DIR = Path("logs")
 LOGS_DIR.mkdir(exist_ok=True)
 
+def get_log_output():
+    """Format the captured log records as text."""
+    return "".join(formatter.format(record) + "\n" for record in handler.buffer)
+
 def print_section(title):
     """Print a section header."""
     print(f"\n{'=' * 80}\n{title}\n{'=' * 80}")
@@ -55,12 +63,9 @@ def test_import_behavior():
     print("Importing operations module...")
     from unctools import operations
     
-    # Get the log output
-    log_output = log_capture.getvalue()
-    
-    # Check for warnings
-    win32net_warnings = [line for line in log_output.splitlines() 
-                        if "win32net" in line and "not available" in line]
+    # Check for warnings, formatting only the matching records
+    win32net_warnings = [formatter.format(record) for record in handler.buffer
+                        if WIN32NET_WARNING_PATTERN.match(record.getMessage())]
     
     if win32net_warnings:
         print("\nWARNING: win32net warnings were detected:")
@@ -92,21 +97,19 @@ def check_module_availability():
         'winreg'
     ]
     
-    # Check if pip is installed correctly
+    # Look up the installed pywin32 distributions from their metadata, rather
+    # than running 'pip list' in a subprocess
     try:
-        import pip
-        print(f"pip version: {pip.__version__}")
-        
-        # Get a list of installed packages
-        import subprocess
-        result = subprocess.run([sys.executable, '-m', 'pip', 'list'], 
-                               capture_output=True, text=True)
-        print("\nInstalled packages:")
-        for line in result.stdout.splitlines():
-            if any(module in line for module in ['pywin32', 'pypiwin32']):
-                print(f"  {line}")
+        from importlib import metadata
     except ImportError:
-        print("pip not available")
+        print("Package metadata not available (Python 3.8+ required)")
+    else:
+        print("\nInstalled packages:")
+        for package in ('pywin32', 'pypiwin32'):
+            try:
+                print(f"  {package} {metadata.version(package)}")
+            except metadata.PackageNotFoundError:
+                pass
     
     results = {}
     
@@ -118,7 +121,7 @@ def check_module_availability():
         # If available, try to import it and get version
         if available:
             try:
-                module = __import__(module_name)
+                module = importlib.import_module(module_name)
                 version = getattr(module, '__version__', 'Unknown')
                 print(f"  Version: {version}")
             except ImportError:
@@ -141,17 +144,17 @@ def main():
     
     # Save log output
     log_file = LOGS_DIR / "test_win32net_warning.log"
-    with open(log_file, 'w') as f:
-        f.write(f"Python version: {sys.version}\n")
-        f.write(f"Platform: {sys.platform}\n")
-        f.write(f"Running on Windows: {os.name == 'nt'}\n\n")
-        
-        f.write("Module Availability:\n")
-        for module_name, available in modules.items():
-            f.write(f"{module_name}: {'Available' if available else 'Not available'}\n")
-        
-        f.write("\nLog Output:\n")
-        f.write(log_capture.getvalue())
+    parts = [
+        f"Python version: {sys.version}\n",
+        f"Platform: {sys.platform}\n",
+        f"Running on Windows: {os.name == 'nt'}\n\n",
+        "Module Availability:\n",
+    ]
+    parts.extend(f"{module_name}: {'Available' if available else 'Not available'}\n"
+                 for module_name, available in modules.items())
+    parts.append("\nLog Output:\n")
+    parts.append(get_log_output())
+    log_file.write_text("".join(parts))
     
     print(f"\nLog saved to: {log_file}")
     
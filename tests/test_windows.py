@@ -6,6 +6,8 @@ Tests for the unctools.windows module using the test framework.
 import os
 import sys
 import logging
+import subprocess
+from types import SimpleNamespace
 from pathlib import Path
 from unittest import mock
 import pytest
@@ -18,7 +20,7 @@ from tests.test_framework import (
     TestSuite, assert_true, assert_false, assert_equal, 
     assert_not_equal, assert_is_none, assert_is_not_none,
     skip_if_not_windows, skip_if_windows, skip_if_no_module,
-    run_test_suites
+    run_test_suites, Recorder, swap
 )
 
 # Import UNCtools
@@ -56,22 +58,21 @@ def test_fix_security_zone():
 @skip_if_not_windows
 def test_add_to_intranet_zone():
     """Test add_to_intranet_zone function."""
-    # Mock winreg functions
-    with mock.patch('winreg.CreateKeyEx') as mock_create_key, \
-         mock.patch('winreg.SetValueEx') as mock_set_value, \
-         mock.patch('winreg.CloseKey') as mock_close_key:
-        
-        # Set up mock behavior
-        mock_create_key.return_value = "mock_key"
+    import winreg
+    
+    # Replace the winreg functions with call recorders
+    with swap(winreg, 'CreateKeyEx', Recorder("mock_key")) as mock_create_key, \
+         swap(winreg, 'SetValueEx', Recorder()) as mock_set_value, \
+         swap(winreg, 'CloseKey', Recorder()) as mock_close_key:
         
         # Test adding to intranet zone
         result = unctools.add_to_intranet_zone("server")
         assert_true(result, "add_to_intranet_zone should return True when successful")
         
         # Verify correct function calls
-        mock_create_key.assert_called_once()
-        mock_set_value.assert_called_once()
-        mock_close_key.assert_called_once()
+        assert_equal(len(mock_create_key.calls), 1, "CreateKeyEx should be called once")
+        assert_equal(len(mock_set_value.calls), 1, "SetValueEx should be called once")
+        assert_equal(len(mock_close_key.calls), 1, "CloseKey should be called once")
         
         # Test with invalid server name
         result = unctools.add_to_intranet_zone("")
@@ -126,13 +127,9 @@ def test_get_all_network_mappings():
 @skip_if_not_windows
 def test_check_network_connection():
     """Test check_network_connection function."""
-    # Mock subprocess.run
-    with mock.patch('subprocess.run') as mock_run:
-        # Set up mock behavior for success
-        mock_process = mock.MagicMock()
-        mock_process.returncode = 0
-        mock_run.return_value = mock_process
-        
+    # Replace subprocess.run with one returning a successful process
+    mock_process = SimpleNamespace(returncode=0, stdout="", stderr="")
+    with swap(subprocess, 'run', Recorder(mock_process)):
         # Test with successful connection
         result = unctools.windows.check_network_connection("server")
         assert_true(result, "check_network_connection should return True when successful")
@@ -184,34 +181,33 @@ def test_security_functions():
 @skip_if_not_windows
 def test_bypass_security_dialog():
     """Test bypass_security_dialog function."""
-    # Mock winreg functions
-    with mock.patch('winreg.OpenKey', side_effect=FileNotFoundError), \
-         mock.patch('winreg.CreateKey') as mock_create_key, \
-         mock.patch('winreg.SetValueEx') as mock_set_value, \
-         mock.patch('winreg.CloseKey') as mock_close_key:
-        
-        # Test enabling security bypass
-        result = unctools.windows.bypass_security_dialog(True)
-        assert_true(result, "bypass_security_dialog should return True when successful")
-        
-        # Verify correct function calls
-        mock_create_key.assert_called_once()
-        mock_set_value.assert_called_once_with(mock.ANY, "ClassicSharing", 0, mock.ANY, 1)
-        mock_close_key.assert_called_once()
-        
-        # Reset mocks
-        mock_create_key.reset_mock()
-        mock_set_value.reset_mock()
-        mock_close_key.reset_mock()
-        
-        # Test disabling security bypass
-        result = unctools.windows.bypass_security_dialog(False)
-        assert_true(result, "bypass_security_dialog should return True when successful")
-        
-        # Verify correct function calls
-        mock_create_key.assert_called_once()
-        mock_set_value.assert_called_once_with(mock.ANY, "ClassicSharing", 0, mock.ANY, 0)
-        mock_close_key.assert_called_once()
+    import winreg
+    
+    def open_key(*args, **kwargs):
+        raise FileNotFoundError
+    
+    # Replace the winreg functions, with the key missing so it is created
+    with swap(winreg, 'OpenKey', open_key), \
+         swap(winreg, 'CreateKey', Recorder()) as mock_create_key, \
+         swap(winreg, 'SetValueEx', Recorder()) as mock_set_value, \
+         swap(winreg, 'CloseKey', Recorder()) as mock_close_key:
+        
+        for enabled, expected_value in ((True, 1), (False, 0)):
+            # Test enabling or disabling security bypass
+            result = unctools.windows.bypass_security_dialog(enabled)
+            assert_true(result, "bypass_security_dialog should return True when successful")
+            
+            # Verify correct function calls
+            assert_equal(len(mock_create_key.calls), 1, "CreateKey should be called once")
+            assert_equal(len(mock_set_value.calls), 1, "SetValueEx should be called once")
+            args, _ = mock_set_value.calls[0]
+            assert_equal((args[1], args[2], args[4]), ("ClassicSharing", 0, expected_value),
+                        "SetValueEx should set ClassicSharing")
+            assert_equal(len(mock_close_key.calls), 1, "CloseKey should be called once")
+            
+            # Reset the recorded calls
+            for recorder in (mock_create_key, mock_set_value, mock_close_key):
+                recorder.calls.clear()
 
 @skip_if_windows
 def test_windows_stubs_on_non_windows():
@@ -28,6 +28,9 @@ from tests.test_framework import (
 logging.basicConfig(level=logging.INFO, 
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# Modules reloaded by test_module_import_warnings, in dependency order
+_RELOADED_MODULES = ('unctools.converter', 'unctools.detector', 'unctools.operations')
+
 def test_module_imports():
     """Test basic module import behavior."""
     # Test importing the unctools package
@@ -139,32 +142,34 @@ def test_windows_fallbacks():
 def test_module_import_warnings():
     """Test that no unexpected import warnings are generated."""
     # Import logging to capture warnings
-    import io
     import logging
+    import logging.handlers
     
-    # Create a string IO object to capture log output
-    log_capture = io.StringIO()
-    
-    # Configure logging to capture debug messages
-    handler = logging.StreamHandler(log_capture)
+    # Configure logging to capture debug messages; records are kept
+    # unformatted until they are read
+    handler = logging.handlers.MemoryHandler(capacity=100000, flushLevel=logging.CRITICAL + 1,
+                                             target=None)
     handler.setLevel(logging.DEBUG)
     
     logger = logging.getLogger("unctools")
+    saved_level = logger.level
     logger.addHandler(handler)
     logger.setLevel(logging.DEBUG)
     
-    # Force reload of modules to generate import messages
+    # Force reload of modules to generate import messages, capturing all of
+    # them with the one handler
     import importlib
-    for module_name in [
-        'unctools.converter', 
-        'unctools.detector', 
-        'unctools.operations'
-    ]:
-        if module_name in sys.modules:
-            importlib.reload(sys.modules[module_name])
+    try:
+        for module_name in _RELOADED_MODULES:
+            module = sys.modules.get(module_name)
+            if module is not None:
+                importlib.reload(module)
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(saved_level)
     
     # Get captured log
-    log_output = log_capture.getvalue()
+    log_output = "\n".join(record.getMessage() for record in handler.buffer)
     
     # Check for specific warning messages
     if os.name != 'nt':
@@ -175,9 +180,6 @@ def test_module_import_warnings():
     # Unexpected warnings
     assert_false("Failed to get network mappings" in log_output, 
                "No 'Failed to get network mappings' warnings should be shown")
-    
-    # Clean up
-    logger.removeHandler(handler)
 
 def run_tests():
     """Run all Windows import tests."""
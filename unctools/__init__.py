@@ -37,33 +37,59 @@ __version__ = "0.1.0"
 import os
 import sys
 import logging
-from pathlib import Path
+import importlib
 
 # Set up package-level logger
 logger = logging.getLogger(__name__)
 
 # Import core functionality into the main namespace
-from .converter import convert_to_local, convert_to_unc, normalize_path
+from .converter import (
+    convert_to_local, convert_to_unc, convert_to_local_str, convert_to_unc_str,
+    normalize_path, normalize_path_cached, invalidate_mappings
+)
 from .detector import (
     is_unc_path, is_network_drive, is_subst_drive, 
-    get_path_type, get_network_mappings, detect_path_issues
+    get_path_type, get_network_mappings, detect_path_issues, invalidate_intranet_zone
 )
 from .operations import (
-    safe_open, safe_copy, batch_convert, batch_copy, 
-    process_files, file_exists, replace_in_file, batch_replace_in_files,
+    safe_open, safe_copy, batch_convert, batch_convert_iter, batch_copy, 
+    process_files, iprocess_files, file_exists, replace_in_file, batch_replace_in_files,
     get_unc_path_elements, build_unc_path, is_path_accessible, find_accessible_path
 )
 
 # Determine if we're running on Windows
 IS_WINDOWS = os.name == 'nt'
 
-# Import Windows-specific modules if on Windows
-if IS_WINDOWS:
-    try:
-        from .windows import fix_security_zone, add_to_intranet_zone
-    except ImportError as e:
-        logger.warning(f"Windows-specific modules could not be imported: {e}")
-else:
+# Windows-specific functions are imported on first use (see __getattr__), so
+# importing the package does not load the Windows modules or pywin32
+_LAZY_WINDOWS_FUNCTIONS = ('fix_security_zone', 'add_to_intranet_zone')
+
+# Subpackages loaded on first attribute access
+_LAZY_SUBMODULES = ('utils', 'windows')
+
+def __getattr__(name):
+    """Import subpackages and Windows-specific functions on first access."""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    
+    if IS_WINDOWS and name in _LAZY_WINDOWS_FUNCTIONS:
+        try:
+            from . import windows
+        except ImportError as e:
+            logger.warning(f"Windows-specific modules could not be imported: {e}")
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
+        
+        value = getattr(windows, name)
+        globals()[name] = value
+        return value
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    """List the package's attributes, including those imported on first access."""
+    return sorted(set(globals()) | set(_LAZY_WINDOWS_FUNCTIONS) | set(_LAZY_SUBMODULES))
+
+if not IS_WINDOWS:
     # Define stub functions for non-Windows platforms
     def fix_security_zone(server_name):
         """Stub function for non-Windows platforms."""
@@ -98,3 +124,17 @@ def configure_logging(level=logging.INFO, handler=None):
 def get_version():
     """Return the package version."""
     return __version__
+
+# Public names; the subpackages are left out so that a star import does not
+# load them
+__all__ = [
+    'convert_to_local', 'convert_to_unc', 'convert_to_local_str', 'convert_to_unc_str',
+    'normalize_path', 'normalize_path_cached', 'invalidate_mappings',
+    'is_unc_path', 'is_network_drive', 'is_subst_drive',
+    'get_path_type', 'get_network_mappings', 'detect_path_issues', 'invalidate_intranet_zone',
+    'safe_open', 'safe_copy', 'batch_convert', 'batch_convert_iter', 'batch_copy',
+    'process_files', 'iprocess_files', 'file_exists', 'replace_in_file', 'batch_replace_in_files',
+    'get_unc_path_elements', 'build_unc_path', 'is_path_accessible', 'find_accessible_path',
+    'fix_security_zone', 'add_to_intranet_zone',
+    'configure_logging', 'get_version'
+]
@@ -7,9 +7,13 @@ local drive paths, as well as normalization and validation functions.
 
 import os
 import re
+import ntpath
+import string
+import time
 import logging
+import functools
 import subprocess
-from pathlib import Path
+from pathlib import Path, PureWindowsPath
 from typing import Dict, Union, Optional, Tuple
 
 # Set up module-level logger
@@ -18,8 +22,9 @@ logger = logging.getLogger(__name__)
 # Define if we're running on Windows
 IS_WINDOWS = os.name == 'nt'
 
-# Global flag for win32net availability
+# Global flags for win32net and win32wnet availability
 HAVE_WIN32NET = False
+HAVE_WIN32WNET = False
 
 # Only try to import Windows-specific modules if we're on Windows
 if IS_WINDOWS:
@@ -33,10 +38,56 @@ if IS_WINDOWS:
         except ImportError:
             # This should rarely happen since we checked for availability
             logger.debug("win32net module found but failed to import.")
+    
+    if is_module_available('win32wnet'):
+        try:
+            import win32wnet
+            HAVE_WIN32WNET = True
+        except ImportError:
+            logger.debug("win32wnet module found but failed to import.")
 
 # Define constants
 UNC_PATTERN = re.compile(r'^\\\\([^\\]+)\\([^\\]+)(?:\\(.*))?$')
 DRIVE_LETTER_PATTERN = re.compile(r'^([A-Za-z]:)(?:\\(.*))?$')
+_DRIVE_LETTERS = frozenset(string.ascii_letters)
+
+# Seconds for which refreshed mappings are reused before querying the system again
+MAPPINGS_TTL = 5.0
+
+# WNetOpenEnum scope and type for connected disk resources (from win32netcon)
+_RESOURCE_CONNECTED = 0x1
+_RESOURCETYPE_DISK = 0x1
+
+def _to_backslashes(path: Union[str, Path]) -> str:
+    """
+    Convert a path to a string with backslash separators.
+    
+    A single-character str.replace is much faster than str.translate and
+    returns the string unchanged when there is nothing to replace.
+    """
+    return str(path).replace('/', '\\')
+
+def _has_drive_letter(path_str: str) -> bool:
+    """Check whether a path string starts with a drive letter such as 'Z:'."""
+    return path_str[1:2] == ':' and path_str[:1] in _DRIVE_LETTERS
+
+def _path_str(path_str: str) -> str:
+    r"""
+    Get the string form of Path(path_str), as the Path-returning conversions give.
+    
+    On Windows, Path drops trailing separators, '.' components and repeated
+    separators, and completes a UNC share root with a trailing separator; a
+    Path is only built for strings that may need one of these changes, so
+    already normalized paths are returned as they are.
+    """
+    if not IS_WINDOWS:
+        return path_str or '.'
+    if (path_str.endswith(('\\', '\\.')) or '\\.\\' in path_str
+            or path_str.find('\\\\', 1) != -1 or path_str[:1] == '.' or path_str[2:3] == '.'
+            or not path_str
+            or (path_str[:2] == '\\\\' and path_str.count('\\', 2) < 2)):
+        return str(PureWindowsPath(path_str))
+    return path_str
 
 class UNCConverter:
     r"""
@@ -47,16 +98,20 @@ class UNCConverter:
     network mappings.
     """
     
-    def __init__(self, refresh_on_init=True):
+    def __init__(self, refresh_on_init=True, ttl: float = MAPPINGS_TTL):
         """
         Initialize the UNC converter.
         
         Args:
             refresh_on_init: Whether to refresh network mappings on initialization.
                              Default is True.
+            ttl: Seconds for which refreshed mappings are reused by
+                 refresh_mappings(). Default is MAPPINGS_TTL.
         """
         self._mapping: Dict[str, str] = {}  # UNC prefix -> drive letter
         self._reverse_mapping: Dict[str, str] = {}  # drive letter -> UNC prefix
+        self._ttl = ttl
+        self._last_refresh: Optional[float] = None
         
         # Windows network share command is only available on Windows
         self._is_windows = IS_WINDOWS
@@ -64,30 +119,38 @@ class UNCConverter:
         if refresh_on_init:
             self.refresh_mappings()
     
-    def refresh_mappings(self) -> Dict[str, str]:
+    def refresh_mappings(self, force: bool = False) -> Dict[str, str]:
         """
         Refresh the mapping of UNC paths to drive letters by querying the system.
         
+        Mappings refreshed less than the converter's TTL ago are returned
+        without querying the system again.
+        
+        Args:
+            force: If True, query the system even if the mappings are fresh.
+        
         Returns:
             A dictionary mapping UNC prefixes to drive letters.
         """
         if not self._is_windows:
             logger.debug("Not running on Windows, no network mappings to refresh")
             return {}
+        
+        now = time.monotonic()
+        if not force and self._last_refresh is not None and now - self._last_refresh < self._ttl:
+            return self._mapping
             
         old_mapping = self._mapping.copy()
         self._mapping.clear()
         self._reverse_mapping.clear()
         
-        # Try to use win32net if available
-        if HAVE_WIN32NET:
+        # Prefer the structured WNet enumeration, then win32net, then 'net use'
+        success = HAVE_WIN32WNET and self._get_mappings_with_wnet()
+        if not success and HAVE_WIN32NET:
             success = self._get_mappings_with_win32net()
-            if not success:
-                # Fall back to subprocess
-                self._get_mappings_with_subprocess()
-        else:
-            # Use subprocess method
+        if not success:
             self._get_mappings_with_subprocess()
+        self._last_refresh = now
         
         # Check if mappings changed
         if self._mapping != old_mapping:
@@ -95,6 +158,41 @@ class UNCConverter:
             
         return self._mapping
     
+    def _get_mappings_with_wnet(self) -> bool:
+        """
+        Get network mappings by enumerating connected disk resources with win32wnet.
+        
+        This method populates the internal mapping dictionaries.
+        
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            # Import here to ensure it's only imported when needed
+            import win32wnet
+            
+            handle = win32wnet.WNetOpenEnum(_RESOURCE_CONNECTED, _RESOURCETYPE_DISK, 0, None)
+            try:
+                while True:
+                    resources = win32wnet.WNetEnumResource(handle, 0)
+                    if not resources:
+                        break
+                    for resource in resources:
+                        local = (resource.lpLocalName or '').upper().rstrip('\\')
+                        remote = (resource.lpRemoteName or '').lower().rstrip('\\')
+                        
+                        if local and remote:
+                            self._mapping[remote] = local + '\\'
+                            self._reverse_mapping[local] = remote
+            finally:
+                win32wnet.WNetCloseEnum(handle)
+            
+            logger.debug(f"Retrieved {len(self._mapping)} network mappings using win32wnet")
+            return True
+        except Exception as e:
+            logger.warning(f"Error enumerating network connections with win32wnet: {e}")
+            return False
+    
     def _get_mappings_with_win32net(self) -> bool:
         """
         Get network mappings using the win32net API.
@@ -176,29 +274,50 @@ class UNCConverter:
             Path: The converted path using a drive letter if a mapping exists, 
                   otherwise the original path.
         """
-        path_str = str(path).replace('/', '\\')
+        return Path(self.convert_to_local_str(path))
+    
+    def convert_to_local_str(self, path: Union[str, Path]) -> str:
+        """
+        Convert a UNC path to its corresponding local drive path string if possible.
+        
+        Same as convert_to_local, but returns the string form without building
+        a Path, for callers that only need the string.
+        
+        Args:
+            path: The path to convert, potentially a UNC path.
+            
+        Returns:
+            The converted path using a drive letter if a mapping exists,
+            otherwise the original path, with backslash separators and normalized
+            as Path would normalize it.
+        """
+        path_str = _to_backslashes(path)
         
         # If the path already has a drive letter, return it unchanged
-        if re.match(r'^[A-Za-z]:', path_str):
-            return Path(path_str)
+        if _has_drive_letter(path_str):
+            return _path_str(path_str)
         
         # Check if it's a UNC path (starts with \\)
         if not path_str.startswith('\\\\'):
-            return Path(path_str)
+            return _path_str(path_str)
         
-        # Try to match the UNC path with known mappings
-        # Sort keys by length in descending order to match the most specific first
-        for unc_prefix in sorted(self._mapping.keys(), key=len, reverse=True):
-            if path_str.lower().startswith(unc_prefix.lower()):
+        # Mapping keys are lowercase UNC prefixes, so look up the path's own
+        # prefixes directly, longest first, to match the most specific mapping
+        path_lower = path_str.lower()
+        end = len(path_lower)
+        while end > 2:
+            drive_letter = self._mapping.get(path_lower[:end])
+            if drive_letter is not None:
                 # Replace the UNC prefix with the drive letter
-                local_part = path_str[len(unc_prefix):]
-                drive_path = f"{self._mapping[unc_prefix]}{local_part.lstrip(chr(92))}"
+                local_part = path_str[end:]
+                drive_path = f"{drive_letter}{local_part.lstrip(chr(92))}"
                 logger.debug(f"Converted UNC path '{path_str}' to local path '{drive_path}'")
-                return Path(drive_path)
+                return _path_str(drive_path)
+            end = path_lower.rfind('\\', 0, end)
         
         # No matching mapping found, return the original path
         logger.debug(f"No drive mapping found for UNC path '{path_str}'")
-        return Path(path_str)
+        return _path_str(path_str)
     
     def convert_to_unc(self, path: Union[str, Path]) -> Path:
         """
@@ -211,32 +330,42 @@ class UNCConverter:
             Path: The converted UNC path if the drive is mapped to a network share,
                   otherwise the original path.
         """
-        path_str = str(path).replace('/', '\\')
+        return Path(self.convert_to_unc_str(path))
+    
+    def convert_to_unc_str(self, path: Union[str, Path]) -> str:
+        """
+        Convert a local drive path to its corresponding UNC path string if possible.
         
-        # Check if the path starts with a drive letter
-        match = re.match(r'^([A-Za-z]:[\\]?)', path_str, re.IGNORECASE)
-        if not match:
-            # Not a drive path, return unchanged
-            return Path(path_str)
+        Same as convert_to_unc, but returns the string form without building
+        a Path, for callers that only need the string.
         
-        drive = match.group(1).upper()
-        if not drive.endswith('\\'):
-            drive += '\\'
+        Args:
+            path: The path to convert, potentially using a mapped drive.
+            
+        Returns:
+            The converted UNC path if the drive is mapped to a network share,
+            otherwise the original path, with backslash separators and normalized
+            as Path would normalize it.
+        """
+        path_str = _to_backslashes(path)
         
-        drive_no_slash = drive.rstrip('\\')
+        # Check if the path starts with a drive letter
+        if not _has_drive_letter(path_str):
+            # Not a drive path, return unchanged
+            return _path_str(path_str)
         
         # Check if the drive is in our mapping
-        if drive_no_slash in self._reverse_mapping:
-            unc_prefix = self._reverse_mapping[drive_no_slash]
+        unc_prefix = self._reverse_mapping.get(path_str[:2].upper())
+        if unc_prefix is not None:
             # Replace the drive with the UNC path
-            rest_of_path = path_str[len(drive_no_slash):].lstrip(chr(92))
+            rest_of_path = path_str[2:].lstrip(chr(92))
             unc_path = f"{unc_prefix}{chr(92)}{rest_of_path}"
             logger.debug(f"Converted local path '{path_str}' to UNC path '{unc_path}'")
-            return Path(unc_path)
+            return _path_str(unc_path)
         
         # No matching mapping found, return the original path
         logger.debug(f"No UNC mapping found for local path '{path_str}'")
-        return Path(path_str)
+        return _path_str(path_str)
     
     def get_mappings(self) -> Dict[str, str]:
         """
@@ -245,7 +374,7 @@ class UNCConverter:
         Returns:
             A dictionary mapping UNC paths to drive letters.
         """
-        return self._mapping.copy()
+        return dict(self._mapping)
     
     def get_reverse_mappings(self) -> Dict[str, str]:
         """
@@ -254,7 +383,7 @@ class UNCConverter:
         Returns:
             A dictionary mapping drive letters to UNC paths.
         """
-        return self._reverse_mapping.copy()
+        return dict(self._reverse_mapping)
 
 # Create a global instance for convenience
 _global_converter = None
@@ -299,15 +428,49 @@ def convert_to_unc(path: Union[str, Path]) -> Path:
     converter = _get_global_converter()
     return converter.convert_to_unc(path)
 
-def refresh_mappings() -> Dict[str, str]:
+def convert_to_local_str(path: Union[str, Path]) -> str:
+    """
+    Convert a UNC path to its corresponding local drive path string if possible.
+    
+    Args:
+        path: The path to convert, potentially a UNC path.
+        
+    Returns:
+        The converted path using a drive letter if a mapping exists,
+        otherwise the original path, with backslash separators.
+    """
+    converter = _get_global_converter()
+    return converter.convert_to_local_str(path)
+
+def convert_to_unc_str(path: Union[str, Path]) -> str:
+    """
+    Convert a local drive path to its corresponding UNC path string if possible.
+    
+    Args:
+        path: The path to convert, potentially using a mapped drive.
+        
+    Returns:
+        The converted UNC path if the drive is mapped to a network share,
+        otherwise the original path, with backslash separators.
+    """
+    converter = _get_global_converter()
+    return converter.convert_to_unc_str(path)
+
+def refresh_mappings(force: bool = False) -> Dict[str, str]:
     """
     Refresh the global mapping of UNC paths to drive letters.
     
+    Args:
+        force: If True, query the system even if the mappings were refreshed
+               less than MAPPINGS_TTL seconds ago.
+    
     Returns:
         A dictionary mapping UNC paths to drive letters.
     """
     converter = _get_global_converter()
-    return converter.refresh_mappings()
+    mappings = converter.refresh_mappings(force=force)
+    normalize_path_cached.cache_clear()
+    return mappings
 
 def get_mappings() -> Dict[str, str]:
     """
@@ -319,6 +482,18 @@ def get_mappings() -> Dict[str, str]:
     converter = _get_global_converter()
     return converter.get_mappings()
 
+def invalidate_mappings() -> None:
+    """
+    Discard the cached global UNC path to drive letter mappings.
+    
+    The global converter queries the system once and reuses the result for
+    every conversion. Call this after mapping or unmapping a drive (e.g. with
+    ``net use``) so the next conversion picks up the change.
+    """
+    global _global_converter
+    _global_converter = None
+    normalize_path_cached.cache_clear()
+
 def normalize_path(path: Union[str, Path], prefer_unc: bool = False) -> Path:
     """
     Normalize a path by ensuring consistent format and optionally converting between UNC and local.
@@ -331,17 +506,25 @@ def normalize_path(path: Union[str, Path], prefer_unc: bool = False) -> Path:
     Returns:
         The normalized path.
     """
-    path_obj = Path(str(path).replace('/', '\\'))
+    path_obj = Path(_to_backslashes(path))
     
     if prefer_unc:
         return convert_to_unc(path_obj)
     else:
         return convert_to_local(path_obj)
 
+# Memoized normalize_path for callers that normalize the same paths repeatedly.
+# Results reflect the global mappings at the time of the first call; the cache
+# is cleared by refresh_mappings() and invalidate_mappings().
+normalize_path_cached = functools.lru_cache(maxsize=1024)(normalize_path)
+
+@functools.lru_cache(maxsize=2048)
 def parse_unc_path(path: Union[str, Path]) -> Optional[Tuple[str, str, str]]:
     """
     Parse a UNC path into server, share, and path components.
     
+    Results are cached, as the same paths tend to be parsed repeatedly.
+    
     Args:
         path: The UNC path to parse.
         
@@ -349,16 +532,22 @@ def parse_unc_path(path: Union[str, Path]) -> Optional[Tuple[str, str, str]]:
         A tuple of (server, share, path) if the path is a valid UNC path,
         or None if the path is not a UNC path.
     """
-    path_str = str(path).replace('/', '\\')
-    match = UNC_PATTERN.match(path_str)
+    path_str = str(path)
+    if len(path_str) < 2 or path_str[0] not in '\\/' or path_str[1] not in '\\/':
+        return None
     
-    if match:
-        server = match.group(1)
-        share = match.group(2)
-        rest = match.group(3) or ""
-        return (server, share, rest)
+    drive, rest = ntpath.splitdrive(_to_backslashes(path_str))
+    server, _, share = drive[2:].partition('\\')
+    # Device paths (\\?\UNC\...) put more than server\share in the drive
+    share, sep, extra = share.partition('\\')
+    if not server or not share:
+        return None
     
-    return None
+    if sep:
+        rest = extra + rest
+    elif rest:
+        rest = rest[1:]
+    return (server, share, rest)
 
 def join_unc_path(server: str, share: str, rest: str = "") -> str:
     """
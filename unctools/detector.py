@@ -7,13 +7,15 @@ including UNC paths, network drives, and substituted (subst) drives.
 
 import os
 import re
+import time
 import logging
+import functools
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Union, Any
 
 # Import from our own modules
-from .converter import get_mappings
+from .converter import get_mappings, _has_drive_letter
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
@@ -43,15 +45,41 @@ if IS_WINDOWS:
 else:
     HAVE_WIN32API = False
 
+# The registry module is only available on Windows
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
 # Cache for path type detection to avoid repeated expensive operations
 _path_type_cache = {}
 
+# Seconds to reuse the parsed 'subst' output before running it again
+SUBST_MAP_TTL = 5.0
+
+# Parsed 'subst' output as a (timestamp, {drive: target}) pair, or None
+_subst_map_cache = None
+
+# Intranet zone registry entries as a (domains, ranges) pair, or None
+_intranet_zone_cache = None
+
+# Registry keys listing the domains and address ranges assigned to security zones
+_ZONE_DOMAINS_PATH = r"Software\Microsoft\Windows\CurrentVersion\Internet Settings\ZoneMap\Domains"
+_ZONE_RANGES_PATH = r"Software\Microsoft\Windows\CurrentVersion\Internet Settings\ZoneMap\Ranges"
+
+# Two-character prefixes that start a UNC path, with either separator
+_UNC_PREFIXES = frozenset(('\\\\', '//', '\\/', '/\\'))
+_UNC_PREFIXES_BYTES = frozenset((b'\\\\', b'//', b'\\/', b'/\\'))
+
 def _clear_path_type_cache() -> None:
     """Clear the internal path type detection cache."""
-    global _path_type_cache
+    global _path_type_cache, _subst_map_cache, _intranet_zone_cache
     _path_type_cache.clear()
+    _get_path_type_cached.cache_clear()
+    _subst_map_cache = None
+    _intranet_zone_cache = None
 
-def is_unc_path(path: Union[str, Path]) -> bool:
+def is_unc_path(path: Union[str, bytes, Path]) -> bool:
     r"""
     Determine if a path is a UNC path (starts with \\server\share).
     
@@ -61,8 +89,9 @@ def is_unc_path(path: Union[str, Path]) -> bool:
     Returns:
         True if the path is a UNC path, False otherwise.
     """
-    path_str = str(path).replace('/', '\\')
-    return path_str.startswith('\\\\')
+    if isinstance(path, bytes):
+        return path[:2] in _UNC_PREFIXES_BYTES
+    return str(path)[:2] in _UNC_PREFIXES
 
 def _get_drive_type_windows(drive_letter: str) -> int:
     """
@@ -112,9 +141,8 @@ def get_drive_type(drive: Union[str, Path]) -> str:
     drive_str = str(drive)
     
     # Extract drive letter if a full path was provided
-    match = re.match(r'^([A-Za-z]:)', drive_str)
-    if match:
-        drive_letter = match.group(1)
+    if _has_drive_letter(drive_str):
+        drive_letter = drive_str[:2]
     else:
         drive_letter = drive_str
     
@@ -136,8 +164,8 @@ def get_drive_type(drive: Union[str, Path]) -> str:
     DRIVE_CDROM = 5
     DRIVE_RAMDISK = 6
     
-    # Get drive type
-    drive_type = _get_drive_type_windows(drive_letter)
+    # Query only this drive; the result is cached per drive letter below
+    drive_type = _get_drive_type_windows(cache_key)
     
     # Map drive type to string
     if drive_type == DRIVE_FIXED:
@@ -184,6 +212,34 @@ def is_network_drive(drive: Union[str, Path, None]) -> bool:
         
     return get_drive_type(drive) == PATH_TYPE_NETWORK
 
+def _load_subst_map() -> Dict[str, str]:
+    """
+    Get the current subst drives, running the 'subst' command at most once per SUBST_MAP_TTL.
+    
+    Returns:
+        A dictionary mapping drive letters (e.g. 'Y:') to their target paths.
+    """
+    global _subst_map_cache
+    
+    now = time.monotonic()
+    if _subst_map_cache is not None and now - _subst_map_cache[0] < SUBST_MAP_TTL:
+        return _subst_map_cache[1]
+    
+    subst_map = {}
+    try:
+        output = subprocess.run(['subst'], capture_output=True, text=True, check=False).stdout
+        
+        # Each line has the form "Y:\: => C:\target"
+        for line in output.splitlines():
+            drive, sep, target = line.partition(' => ')
+            if sep:
+                subst_map[drive[:2].upper()] = target.strip()
+    except Exception as e:
+        logger.warning(f"Failed to list subst drives: {e}")
+    
+    _subst_map_cache = (now, subst_map)
+    return subst_map
+
 def is_subst_drive(drive: Union[str, Path, None]) -> bool:
     """
     Determine if a drive is a substituted (subst) drive.
@@ -197,42 +253,12 @@ def is_subst_drive(drive: Union[str, Path, None]) -> bool:
     # Handle None input
     if drive is None:
         return False
-        
-    # Extract drive letter if a full path was provided
-    drive_str = str(drive)
-    match = re.match(r'^([A-Za-z]:)', drive_str)
-    if match:
-        drive_letter = match.group(1)
-    else:
-        drive_letter = drive_str
     
     # Only applicable to Windows
     if not IS_WINDOWS:
         return False
     
-    # Check cache
-    cache_key = f"subst_{drive_letter.upper()}"
-    if cache_key in _path_type_cache:
-        return _path_type_cache[cache_key]
-    
-    # Check if the drive is a subst drive
-    try:
-        # Try to get subst drives using the 'subst' command
-        output = subprocess.check_output(['subst'], text=True, stderr=subprocess.STDOUT)
-        
-        # Look for the drive letter in the output
-        drive_pattern = re.escape(drive_letter.upper().rstrip('\\')) + r'\\: => (.*)'
-        match = re.search(drive_pattern, output)
-        
-        result = match is not None
-        
-        # Cache the result
-        _path_type_cache[cache_key] = result
-        
-        return result
-    except Exception as e:
-        logger.warning(f"Failed to check if {drive_letter} is a subst drive: {e}")
-        return False
+    return str(drive)[:2].upper() in _load_subst_map()
 
 def get_subst_target(drive: Union[str, Path]) -> Optional[str]:
     """
@@ -244,37 +270,11 @@ def get_subst_target(drive: Union[str, Path]) -> Optional[str]:
     Returns:
         The target path of the subst drive, or None if the drive is not a subst drive.
     """
-    # Extract drive letter if a full path was provided
-    drive_str = str(drive)
-    match = re.match(r'^([A-Za-z]:)', drive_str)
-    if match:
-        drive_letter = match.group(1)
-    else:
-        drive_letter = drive_str
-    
     # Only applicable to Windows
     if not IS_WINDOWS:
         return None
     
-    # Check if it's a subst drive first
-    if not is_subst_drive(drive_letter):
-        return None
-    
-    try:
-        # Get subst drives using the 'subst' command
-        output = subprocess.check_output(['subst'], text=True, stderr=subprocess.STDOUT)
-        
-        # Look for the drive letter in the output
-        drive_pattern = re.escape(drive_letter.upper().rstrip('\\')) + r'\\: => (.*)'
-        match = re.search(drive_pattern, output)
-        
-        if match:
-            return match.group(1)
-        
-        return None
-    except Exception as e:
-        logger.warning(f"Failed to get subst target for {drive_letter}: {e}")
-        return None
+    return _load_subst_map().get(str(drive)[:2].upper())
 
 def get_network_target(drive: Union[str, Path, None]) -> Optional[str]:
     """
@@ -293,9 +293,8 @@ def get_network_target(drive: Union[str, Path, None]) -> Optional[str]:
         
     # Extract drive letter if a full path was provided
     drive_str = str(drive)
-    match = re.match(r'^([A-Za-z]:)', drive_str)
-    if match:
-        drive_letter = match.group(1)
+    if _has_drive_letter(drive_str):
+        drive_letter = drive_str[:2]
     else:
         drive_letter = drive_str
     
@@ -354,47 +353,52 @@ def get_path_type(path: Union[str, Path]) -> str:
         - 'ramdisk': Path on a RAM disk
         - 'unknown': Unknown or could not determine
     """
-    path_str = str(path).replace('/', '\\')
-    
-    # Check cache
-    cache_key = f"type_{path_str}"
-    if cache_key in _path_type_cache:
-        return _path_type_cache[cache_key]
+    return _get_path_type_cached(str(path).replace('/', '\\'))
+
+@functools.lru_cache(maxsize=1024)
+def _get_path_type_cached(path_str: str) -> str:
+    """
+    Determine the type of a path, caching the result.
     
+    Args:
+        path_str: The path to check, as a string with backslash separators.
+        
+    Returns:
+        The path type, as returned by get_path_type.
+    """
     # Check if it's a UNC path
     if is_unc_path(path_str):
-        result = PATH_TYPE_UNC
-    else:
-        # Extract drive letter
-        match = re.match(r'^([A-Za-z]:)', path_str)
-        if not match:
-            result = PATH_TYPE_UNKNOWN
-        else:
-            drive_letter = match.group(1)
-            result = get_drive_type(drive_letter)
+        return PATH_TYPE_UNC
     
-    # Cache the result
-    _path_type_cache[cache_key] = result
+    # Extract drive letter
+    if not _has_drive_letter(path_str):
+        return PATH_TYPE_UNKNOWN
     
-    return result
+    return get_drive_type(path_str[:2])
 
-def detect_path_issues(path: Union[str, Path]) -> List[str]:
+def detect_path_issues(path: Union[str, Path], deep_scan: bool = True) -> List[str]:
     """
     Detect potential issues with a path.
     
     Args:
         path: The path to check.
+        deep_scan: Whether to keep checking a path that exceeds MAX_PATH. When False,
+                   such paths are reported without probing drives, targets or
+                   security zones.
         
     Returns:
         A list of potential issues with the path, or an empty list if no issues were found.
     """
     issues = []
     path_str = str(path)
-    path_type = get_path_type(path_str)
     
-    # Check if the path is too long for Windows
+    # Check if the path is too long for Windows before any probing
     if IS_WINDOWS and len(path_str) > 260 and not path_str.startswith('\\\\?\\'):
         issues.append("Path exceeds Windows MAX_PATH limit (260 characters)")
+        if not deep_scan:
+            return issues
+    
+    path_type = get_path_type(path_str)
     
     # Check UNC paths
     if path_type == PATH_TYPE_UNC:
@@ -412,17 +416,15 @@ def detect_path_issues(path: Union[str, Path]) -> List[str]:
     
     # Check network drive paths
     elif path_type == PATH_TYPE_NETWORK:
-        drive_match = re.match(r'^([A-Za-z]:)', path_str)
-        if drive_match:
-            drive = drive_match.group(1)
+        if _has_drive_letter(path_str):
+            drive = path_str[:2]
             if get_network_target(drive) is None:
                 issues.append(f"Network drive {drive} has no detectable UNC target")
     
     # Check subst drive paths
     elif path_type == PATH_TYPE_SUBST:
-        drive_match = re.match(r'^([A-Za-z]:)', path_str)
-        if drive_match:
-            drive = drive_match.group(1)
+        if _has_drive_letter(path_str):
+            drive = path_str[:2]
             target = get_subst_target(drive)
             if target is None:
                 issues.append(f"Substituted drive {drive} has no detectable target")
@@ -455,77 +457,134 @@ def get_network_mappings() -> Dict[str, str]:
         logger.warning(f"Failed to get network mappings: {e}")
         return {}
 
-def is_server_in_intranet_zone(server: str) -> bool:
+def _enum_subkeys(key) -> List[str]:
     """
-    Check if a server is in the local intranet security zone.
+    List the names of a registry key's subkeys.
     
     Args:
-        server: The server name to check.
+        key: The open registry key.
         
     Returns:
-        True if the server is in the intranet zone, False otherwise.
+        The subkey names, in registry order.
     """
-    # Only applicable to Windows
-    if not IS_WINDOWS:
-        return False
+    names = []
+    i = 0
+    while True:
+        try:
+            names.append(winreg.EnumKey(key, i))
+        except OSError:
+            return names
+        i += 1
+
+def _is_intranet_domain_key(key) -> bool:
+    """
+    Check whether a ZoneMap domain key assigns the domain to the Local Intranet zone.
     
-    try:
-        import winreg
+    Args:
+        key: The open registry key of the domain.
         
-        # Check the registry key for the server in the intranet zone
-        zone_path = r"Software\Microsoft\Windows\CurrentVersion\Internet Settings\ZoneMap\Domains"
+    Returns:
+        True if the domain is in the intranet zone, False otherwise.
+    """
+    # Check if any entry exists for this domain
+    try:
+        value, _ = winreg.QueryValueEx(key, "*")
+        # Value 1 is Local Intranet zone
+        return value == 1
+    except FileNotFoundError:
+        pass
+    
+    # Check numbered subdomains
+    i = 0
+    while True:
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, zone_path + "\\" + server) as key:
-                # Check if any entry exists for this server
+            value, _ = winreg.QueryValueEx(key, str(i))
+        except FileNotFoundError:
+            return False
+        if value == 1:
+            return True
+        i += 1
+
+def _load_intranet_zone() -> Tuple[frozenset, Tuple[str, ...]]:
+    """
+    Get the registry's Local Intranet zone entries, walking the registry only once.
+    
+    Returns:
+        A tuple of (domains, ranges) where domains is a frozenset of the lowercased
+        domain names in the intranet zone and ranges holds the lowercased
+        'http' values of the intranet zone address ranges.
+    """
+    global _intranet_zone_cache
+    
+    if _intranet_zone_cache is not None:
+        return _intranet_zone_cache
+    
+    # A subkey that cannot be read (e.g. PermissionError) is skipped, so it
+    # does not hide the entries of its siblings
+    domains = set()
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, _ZONE_DOMAINS_PATH) as domains_key:
+            for name in _enum_subkeys(domains_key):
+                try:
+                    with winreg.OpenKey(domains_key, name) as key:
+                        if _is_intranet_domain_key(key):
+                            domains.add(name.lower())
+                except OSError as e:
+                    logger.debug(f"Skipping unreadable zone domain {name}: {e}")
+    except FileNotFoundError:
+        pass
+    
+    ranges = []
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, _ZONE_RANGES_PATH) as ranges_key:
+            for name in _enum_subkeys(ranges_key):
                 try:
-                    value, _ = winreg.QueryValueEx(key, "*")
-                    # Value 1 is Local Intranet zone
-                    return value == 1
+                    with winreg.OpenKey(ranges_key, name) as range_key:
+                        value, _ = winreg.QueryValueEx(range_key, ":Range")
+                        if value == 1:  # Local Intranet zone
+                            server_value, _ = winreg.QueryValueEx(range_key, "http")
+                            ranges.append(server_value.lower())
                 except FileNotFoundError:
                     pass
-                
-                # Check numbered subdomains
-                i = 0
-                while True:
-                    try:
-                        value, _ = winreg.QueryValueEx(key, str(i))
-                        if value == 1:
-                            return True
-                        i += 1
-                    except FileNotFoundError:
-                        break
-        except FileNotFoundError:
-            pass
-        
-        # Check Ranges key
-        ranges_path = r"Software\Microsoft\Windows\CurrentVersion\Internet Settings\ZoneMap\Ranges"
-        try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, ranges_path) as ranges_key:
-                # Iterate through the range entries
-                i = 0
-                while True:
-                    try:
-                        range_name = winreg.EnumKey(ranges_key, i)
-                        with winreg.OpenKey(ranges_key, range_name) as range_key:
-                            try:
-                                value, _ = winreg.QueryValueEx(range_key, ":Range")
-                                if value == 1:  # Local Intranet zone
-                                    # Check if server is in this range
-                                    try:
-                                        server_value, _ = winreg.QueryValueEx(range_key, "http")
-                                        if server.lower() in server_value.lower():
-                                            return True
-                                    except FileNotFoundError:
-                                        pass
-                            except FileNotFoundError:
-                                pass
-                        i += 1
-                    except OSError:
-                        break
-        except FileNotFoundError:
-            pass
+                except OSError as e:
+                    logger.debug(f"Skipping unreadable zone range {name}: {e}")
+    except FileNotFoundError:
+        pass
+    
+    _intranet_zone_cache = (frozenset(domains), tuple(ranges))
+    return _intranet_zone_cache
+
+def invalidate_intranet_zone() -> None:
+    """
+    Discard the cached Local Intranet zone registry entries.
+    
+    Call this after changing the ZoneMap (e.g. with add_to_intranet_zone) so
+    the next check reads the registry again.
+    """
+    global _intranet_zone_cache
+    _intranet_zone_cache = None
+
+def is_server_in_intranet_zone(server: str) -> bool:
+    """
+    Check if a server is in the local intranet security zone.
+    
+    The zone entries are read from the registry on the first call and reused
+    until invalidate_intranet_zone is called.
+    
+    Args:
+        server: The server name to check.
         
+    Returns:
+        True if the server is in the intranet zone, False otherwise.
+    """
+    # Only applicable to Windows
+    if not IS_WINDOWS or winreg is None:
         return False
+    
+    try:
+        domains, ranges = _load_intranet_zone()
+        server = server.lower()
+        return server in domains or any(server in server_value for server_value in ranges)
     except Exception as e:
         logger.warning(f"Failed to check if server {server} is in intranet zone: {e}")
-        return False
\ No newline at end of file
+        return False
@@ -8,18 +8,30 @@ batch converting paths, and copying files with automatic path conversion.
 import os
 import re
 import io
+import fnmatch
 import logging
+import functools
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Callable, TextIO, BinaryIO, Any, Tuple
+from typing import (
+    Dict, List, Optional, Union, Callable, TextIO, BinaryIO, Any, Tuple, Iterator, Iterable
+)
 
 # Import from our own modules
-from .converter import convert_to_local, convert_to_unc, normalize_path
+from .converter import (
+    convert_to_local, convert_to_unc, convert_to_local_str, convert_to_unc_str, normalize_path
+)
 from .detector import is_unc_path, get_path_type, detect_path_issues, PATH_TYPE_UNC
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
+# Matches the characters that make a glob pattern non-literal
+GLOB_MAGIC_PATTERN = re.compile(r'[*?[]')
+
+# Number of directory entries buffered per batch when scanning for files
+DEFAULT_CHUNK_SIZE = 256
+
 def safe_open(file_path: Union[str, Path], mode: str = 'r', 
              encoding: Optional[str] = None, convert_paths: bool = True, 
              **kwargs) -> Union[TextIO, BinaryIO]:
@@ -106,34 +118,42 @@ def file_exists(file_path: Union[str, Path], check_both_paths: bool = True) -> b
     
     return False
 
-def batch_convert(paths: List[Union[str, Path]], to_unc: bool = False) -> Dict[str, str]:
+def batch_convert_iter(paths: Iterable[Union[str, Path]], to_unc: bool = False) -> Iterator[Tuple[str, str]]:
     """
-    Convert a batch of paths between UNC and local formats.
+    Convert a batch of paths between UNC and local formats lazily.
     
     Args:
-        paths: List of paths to convert.
+        paths: Iterable of paths to convert.
         to_unc: If True, convert to UNC paths; if False, convert to local paths.
         
-    Returns:
-        A dictionary mapping original paths to converted paths.
+    Yields:
+        (original, converted) path string tuples, in input order.
     """
-    result = {}
+    convert = convert_to_unc_str if to_unc else convert_to_local_str
     
     for path in paths:
-        original_path = str(path)
+        original_path = os.fspath(path)
         
         try:
-            if to_unc:
-                converted_path = str(convert_to_unc(path))
-            else:
-                converted_path = str(convert_to_local(path))
-                
-            result[original_path] = converted_path
+            yield original_path, convert(original_path)
         except Exception as e:
             logger.warning(f"Failed to convert path {original_path}: {e}")
-            result[original_path] = original_path  # Keep original on failure
+            yield original_path, original_path  # Keep original on failure
+
+def batch_convert(paths: List[Union[str, Path]], to_unc: bool = False) -> Dict[str, str]:
+    """
+    Convert a batch of paths between UNC and local formats.
     
-    return result
+    Args:
+        paths: List of paths to convert.
+        to_unc: If True, convert to UNC paths; if False, convert to local paths.
+        
+    Returns:
+        A dictionary mapping original paths to converted paths.
+    """
+    # Repeated paths collapse into one result key anyway, so convert each once
+    unique_paths = dict.fromkeys(map(os.fspath, paths))
+    return dict(batch_convert_iter(unique_paths, to_unc=to_unc))
 
 def safe_copy(src: Union[str, Path], dst: Union[str, Path], 
              convert_paths: bool = True, **kwargs) -> str:
@@ -264,13 +284,13 @@ def batch_copy(src_paths: List[Union[str, Path]], dst_dir: Union[str, Path],
                 # Return empty results since we can't proceed
                 return {str(src): (False, None) for src in src_paths}
     
-    # Copy each file
+    # Copy each file, working on plain strings rather than building Path objects
     results = {}
+    dst_dir_str = os.fspath(dst_dir_path)
     
     for src in src_paths:
-        src_path = Path(src)
-        filename = src_path.name
-        dst_path = dst_dir_path / filename
+        src_path = os.fspath(src)
+        dst_path = os.path.join(dst_dir_str, os.path.basename(src_path))
         
         # Try to copy with retries
         success = False
@@ -298,32 +318,152 @@ def batch_copy(src_paths: List[Union[str, Path]], dst_dir: Union[str, Path],
         
         # Record the result for this file
         if success:
-            results[str(src)] = (True, dst_result)
+            results[src_path] = (True, dst_result)
         else:
             logger.error(f"Failed to copy {src_path} to {dst_path}: {last_error}")
-            results[str(src)] = (False, None)
+            results[src_path] = (False, None)
     
     return results
 
-def process_files(directory: Union[str, Path], callback: Callable[[Path], Any], 
-                 pattern: str = "*", recursive: bool = True, 
-                 convert_paths: bool = True) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> Callable[[str], Any]:
     """
-    Process files in a directory, handling UNC paths and network drives.
+    Compile a name-only glob pattern into a match function.
+    
+    Translated patterns are cached, so repeated scans with the same pattern
+    do not translate and compile it again.
+    
+    Args:
+        pattern: A glob pattern without path separators.
+        
+    Returns:
+        The match method of the compiled pattern, taking a normcased name.
+    """
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+def _dir_entries(file_paths: Iterable[Path]) -> Iterator[os.DirEntry]:
+    """
+    Get the os.DirEntry objects of files that were found without a directory scan.
+    
+    Each file's directory is listed to find its entry; consecutive files in
+    the same directory share one listing.
+    
+    Args:
+        file_paths: The paths of the files.
+        
+    Yields:
+        The os.DirEntry of each file that is still present, as a regular file.
+    """
+    listed_dir = None
+    entries = {}
+    for file_path in file_paths:
+        parent = os.fspath(file_path.parent)
+        if parent != listed_dir:
+            listed_dir = parent
+            try:
+                with os.scandir(parent) as it:
+                    entries = {os.path.normcase(entry.name): entry for entry in it}
+            except OSError as e:
+                logger.warning(f"Failed to scan directory {parent}: {e}")
+                entries = {}
+        entry = entries.get(os.path.normcase(file_path.name))
+        if entry is not None and entry.is_file():
+            yield entry
+
+def _scan_files(dir_path: Path, pattern: str, recursive: bool,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[os.DirEntry]:
+    """
+    Yield the files in a directory that match a glob pattern.
+    
+    Name-only patterns are matched while walking the tree with os.scandir, so the
+    file type check is answered from the directory listing and the yielded
+    DirEntry objects cache their stat() result where the platform allows it.
+    A non-recursive literal pattern (no wildcards) is checked with a single
+    stat, so a missing file costs no directory listing, and a literal directory
+    prefix is joined onto the starting directory. Other patterns containing a
+    path separator fall back to Path.glob. Files found either way are looked
+    up in their directory's listing, so every match is yielded as a DirEntry.
+    
+    Matches are buffered and handed out in batches of up to chunk_size, so a
+    directory listing is read back to back rather than interleaved with the
+    caller's per-file work, and small directories are closed before any of
+    their files are used.
+    
+    Args:
+        dir_path: The directory to scan.
+        pattern: A glob pattern to match files against.
+        recursive: Whether to scan subdirectories recursively.
+        chunk_size: Maximum number of matches buffered before they are yielded.
+        
+    Yields:
+        An os.DirEntry for each file.
+    """
+    if not recursive:
+        head, tail = os.path.split(pattern)
+        if head and not GLOB_MAGIC_PATTERN.search(head):
+            dir_path = dir_path / head
+            pattern = tail
+        if not GLOB_MAGIC_PATTERN.search(pattern):
+            candidate = dir_path / pattern
+            if candidate.is_file():
+                yield from _dir_entries((candidate,))
+            return
+    
+    if '/' in pattern or os.sep in pattern:
+        glob_pattern = f"**/{pattern}" if recursive else pattern
+        yield from _dir_entries(dir_path.glob(glob_pattern))
+        return
+    
+    match = _compile_pattern(pattern)
+    stack = [os.fspath(dir_path)]
+    
+    chunk_size = max(1, chunk_size)
+    
+    while stack:
+        current = stack.pop()
+        chunk = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.is_file() and match(os.path.normcase(entry.name)):
+                        chunk.append(entry)
+                        if len(chunk) >= chunk_size:
+                            yield from chunk
+                            chunk = []
+        except OSError as e:
+            logger.warning(f"Failed to scan directory {current}: {e}")
+        yield from chunk
+
+def iprocess_files(directory: Union[str, Path], callback: Callable[[Path], Any], 
+                  pattern: str = "*", recursive: bool = True, 
+                  convert_paths: bool = True, pass_entry: bool = False,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Process files in a directory lazily, yielding results as they are produced.
+    
+    This is the streaming form of process_files: nothing is accumulated, so
+    memory use stays flat and callers can report progress during the walk.
     
     Args:
         directory: The directory to process.
         callback: A function to call for each file. It should accept a Path object
-                 and return any value, which will be included in the results.
+                 and return any value, which will be yielded with the file path.
         pattern: A glob pattern to match files against.
         recursive: Whether to process subdirectories recursively.
         convert_paths: Whether to automatically convert between UNC and local paths.
+        pass_entry: If True, pass the callback the os.DirEntry produced by the
+                   directory scan instead of a Path. Its stat() result is cached,
+                   which saves a metadata round-trip per file on network shares.
+        chunk_size: Maximum number of files read from a directory listing before
+                   the callback is run on them.
         
-    Returns:
-        A dictionary mapping file paths to the results of the callback function.
+    Yields:
+        (file_path, result) tuples, with None as the result if the callback failed.
     """
     dir_path = Path(directory)
-    results = {}
     
     # Check if we need to try a path conversion
     if not os.path.exists(dir_path) and convert_paths:
@@ -344,25 +484,44 @@ def process_files(directory: Union[str, Path], callback: Callable[[Path], Any],
     # Make sure the directory exists
     if not os.path.exists(dir_path):
         logger.error(f"Directory not found: {dir_path}")
-        return results
+        return
     
     # Process files
-    if recursive:
-        glob_pattern = f"**/{pattern}"
-    else:
-        glob_pattern = pattern
-    
-    for file_path in dir_path.glob(glob_pattern):
-        if file_path.is_file():
-            try:
-                # Call the callback function
-                result = callback(file_path)
-                results[str(file_path)] = result
-            except Exception as e:
-                logger.error(f"Error processing file {file_path}: {e}")
-                results[str(file_path)] = None
+    for entry in _scan_files(dir_path, pattern, recursive, chunk_size):
+        file_path = os.fspath(entry)
+        try:
+            # Call the callback function
+            result = callback(entry if pass_entry else Path(file_path))
+        except Exception as e:
+            logger.error(f"Error processing file {file_path}: {e}")
+            result = None
+        yield file_path, result
+
+def process_files(directory: Union[str, Path], callback: Callable[[Path], Any], 
+                 pattern: str = "*", recursive: bool = True, 
+                 convert_paths: bool = True, pass_entry: bool = False,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Process files in a directory, handling UNC paths and network drives.
     
-    return results
+    Args:
+        directory: The directory to process.
+        callback: A function to call for each file. It should accept a Path object
+                 and return any value, which will be included in the results.
+        pattern: A glob pattern to match files against.
+        recursive: Whether to process subdirectories recursively.
+        convert_paths: Whether to automatically convert between UNC and local paths.
+        pass_entry: If True, pass the callback the os.DirEntry produced by the
+                   directory scan instead of a Path.
+        chunk_size: Maximum number of files read from a directory listing before
+                   the callback is run on them.
+        
+    Returns:
+        A dictionary mapping file paths to the results of the callback function.
+    """
+    return dict(iprocess_files(directory, callback, pattern=pattern, recursive=recursive,
+                               convert_paths=convert_paths, pass_entry=pass_entry,
+                               chunk_size=chunk_size))
 
 def replace_in_file(file_path: Union[str, Path], old_text: str, new_text: str,
                   encoding: str = 'utf-8', convert_paths: bool = True) -> bool:
@@ -9,6 +9,7 @@ import os
 import sys
 import platform
 import logging
+import functools
 import importlib.util
 from typing import Dict, Tuple, List, Optional, Union, Any
 
@@ -76,10 +77,14 @@ def get_platform_info() -> Dict[str, str]:
     
     return info
 
+@functools.lru_cache(maxsize=None)
 def is_module_available(module_name: str) -> bool:
     """
     Check if a module is available without importing it or triggering warnings.
     
+    Results are cached, as probing searches sys.path; call
+    is_module_available.cache_clear() after installing a module at runtime.
+    
     Args:
         module_name: Name of the module to check
         
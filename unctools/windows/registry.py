@@ -11,6 +11,8 @@ import re
 import logging
 from typing import Optional, Dict, List, Tuple, Any, Union
 
+from ..detector import invalidate_intranet_zone
+
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
@@ -108,6 +110,7 @@ def add_to_intranet_zone(server_name: str, for_all_users: bool = False) -> bool:
             # Set the "*" value to Local Intranet zone (1)
             winreg.SetValueEx(domain_key, "*", 0, winreg.REG_DWORD, ZONE_LOCAL_INTRANET)
             logger.info(f"Added {server_name} to Local Intranet zone successfully.")
+            invalidate_intranet_zone()
             success = True
         except Exception as e:
             logger.error(f"Failed to add {server_name} to zone: {e}")
@@ -168,6 +171,7 @@ def remove_from_zone(server_name: str, for_all_users: bool = False) -> bool:
             try:
                 winreg.DeleteKey(root_key, domain_path)
                 logger.info(f"Removed {server_name} from security zones successfully.")
+                invalidate_intranet_zone()
                 return True
             except Exception as e:
                 logger.error(f"Failed to remove {server_name} from zones: {e}")